@@ -0,0 +1,330 @@
+"""
+Benchmarks for the read, write and startup paths of sqlconnect.
+
+Each benchmark is run several times and the median is reported, as rows per second for reads and writes and as
+seconds for import time, configuration loading and connector construction. Results are written as JSON and can be
+compared against a stored baseline, failing when any benchmark regresses by more than a tolerance.
+
+Benchmarks:
+    import_time: Cumulative `python -X importtime` of `import sqlconnect`, in a fresh interpreter.
+    config_load_cold, config_load_cached: `get_connection_config` with an empty and a warm file cache.
+    connector_shared, connector_private: Constructing and closing a Sqlconnector with and without a shared engine.
+    read_<table>, read_<table>_chunked: `sql_to_df_str` of a narrow, a mixed and a wide table, whole and chunked.
+    write_<method>: `df_to_sql` of the mixed table with pandas' default inserts, 'multi' and `bulk=True`.
+
+Example Usage:
+    # Against SQLite in a temporary directory
+    python benchmarks/run.py --output results.json
+
+    # Store a baseline, then compare against it, exiting with status 1 on a regression
+    python benchmarks/run.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run.py --baseline benchmarks/baseline.json --tolerance 0.2
+
+    # Against a connection in sqlconnect.yaml, e.g. a docker-compose database
+    python benchmarks/run.py --connection Postgres --config tests/integration/inputs/postgres_sqlconnect.yaml
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+TABLE_PREFIX = "sqlconnect_bench_"
+
+CHUNKSIZE = 10_000
+
+# Rows per 'multi' insert statement, within SQLite's limit of bound parameters
+MULTI_CHUNKSIZE = 100
+
+
+def measure(function, repeat: int) -> list:
+    """Return the seconds taken by each of 'repeat' calls of a function."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def result(timings: list, unit: str, scale: float = 1.0) -> dict:
+    """Summarise timings as the median of either seconds per call or rows per second."""
+    if unit == "rows/s":
+        values = [scale / timing for timing in timings]
+        return {
+            "value": statistics.median(values),
+            "unit": unit,
+            "higher_is_better": True,
+            "runs": values,
+        }
+    values = [timing / scale for timing in timings]
+    return {
+        "value": statistics.median(values),
+        "unit": unit,
+        "higher_is_better": False,
+        "runs": values,
+    }
+
+
+def make_frames(rows: int) -> dict:
+    """Return the narrow, mixed and wide DataFrames read and written by the benchmarks."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    words = np.array(["north", "south", "east", "west", "central"])
+
+    narrow = pd.DataFrame({f"i{n}": rng.integers(0, 1_000_000, rows) for n in range(3)})
+    mixed = pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "amount": rng.random(rows) * 1000,
+            "region": words[rng.integers(0, len(words), rows)],
+            "created": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 86_400 * 365, rows), unit="s"),
+        }
+    )
+    wide = pd.concat(
+        [mixed.add_suffix(f"_{n}") for n in range(10)], axis=1
+    )  # 40 columns
+    return {"narrow": narrow, "mixed": mixed, "wide": wide}
+
+
+def bench_import_time(repeat: int) -> dict:
+    """Benchmark the cumulative import time of sqlconnect in fresh interpreters."""
+    timings = []
+    for _ in range(repeat):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import sqlconnect"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        for line in stderr.splitlines():
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) == 3 and parts[2] == "sqlconnect":
+                timings.append(int(parts[1]) / 1_000_000)
+    return result(timings, "s")
+
+
+def bench_config(config_path: Path, name: str, repeat: int, calls: int = 200) -> dict:
+    """Benchmark loading a connection configuration with an empty and a warm file cache."""
+    from sqlconnect import config
+
+    def cold():
+        for _ in range(calls):
+            config.clear_config_cache()
+            config.get_connection_config(name, config_path=str(config_path))
+
+    def cached():
+        for _ in range(calls):
+            config.get_connection_config(name, config_path=str(config_path))
+
+    results = {"config_load_cold": result(measure(cold, repeat), "s", calls)}
+    config.get_connection_config(name, config_path=str(config_path))
+    results["config_load_cached"] = result(measure(cached, repeat), "s", calls)
+    return results
+
+
+def bench_connector(config_dict: dict, repeat: int, calls: int = 50) -> dict:
+    """Benchmark constructing and closing connectors with a shared and a private engine."""
+    from sqlconnect import Sqlconnector
+
+    def construct(share_engine: bool):
+        def run():
+            for _ in range(calls):
+                Sqlconnector(
+                    "Benchmark", config_dict=config_dict, share_engine=share_engine
+                ).close()
+
+        return run
+
+    # Keep one connector open so the shared engine is reused rather than recreated
+    keep_alive = Sqlconnector("Benchmark", config_dict=config_dict)
+    try:
+        return {
+            "connector_shared": result(measure(construct(True), repeat), "s", calls),
+            "connector_private": result(measure(construct(False), repeat), "s", calls),
+        }
+    finally:
+        keep_alive.close()
+
+
+def bench_reads(connector, frames: dict, repeat: int) -> dict:
+    """Benchmark reading each table whole and in chunks."""
+    results = {}
+    for name, df in frames.items():
+        table = TABLE_PREFIX + name
+        connector.df_to_sql(df, table, if_exists="replace", index=False, bulk=True)
+        query = f"SELECT * FROM {table}"
+
+        def whole(query=query):
+            connector.sql_to_df_str(query)
+
+        def chunked(query=query):
+            for _ in connector.sql_to_df_str(query, chunksize=CHUNKSIZE):
+                pass
+
+        results[f"read_{name}"] = result(measure(whole, repeat), "rows/s", len(df))
+        results[f"read_{name}_chunked"] = result(
+            measure(chunked, repeat), "rows/s", len(df)
+        )
+    return results
+
+
+def bench_writes(connector, df, repeat: int) -> dict:
+    """Benchmark writing a table with pandas' default inserts, 'multi' and bulk loading."""
+    table = TABLE_PREFIX + "write"
+    methods = {
+        "default": {},
+        "multi": {"method": "multi", "chunksize": MULTI_CHUNKSIZE},
+        "bulk": {"bulk": True},
+    }
+    results = {}
+    for name, options in methods.items():
+
+        def write(options=options):
+            connector.df_to_sql(df, table, if_exists="replace", index=False, **options)
+
+        results[f"write_{name}"] = result(measure(write, repeat), "rows/s", len(df))
+    return results
+
+
+def drop_tables(connector) -> None:
+    import sqlalchemy
+
+    tables = [
+        name
+        for name in sqlalchemy.inspect(connector.engine).get_table_names()
+        if name.startswith(TABLE_PREFIX)
+    ]
+    for table in tables:
+        sqlalchemy.Table(table, sqlalchemy.MetaData()).drop(connector.engine)
+
+
+def metadata() -> dict:
+    import pandas as pd
+    import sqlalchemy
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "sqlalchemy": sqlalchemy.__version__,
+    }
+
+
+def run(args: argparse.Namespace, workdir: Path) -> dict:
+    import yaml
+    from sqlconnect import Sqlconnector, config
+
+    if args.connection is None:
+        name = "Benchmark"
+        config_dict = {
+            "dialect": "sqlite",
+            "dbapi": "pysqlite",
+            "database": str(workdir / "benchmark.db"),
+        }
+        config_path = workdir / "sqlconnect.yaml"
+        config_path.write_text(yaml.safe_dump({"connections": {name: config_dict}}))
+    else:
+        name = args.connection
+        config_path = Path(args.config)
+        config_dict = config.get_connection_config(name, config_path=str(config_path))
+
+    results = {"import_time": bench_import_time(args.repeat)}
+    results.update(bench_config(config_path, name, args.repeat))
+    results.update(bench_connector(config_dict, args.repeat))
+
+    frames = make_frames(args.rows)
+    connector = Sqlconnector(name, config_dict=config_dict)
+    try:
+        results.update(bench_reads(connector, frames, args.repeat))
+        results.update(bench_writes(connector, frames["mixed"], args.repeat))
+    finally:
+        drop_tables(connector)
+        connector.close()
+
+    return {
+        "metadata": {
+            **metadata(),
+            "dialect": config_dict["dialect"],
+            "rows": args.rows,
+        },
+        "results": results,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Print each result against the baseline and return the names of the benchmarks that regressed."""
+    regressions = []
+    print(f"{'benchmark':<28} {'baseline':>14} {'current':>14} {'change':>8}")
+    for name, current in results["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            print(f"{name:<28} {'-':>14} {current['value']:>14.6g} {'new':>8}")
+            continue
+        change = current["value"] / previous["value"] - 1
+        worse = -change if current["higher_is_better"] else change
+        flag = " REGRESSION" if worse > tolerance else ""
+        if flag:
+            regressions.append(name)
+        print(
+            f"{name:<28} {previous['value']:>14.6g} {current['value']:>14.6g} {change:>+8.1%}{flag}"
+        )
+    return regressions
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000, help="rows per table")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against the results in this file")
+    parser.add_argument(
+        "--save-baseline", help="write the results as the baseline to this file"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="relative slowdown counted as a regression (default 0.2)",
+    )
+    parser.add_argument(
+        "--connection", help="a connection in --config to run against instead of SQLite"
+    )
+    parser.add_argument("--config", help="the sqlconnect.yaml holding --connection")
+    args = parser.parse_args(argv)
+    if args.connection is not None and args.config is None:
+        parser.error("--connection requires --config")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = run(args, Path(workdir))
+
+    for path in (args.output, args.save_baseline):
+        if path is not None:
+            Path(path).write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.baseline is None:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"Regressed by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
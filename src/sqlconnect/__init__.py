@@ -1 +1,17 @@
 from .connector import Sqlconnector  # noqa: F401
+from .registry import dispose_all  # noqa: F401
+
+# Imported on first access, so `import sqlconnect` does not load their modules
+_LAZY_ATTRIBUTES = {
+    "AsyncSqlconnector": "async_connector",
+    "QueryBatchError": "parallel",
+    "TransferError": "transfer",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        from importlib import import_module
+
+        return getattr(import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
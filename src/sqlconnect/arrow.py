@@ -0,0 +1,314 @@
+"""
+This module provides conversion of SQLAlchemy query results into Apache Arrow record batches, used by the
+Sqlconnector class to return query results as `pyarrow.Table` and `pyarrow.RecordBatchReader` objects.
+
+Rows are fetched from the cursor one batch at a time and converted column by column into Arrow arrays, so
+the full result is never held as Python row objects and no object-dtype pandas columns are created.
+
+Functions:
+    import_pyarrow: Imports pyarrow, raising a helpful error if it is not installed.
+    column_types: Returns the Arrow type of each column of a result reported by the driver.
+    result_batches: Converts a SQLAlchemy result into an iterator of Arrow record batches.
+    fixed_schema: Returns a single schema for record batches whose column types may widen.
+
+Dependencies:
+    - pyarrow: Optional. Install with `pip install sqlconnect[arrow]`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from sqlalchemy import CursorResult
+
+DEFAULT_BATCH_SIZE = 65536
+
+# Batches read ahead by fixed_schema while waiting for columns that are NULL at first to be typed
+MAX_LOOKAHEAD_BATCHES = 16
+
+# Arrow types of the column types reported in cursor.description by each driver. Types missing here are inferred
+# from the values.
+ORACLE_TYPES = {
+    "DB_TYPE_BINARY_FLOAT": "float64",
+    "DB_TYPE_BINARY_DOUBLE": "float64",
+    "DB_TYPE_BINARY_INTEGER": "int64",
+    "DB_TYPE_VARCHAR": "string",
+    "DB_TYPE_NVARCHAR": "string",
+    "DB_TYPE_CHAR": "string",
+    "DB_TYPE_NCHAR": "string",
+    "DB_TYPE_LONG": "string",
+    "DB_TYPE_CLOB": "string",
+    "DB_TYPE_NCLOB": "string",
+    "DB_TYPE_DATE": "timestamp[us]",
+    "DB_TYPE_TIMESTAMP": "timestamp[us]",
+    "DB_TYPE_RAW": "binary",
+    "DB_TYPE_LONG_RAW": "binary",
+    "DB_TYPE_BLOB": "binary",
+    "DB_TYPE_BOOLEAN": "bool",
+}
+POSTGRES_TYPES = {  # type OIDs
+    16: "bool",
+    17: "binary",
+    20: "int64",
+    21: "int64",
+    23: "int64",
+    25: "string",
+    700: "float64",
+    701: "float64",
+    1042: "string",
+    1043: "string",
+    1082: "date32",
+    1114: "timestamp[us]",
+}
+MYSQL_TYPES = {  # pymysql FIELD_TYPE codes
+    1: "int64",
+    2: "int64",
+    3: "int64",
+    4: "float64",
+    5: "float64",
+    7: "timestamp[us]",
+    8: "int64",
+    9: "int64",
+    10: "date32",
+    12: "timestamp[us]",
+}
+
+
+def import_pyarrow():
+    """Import and return pyarrow, raising an ImportError naming the optional dependency if it is missing."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Arrow results. Install it with `pip install sqlconnect[arrow]`"
+        ) from e
+    return pyarrow
+
+
+def _alias_type(pa, alias: str):
+    return pa.type_for_alias(alias) if alias is not None else None
+
+
+def _driver_type(pa, driver: str, column: tuple):
+    """Return the Arrow type of a cursor.description entry, or None if the driver does not report a usable type."""
+    import datetime
+    import decimal
+
+    type_code, precision, scale = column[1], column[4], column[5]
+
+    def decimal_type():
+        if (
+            isinstance(precision, int)
+            and isinstance(scale, int)
+            and 0 < precision <= 38
+        ):
+            return pa.decimal128(precision, max(scale, 0))
+        return None
+
+    if isinstance(type_code, type):  # pyodbc reports the Python type of the column
+        if type_code is decimal.Decimal:
+            return decimal_type()
+        return {
+            bool: pa.bool_(),
+            int: pa.int64(),
+            float: pa.float64(),
+            str: pa.string(),
+            bytes: pa.binary(),
+            bytearray: pa.binary(),
+            datetime.datetime: pa.timestamp("us"),
+            datetime.date: pa.date32(),
+            datetime.time: pa.time64("us"),
+        }.get(type_code)
+
+    name = getattr(type_code, "name", None)
+    if isinstance(name, str) and name.startswith("DB_TYPE_"):  # oracledb
+        if name == "DB_TYPE_NUMBER":
+            if scale == 0 and isinstance(precision, int) and 0 < precision <= 18:
+                return pa.int64()
+            return decimal_type() if scale and scale > 0 else None
+        return _alias_type(pa, ORACLE_TYPES.get(name))
+
+    if driver == "psycopg2" and isinstance(type_code, int):
+        if type_code == 1700:  # numeric
+            return decimal_type()
+        if type_code == 1184:  # timestamptz, returned as aware datetimes
+            return pa.timestamp("us", tz="UTC")
+        return _alias_type(pa, POSTGRES_TYPES.get(type_code))
+
+    if driver == "pymysql" and isinstance(type_code, int):
+        if type_code in (0, 246):  # DECIMAL, NEWDECIMAL
+            return decimal_type()
+        return _alias_type(pa, MYSQL_TYPES.get(type_code))
+
+    return None
+
+
+def column_types(result: CursorResult) -> list:
+    """
+    Returns the Arrow type of each column of a result reported by the driver, or None for columns whose type it
+    does not report, e.g. every column on SQLite.
+    """
+    pa = import_pyarrow()
+
+    cursor = getattr(result, "cursor", None)
+    description = getattr(cursor, "description", None)
+    context = getattr(result, "context", None)
+    driver = getattr(getattr(context, "dialect", None), "driver", None)
+    if not description:
+        return [None] * len(result.keys())
+
+    types = []
+    for column in description:
+        try:
+            types.append(_driver_type(pa, driver, tuple(column)))
+        except (IndexError, TypeError):
+            types.append(None)
+    return types
+
+
+def _promote(pa, current, new):
+    """Return the type holding the values of both types, e.g. float64 for int64 and float64."""
+    if current is None or current == new:
+        return new
+    return (
+        pa.unify_schemas(
+            [pa.schema([("c", current)]), pa.schema([("c", new)])],
+            promote_options="permissive",
+        )
+        .field(0)
+        .type
+    )
+
+
+def _to_array(pa, values, type):
+    """Convert a column of Python values to an Arrow array of the reported type, or infer it from the values."""
+    if type is not None:
+        try:
+            return pa.array(values, type=type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  # The values do not match the reported type, e.g. an unexpected driver conversion
+    return pa.array(values)
+
+
+def result_batches(
+    result: CursorResult, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[pa.RecordBatch]:
+    """
+    Converts a SQLAlchemy result into an iterator of Arrow record batches.
+
+    Parameters
+    ----------
+    result : CursorResult
+        The result of an executed query.
+    batch_size : int, default 65536
+        The number of rows fetched from the cursor and converted per batch.
+
+    Yields
+    ------
+    pyarrow.RecordBatch
+        Record batches of at most `batch_size` rows. Columns take the type reported by the driver in
+        `cursor.description` where available. Other columns are typed from their values, promoted across batches so
+        a later batch is never converted to a narrower type than its values need: a column of whole numbers becomes
+        float64 once a fractional value is seen, and a column that is NULL at first is typed by its later values.
+        Types can therefore widen between batches; combine them with `pyarrow.concat_tables(...,
+        promote_options="permissive")` or `fixed_schema`. A result without rows yields a single empty batch so that
+        its schema is still available.
+    """
+    pa = import_pyarrow()
+
+    names = list(result.keys())
+    reported = column_types(result)
+    types = list(reported)
+    yielded = False
+
+    while True:
+        rows = result.fetchmany(batch_size)
+        if not rows:
+            break
+
+        arrays = []
+        for i, column in enumerate(zip(*rows)):
+            array = _to_array(pa, column, reported[i])
+            types[i] = _promote(pa, types[i], array.type)
+            arrays.append(array if array.type == types[i] else array.cast(types[i]))
+
+        yield pa.RecordBatch.from_arrays(arrays, names=names)
+        yielded = True
+
+    if not yielded:
+        yield pa.RecordBatch.from_arrays(
+            [pa.array([], type=type or pa.null()) for type in types], names=names
+        )
+
+
+def fixed_schema(
+    batches: Iterator[pa.RecordBatch], max_lookahead: int = MAX_LOOKAHEAD_BATCHES
+) -> tuple:
+    """
+    Returns a single schema for record batches whose column types may widen, and the batches converted to it.
+
+    Streams such as `pyarrow.RecordBatchReader` and file writers need their schema before the first batch is
+    written. Batches are read ahead until every column has a non-null type, up to 'max_lookahead' batches, and the
+    schema is the promotion of their types, so a column that is NULL at first takes the type of its later values.
+    Later batches are cast to the schema without loss of data. If a later batch needs a wider type, e.g. a
+    fractional value in a column typed as integers by its earlier values on SQLite, an ArrowInvalid error is raised
+    rather than the values being truncated; cast the column in the query to make its type explicit.
+
+    Parameters
+    ----------
+    batches : iterator of pyarrow.RecordBatch
+        The batches, e.g. from `result_batches`. At least one batch is required.
+    max_lookahead : int, default 16
+        The maximum number of batches held in memory while waiting for NULL columns to be typed.
+
+    Returns
+    -------
+    tuple of (pyarrow.Schema, iterator of pyarrow.RecordBatch)
+        The schema, and the batches converted to it.
+    """
+    pa = import_pyarrow()
+
+    buffered = []
+    for batch in batches:
+        buffered.append(batch)
+        if len(buffered) >= max_lookahead or all(
+            field.type != pa.null() for field in batch.schema
+        ):
+            break
+
+    types = [None] * buffered[0].num_columns
+    for batch in buffered:
+        types = [_promote(pa, t, field.type) for t, field in zip(types, batch.schema)]
+    schema = pa.schema(
+        [pa.field(field.name, t) for field, t in zip(buffered[0].schema, types)]
+    )
+
+    def convert(batch):
+        if batch.schema == schema:
+            return batch
+        arrays = []
+        for array, field in zip(batch.columns, schema):
+            if array.type != field.type:
+                try:
+                    array = array.cast(field.type, safe=True)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                    raise pa.ArrowInvalid(
+                        f"Column '{field.name}' changed type from {field.type} to {array.type} after the first "
+                        f"batches; cast it in the query to make its type explicit: {e}"
+                    ) from e
+            arrays.append(array)
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def converted():
+        try:
+            for batch in buffered:
+                yield convert(batch)
+            for batch in batches:
+                yield convert(batch)
+        finally:
+            if hasattr(batches, "close"):
+                batches.close()
+
+    return schema, converted()
@@ -0,0 +1,418 @@
+"""
+The AsyncSqlconnector class in this module provides asyncio equivalents of the Sqlconnector methods, built on
+SQLAlchemy's `create_async_engine`. It is configured from the same `sqlconnect.yaml` and `sqlconnect.env` files,
+connecting through the asyncio driver that corresponds to each connection's 'dbapi'.
+
+Classes:
+    AsyncSqlconnector: A class to handle SQL database connections and operations from asyncio code.
+
+Dependencies:
+    - pandas: Used for handling query results as DataFrames.
+    - sqlalchemy[asyncio]: Requires greenlet and an asyncio driver, installed with `pip install sqlconnect[async]`.
+    - sqlconnect.config: A custom module for handling configuration details.
+
+Notes:
+    The asyncio driver used for each 'dbapi' is listed in ASYNC_DBAPIS. It can be overridden per connection with
+    an 'async_dbapi' key in `sqlconnect.yaml`. A 'QueuePool' pool class is replaced by SQLAlchemy's
+    AsyncAdaptedQueuePool. Async engines are tied to an event loop and are therefore not shared between
+    connectors.
+
+Example:
+    >>> import sqlconnect as sc
+    >>>
+    >>> async def main():
+    ...     async with sc.AsyncSqlconnector("My_Database") as connection:
+    ...         df = await connection.sql_to_df("path/to/sql_query.sql")
+    ...
+    ...         async for chunk in await connection.sql_to_df_str("SELECT * FROM sales", chunksize=1000):
+    ...             print(chunk.describe())
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Union
+from sqlconnect import config, credentials, sqlfiles
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# The asyncio driver used in place of each synchronous 'dbapi'
+ASYNC_DBAPIS = {
+    "psycopg2": "asyncpg",
+    "asyncpg": "asyncpg",
+    "psycopg": "psycopg",
+    "pymysql": "aiomysql",
+    "aiomysql": "aiomysql",
+    "pysqlite": "aiosqlite",
+    "aiosqlite": "aiosqlite",
+    "oracledb": "oracledb_async",
+    "pyodbc": "aioodbc",
+    "aioodbc": "aioodbc",
+}
+
+# The asyncio pool class used in place of each configured pool class that only suits synchronous engines
+ASYNC_POOL_CLASSES = {
+    "QueuePool": "AsyncAdaptedQueuePool",
+}
+
+# Pool classes that cannot be used by an asyncio engine
+SYNC_ONLY_POOL_CLASSES = ["SingletonThreadPool"]
+
+
+def get_async_config(connection_config: dict) -> dict:
+    """
+    Returns a copy of a connection configuration with its 'dbapi' replaced by the matching asyncio driver.
+
+    Raises
+    ------
+    ValueError
+        If no asyncio driver is known for the 'dbapi' and no 'async_dbapi' is configured.
+    """
+    async_config = dict(connection_config)
+    async_dbapi = async_config.pop("async_dbapi", None) or ASYNC_DBAPIS.get(
+        connection_config["dbapi"]
+    )
+    if async_dbapi is None:
+        raise ValueError(
+            f"No asyncio driver is known for dbapi '{connection_config['dbapi']}'. "
+            "Set 'async_dbapi' in the connection configuration."
+        )
+    async_config["dbapi"] = async_dbapi
+    return async_config
+
+
+def get_async_engine_options(connection_config: dict) -> dict:
+    """
+    Returns the keyword arguments for `create_async_engine` from the 'engine' and 'pool' sections of a
+    connection configuration, replacing a 'QueuePool' pool class with its asyncio counterpart.
+
+    Raises
+    ------
+    ValueError
+        If the configuration is invalid, as for `config.get_engine_options`, or names a pool class that
+        cannot be used by an asyncio engine.
+    """
+    options = config.get_engine_options(connection_config)
+    if "poolclass" in options:
+        class_name = options["poolclass"].__name__
+        if class_name in SYNC_ONLY_POOL_CLASSES:
+            raise ValueError(
+                f"Pool class {class_name} cannot be used by an asyncio engine"
+            )
+
+        if class_name in ASYNC_POOL_CLASSES:
+            import sqlalchemy.pool
+
+            options["poolclass"] = getattr(
+                sqlalchemy.pool, ASYNC_POOL_CLASSES[class_name]
+            )
+    return options
+
+
+async def _iterate_chunks(connection, chunks) -> AsyncIterator[pd.DataFrame]:
+    """Yield the DataFrame chunks of a streamed pandas query, fetching each inside the async connection."""
+    try:
+        while True:
+            chunk = await connection.run_sync(lambda _: next(chunks, None))
+            if chunk is None:
+                break
+            yield chunk
+    finally:
+        await connection.close()
+
+
+class AsyncSqlconnector:
+    """
+    A class to handle SQL database connections and operations from asyncio code.
+
+    This class provides async equivalents of the Sqlconnector methods, using the asyncio driver
+    that corresponds to the connection's 'dbapi' (e.g. asyncpg for psycopg2, aiomysql for PyMySQL,
+    aiosqlite for SQLite and async oracledb for oracledb).
+
+    Parameters
+    ----------
+    connection_name : str
+        The name of the connection to be used. This name should correspond to an entry
+        in `sqlconnect.yaml` or dictionary.
+    config_path : str, optional
+        The file path of `sqlconnect.yaml`. If not provided, the current directory or home directory is used.
+    config_dict : dict, optional
+        A dictionary containing database connection configurations. If provided, it overrides
+        the configurations from the file specified in `config_path`.
+    credential_provider : CredentialProvider, optional
+        The provider used to resolve the `${ENV_VAR}` username and password references. Defaults to the
+        process environment followed by a cached `sqlconnect.env` file.
+
+    Attributes
+    ----------
+    connection_name : str
+        The name of the connection.
+    engine : sqlalchemy.ext.asyncio.AsyncEngine
+        The SQLAlchemy async engine object used for database connections.
+    """
+
+    def __init__(
+        self,
+        connection_name: str,
+        config_path: str = None,
+        config_dict: dict = None,
+        credential_provider: credentials.CredentialProvider = None,
+    ):
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        self.connection_name = connection_name
+
+        if config_dict is None:
+            config_dict = config.get_connection_config(
+                connection_name, config_path=config_path
+            )
+
+        async_config = get_async_config(config_dict)
+        self.__database_url = config.get_db_url(async_config, credential_provider)
+        self.engine = create_async_engine(
+            self.__database_url, **get_async_engine_options(async_config)
+        )
+
+    async def close(self) -> None:
+        """Dispose of the engine, closing its pooled connections."""
+        await self.engine.dispose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def sql_to_df(
+        self,
+        query_path: str,
+        index_col=None,
+        coerce_float=True,
+        params=None,
+        parse_dates=None,
+        chunksize=None,
+        dtype=None,
+        dtype_backend=None,
+    ) -> Union[pd.DataFrame, AsyncIterator[pd.DataFrame]]:
+        """
+        Execute a SQL query from a file and return the results in a pandas DataFrame.
+        The parameters are those of `Sqlconnector.sql_to_df`.
+
+        Returns
+        -------
+        Union[pandas.DataFrame, AsyncIterator[pandas.DataFrame]]
+            A DataFrame containing the results of the SQL query, or an async iterator yielding
+            DataFrames streamed from a server-side cursor if 'chunksize' is specified.
+
+        Raises
+        ------
+        RuntimeError
+            If the file cannot be found or if there is an error in executing the query.
+        TypeError
+            If the provided query_path is not a string
+
+        Examples
+        --------
+        >>> async for df in await connection.sql_to_df("path/to/sql_query.sql", chunksize=1000):
+        ...     print(df.describe())
+        """
+        if not isinstance(query_path, str):
+            raise TypeError("query_path must be a string")
+
+        try:
+            query = sqlfiles.sql_file_cache.load(query_path).text
+            return await self._read_sql(
+                query,
+                index_col=index_col,
+                coerce_float=coerce_float,
+                params=params,
+                parse_dates=parse_dates,
+                chunksize=chunksize,
+                dtype=dtype,
+                dtype_backend=dtype_backend,
+            )
+        except FileNotFoundError:
+            raise RuntimeError(f"File not found at: {Path(query_path).resolve()}")
+        except Exception as e:
+            raise RuntimeError(f"Error executing query: {e}")
+
+    async def sql_to_df_str(
+        self,
+        query: str,
+        index_col=None,
+        coerce_float=True,
+        params=None,
+        parse_dates=None,
+        chunksize=None,
+        dtype=None,
+        dtype_backend=None,
+    ) -> Union[pd.DataFrame, AsyncIterator[pd.DataFrame]]:
+        """
+        Execute a SQL query from a string and return the results in a pandas DataFrame.
+        The parameters are those of `Sqlconnector.sql_to_df_str`.
+
+        Returns
+        -------
+        Union[pandas.DataFrame, AsyncIterator[pandas.DataFrame]]
+            A DataFrame containing the results of the SQL query, or an async iterator yielding
+            DataFrames streamed from a server-side cursor if 'chunksize' is specified.
+
+        Raises
+        ------
+        RuntimeError
+            If there is an error in executing the query.
+        TypeError
+            If the provided query is not a string
+
+        Examples
+        --------
+        >>> df = await connection.sql_to_df_str("SELECT * FROM company.employees")
+        """
+        if not isinstance(query, str):
+            raise TypeError("query must be a string")
+
+        try:
+            return await self._read_sql(
+                query,
+                index_col=index_col,
+                coerce_float=coerce_float,
+                params=params,
+                parse_dates=parse_dates,
+                chunksize=chunksize,
+                dtype=dtype,
+                dtype_backend=dtype_backend,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Error executing query: {e}")
+
+    async def _read_sql(self, sql, chunksize=None, dtype_backend=None, **kwargs):
+        """Read a query with pandas on the sync facade of an async connection."""
+        import pandas as pd
+
+        if dtype_backend is not None:
+            kwargs["dtype_backend"] = dtype_backend
+
+        if chunksize is None:
+            async with self.engine.connect() as connection:
+                return await connection.run_sync(
+                    lambda sync_connection: pd.read_sql_query(
+                        sql, con=sync_connection, **kwargs
+                    )
+                )
+
+        def execute(sync_connection):
+            sync_connection.execution_options(yield_per=chunksize)
+            return pd.read_sql_query(
+                sql, con=sync_connection, chunksize=chunksize, **kwargs
+            )
+
+        connection = await self.engine.connect()
+        try:
+            chunks = await connection.run_sync(execute)
+        except BaseException:
+            await connection.close()
+            raise
+        return _iterate_chunks(connection, chunks)
+
+    async def execute_sql(self, sql_path: str) -> None:
+        """
+        Execute a SQL command from a file.
+
+        Parameters
+        ----------
+        sql_path : str
+            The file path of the SQL command to be executed.
+
+        Raises
+        ------
+        RuntimeError
+            If there is an error in reading the file or executing the SQL command.
+            This includes file not found errors and other general exceptions.
+        """
+        try:
+            command = sqlfiles.sql_file_cache.load(sql_path).clause
+        except FileNotFoundError:
+            raise RuntimeError(f"File not found at: {Path(sql_path).resolve()}")
+
+        try:
+            async with self.engine.begin() as connection:
+                await connection.execute(command)
+        except Exception as e:
+            raise RuntimeError(f"An error occurred: {e}")
+
+    async def execute_sql_str(self, command: str) -> None:
+        """
+        Execute a SQL command from a string.
+
+        Parameters
+        ----------
+        command : str
+            The SQL command to be executed.
+
+        Raises
+        ------
+        Exception
+            If there is an error in executing the command.
+        """
+        from sqlalchemy import text
+
+        try:
+            async with self.engine.begin() as connection:
+                await connection.execute(text(command.replace("\n", " ")))
+        except Exception as e:
+            print(f"An error occurred: {e}")
+
+    async def df_to_sql(
+        self,
+        df: pd.DataFrame,
+        name: str,
+        schema: str = None,
+        if_exists: str = "fail",
+        index: bool = True,
+        index_label=None,
+        chunksize: int = None,
+        dtype=None,
+        method=None,
+    ) -> Union[int, None]:
+        """
+        Write a pandas DataFrame to a SQL database table.
+        The parameters are those of `Sqlconnector.df_to_sql`, see the pandas documentation for more
+        details: https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.to_sql.html
+
+        Returns
+        -------
+        Union[int, None]
+            The number of rows inserted, if known, otherwise None.
+
+        Raises
+        ------
+        RuntimeError
+            If there is an error in writing to the SQL table.
+        TypeError
+            If the provided DataFrame or table name is not of the correct type.
+        """
+        import pandas as pd
+
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("df must be a pandas DataFrame")
+        if not isinstance(name, str):
+            raise TypeError("name must be a string")
+
+        try:
+            async with self.engine.begin() as connection:
+                return await connection.run_sync(
+                    lambda sync_connection: df.to_sql(
+                        name,
+                        sync_connection,
+                        schema=schema,
+                        if_exists=if_exists,
+                        index=index,
+                        index_label=index_label,
+                        chunksize=chunksize,
+                        dtype=dtype,
+                        method=method,
+                    )
+                )
+        except Exception as e:
+            raise RuntimeError(f"Error writing to SQL table: {e}")
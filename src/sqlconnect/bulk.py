@@ -0,0 +1,155 @@
+"""
+This module provides dialect-aware bulk insertion methods, used by `Sqlconnector.df_to_sql` when called with
+`bulk=True` in place of the parameterised INSERT statements issued by `pandas.DataFrame.to_sql`.
+
+Each insertion method follows the `method` callable protocol of `pandas.DataFrame.to_sql`: it is called once per
+chunk of rows, so only one chunk is buffered at a time, and it returns the number of rows inserted.
+
+Functions:
+    insert_method: Returns the fastest insertion method available for a SQLAlchemy dialect.
+
+Bulk paths:
+    - psycopg2: `COPY ... FROM STDIN` streaming each chunk as CSV from an in-memory buffer.
+    - pyodbc: `executemany` with `fast_executemany` enabled, sending each chunk as a single parameter array.
+    - oracledb: `executemany` with array binding.
+    - pymysql: `executemany`, which PyMySQL rewrites into multi-row INSERT statements.
+    - pysqlite and other drivers: `executemany` on the raw DBAPI cursor.
+
+Example Usage:
+    # Used within Sqlconnector class
+    df.to_sql(name, engine, method=insert_method(engine.dialect), chunksize=BULK_CHUNKSIZE)
+"""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, Callable, Iterable
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+    from sqlalchemy.engine import Dialect
+
+# Rows buffered per chunk when no chunksize is given
+BULK_CHUNKSIZE = 10000
+
+# Marker written for NULL values in COPY CSV data
+COPY_NULL = "\\N"
+
+# Characters that make a COPY CSV value need quoting
+CSV_SPECIAL_CHARACTERS = (",", '"', "\r", "\n")
+
+# Placeholder used for positional parameters by each DBAPI paramstyle
+PLACEHOLDERS = {
+    "qmark": "?",
+    "format": "%s",
+    "pyformat": "%s",
+}
+
+
+def _qualified_name(conn: Connection, table) -> str:
+    """Return the quoted, schema-qualified name of the SQLAlchemy table of a pandas SQLTable."""
+    return conn.dialect.identifier_preparer.format_table(table.table)
+
+
+def _column_list(conn: Connection, keys: list) -> str:
+    """Return the quoted, comma separated column names."""
+    quote = conn.dialect.identifier_preparer.quote
+    return ", ".join(quote(key) for key in keys)
+
+
+def _insert_statement(conn: Connection, table, keys: list) -> str:
+    """Return a positional INSERT statement in the paramstyle of the connection's driver."""
+    placeholder = PLACEHOLDERS.get(conn.dialect.paramstyle)
+    if placeholder is None:
+        # 'named' and 'numeric' drivers such as oracledb accept numbered positional binds
+        placeholders = ", ".join(f":{i}" for i in range(1, len(keys) + 1))
+    else:
+        placeholders = ", ".join([placeholder] * len(keys))
+
+    return (
+        f"INSERT INTO {_qualified_name(conn, table)} "
+        f"({_column_list(conn, keys)}) VALUES ({placeholders})"
+    )
+
+
+def _csv_value(value) -> str:
+    """Format a value as a COPY CSV field, writing NULL as COPY_NULL and binary values in bytea hex format."""
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\x" + bytes(value).hex()
+    text = str(value)
+    # Unquoted, a value equal to the NULL or end-of-data marker would be read as that marker
+    if text in (COPY_NULL, "\\.") or any(
+        character in text for character in CSV_SPECIAL_CHARACTERS
+    ):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _csv_buffer(rows: Iterable) -> io.StringIO:
+    """Write rows to an in-memory CSV buffer, marking NULL values with COPY_NULL."""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(",".join(_csv_value(value) for value in row) + "\r\n")
+    buffer.seek(0)
+    return buffer
+
+
+def copy_from_stdin(table, conn: Connection, keys: list, data_iter: Iterable) -> int:
+    """Insert a chunk of rows with PostgreSQL `COPY ... FROM STDIN` (psycopg2)."""
+    buffer = _csv_buffer(data_iter)
+    statement = (
+        f"COPY {_qualified_name(conn, table)} ({_column_list(conn, keys)}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+    )
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(statement, buffer)
+        return cursor.rowcount
+    finally:
+        cursor.close()
+
+
+def executemany(table, conn: Connection, keys: list, data_iter: Iterable) -> int:
+    """Insert a chunk of rows with a single `executemany` call on the raw DBAPI cursor."""
+    rows = list(data_iter)
+    cursor = conn.connection.cursor()
+    try:
+        cursor.executemany(_insert_statement(conn, table, keys), rows)
+        return len(rows)
+    finally:
+        cursor.close()
+
+
+def fast_executemany(table, conn: Connection, keys: list, data_iter: Iterable) -> int:
+    """Insert a chunk of rows with pyodbc's `fast_executemany`, sending them as one parameter array."""
+    rows = list(data_iter)
+    cursor = conn.connection.cursor()
+    try:
+        cursor.fast_executemany = True
+        cursor.executemany(_insert_statement(conn, table, keys), rows)
+        return len(rows)
+    finally:
+        cursor.close()
+
+
+def insert_method(dialect: Dialect) -> Callable:
+    """
+    Returns the fastest insertion method available for a SQLAlchemy dialect.
+
+    Parameters
+    ----------
+    dialect : Dialect
+        The dialect of the engine being written to.
+
+    Returns
+    -------
+    callable
+        An insertion method for the `method` parameter of `pandas.DataFrame.to_sql`.
+    """
+    if dialect.driver == "psycopg2":
+        return copy_from_stdin
+    if dialect.driver == "pyodbc":
+        return fast_executemany
+    return executemany
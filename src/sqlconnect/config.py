@@ -8,17 +8,21 @@ secure storage of sensitive details (e.g., usernames and passwords) through envi
 
 Functions:
     get_connection_config: Retrieves the configuration for a specified connection from a YAML file.
+    load_config_file: Parses a YAML configuration file, reusing the cached result while the file is unchanged.
+    clear_config_cache: Discards every cached configuration file.
     get_db_url: Constructs and returns a database connection string from a given configuration dictionary.
+    get_engine_options: Validates the 'engine' and 'pool' sections of a configuration dictionary and returns the
+        keyword arguments for `sqlalchemy.create_engine`.
+    get_slow_query_options: Validates the 'slow_query' section of a configuration dictionary.
 
 Used By:
     - Sqlconnector: This class in a separate module utilises the functions provided here to manage database
       connections and operations.
 
 Dependencies:
-    - os: Used for environment variable management.
     - pathlib: For file path manipulations.
     - yaml: Required for parsing YAML configuration files.
-    - dotenv: Used for loading environment variables from 'sqlconnect.env' files.
+    - sqlconnect.credentials: Resolves '${ENV_VAR}' references through a pluggable credential provider.
 
 Example Usage:
     # Used within Sqlconnector class
@@ -29,15 +33,69 @@ Notes:
     - Configuration files should define connection parameters like 'sqlalchemy_driver', 'odbc_driver',
       'server', 'database', and optionally 'username', 'password'.
     - Usernames and passwords should be referenced as environment variables in the format '${ENV_VAR}'.
-    - Attempts to load 'sqlconnect.env' files from the current directory or the user's home directory for environment
-      variables.
+    - SQLite connections do not require a 'host'; 'database' is the path of the database file.
+    - By default, environment variables are resolved from the process environment and then from a 'sqlconnect.env'
+      file in the current directory or the user's home directory. The file is parsed once and cached in memory.
+    - yaml and sqlalchemy are imported on first use rather than at import time.
+    - Parsed configuration files are cached per process and re-read only when their modification time, size or
+      inode changes.
 """
 
-import os
+from __future__ import annotations
+
+import copy
 from pathlib import Path
-import yaml
-from dotenv import load_dotenv
-from sqlalchemy import URL
+from typing import TYPE_CHECKING
+from sqlconnect import credentials
+
+if TYPE_CHECKING:
+    from sqlalchemy import URL
+
+_config_cache = {}  # absolute path -> (stat signature, parsed config)
+
+
+def load_config_file(path: Path) -> dict:
+    """
+    Parses a YAML configuration file, reusing the cached result while the file is unchanged.
+
+    The cache is keyed by the absolute path of the file and validated against its modification time, size and
+    inode, so an edited or replaced file is parsed again on next use.
+
+    Parameters
+    ----------
+    path : Path
+        The path of the YAML configuration file.
+
+    Returns
+    -------
+    dict
+        The parsed configuration. The returned object is shared with the cache and must not be modified.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    """
+    path = Path(path).absolute()
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    cached = _config_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    import yaml
+
+    # Use the libyaml parser when PyYAML was built against it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    config = yaml.load(path.read_text(encoding="utf-8"), Loader=loader)
+    _config_cache[path] = (signature, config)
+    return config
+
+
+def clear_config_cache() -> None:
+    """Discard every cached configuration file, forcing the next lookup to parse from disk."""
+    _config_cache.clear()
 
 
 def get_connection_config(connection_name: str, config_path: str = None) -> dict:
@@ -77,8 +135,8 @@ def get_connection_config(connection_name: str, config_path: str = None) -> dict
 
     Notes
     -----
-    The function uses `pathlib.Path` for path manipulations and `yaml.safe_load`
-    for reading the YAML file.
+    The function uses `pathlib.Path` for path manipulations and `load_config_file`
+    for reading the YAML file, so an unchanged file is only parsed once per process.
     """
 
     config_paths = (
@@ -93,27 +151,31 @@ def get_connection_config(connection_name: str, config_path: str = None) -> dict
     )
 
     for path in config_paths:
-        if path.exists():
-            config_text = path.read_text(encoding="utf-8")
-            config = yaml.safe_load(config_text)
-
-            connection_config = config["connections"].get(connection_name)
-            if not connection_config:
-                raise KeyError(
-                    f"Connection configuration for '{connection_name}' not found"
-                )
-
-            # Check if all required keys are present
-            required_keys = ["dialect", "dbapi", "host"]
-            missing_keys = [
-                key for key in required_keys if key not in connection_config
-            ]
-            if missing_keys:
-                raise KeyError(
-                    f"Missing required configuration keys: {', '.join(missing_keys)} for connection '{connection_name}'"
-                )
+        try:
+            config = load_config_file(path)
+        except FileNotFoundError:
+            continue
+
+        connection_config = config["connections"].get(connection_name)
+        if not connection_config:
+            raise KeyError(
+                f"Connection configuration for '{connection_name}' not found"
+            )
+
+        # Check if all required keys are present
+        required_keys = (
+            ["dialect", "dbapi"]
+            if connection_config.get("dialect") == "sqlite"
+            else ["dialect", "dbapi", "host"]
+        )
+        missing_keys = [key for key in required_keys if key not in connection_config]
+        if missing_keys:
+            raise KeyError(
+                f"Missing required configuration keys: {', '.join(missing_keys)} for connection '{connection_name}'"
+            )
 
-            return connection_config
+        # Copy so that callers cannot alter the cached configuration
+        return copy.deepcopy(connection_config)
 
     raise FileNotFoundError(
         f"Config file not found in {Path('sqlconnect.yaml').absolute()} "
@@ -121,7 +183,9 @@ def get_connection_config(connection_name: str, config_path: str = None) -> dict
     )
 
 
-def get_db_url(connection_config: dict) -> URL:
+def get_db_url(
+    connection_config: dict, credential_provider: credentials.CredentialProvider = None
+) -> URL:
     """
     Constructs and returns a database connection URL from the given configuration dictionary.
 
@@ -137,6 +201,9 @@ def get_db_url(connection_config: dict) -> URL:
         'dialect', 'dbapi', 'host' and optionally 'username', 'password', and 'options'.
         The 'username' and 'password' can be environment variable keys enclosed in
         curly braces (e.g., "${ENV_VAR}").
+    credential_provider : CredentialProvider, optional
+        The provider used to resolve the 'username' and 'password' references. Defaults to
+        `credentials.get_default_provider()`.
 
     Returns
     -------
@@ -151,14 +218,20 @@ def get_db_url(connection_config: dict) -> URL:
         user's home directory 'sqlconnect.env' file.
     """
 
+    from sqlalchemy import URL
+
     # Required
     dialect = connection_config["dialect"]
     dbapi = connection_config["dbapi"]
-    host = connection_config["host"]
+    host = (
+        connection_config.get("host")
+        if dialect == "sqlite"
+        else connection_config["host"]
+    )
 
     # Optional
     database = connection_config.get("database")
-    username, password = get_credentials(connection_config)
+    username, password = get_credentials(connection_config, credential_provider)
     query = connection_config.get("options")
 
     return URL.create(
@@ -171,16 +244,197 @@ def get_db_url(connection_config: dict) -> URL:
     )
 
 
-def load_environment_file(file_paths: list[Path]):
-    """Load environment variables from the first existing .env file in the provided list of file paths."""
-    for file_path in file_paths:
-        if file_path.exists():
-            load_dotenv(file_path)
-            return True
-    return False
+# Keyword arguments of sqlalchemy.create_engine accepted in the 'engine' section, with their expected types
+ENGINE_OPTION_TYPES = {
+    "pool_size": int,
+    "max_overflow": int,
+    "pool_recycle": int,
+    "pool_pre_ping": bool,
+    "pool_timeout": (int, float),
+    "pool_use_lifo": bool,
+    "poolclass": str,
+    "connect_args": dict,
+    "execution_options": dict,
+    "isolation_level": str,
+    "echo": bool,
+    "echo_pool": bool,
+}
+
+# Shorthand keys accepted in the 'pool' section, mapped to their sqlalchemy.create_engine keyword
+POOL_OPTION_KEYS = {
+    "size": "pool_size",
+    "max_overflow": "max_overflow",
+    "recycle": "pool_recycle",
+    "pre_ping": "pool_pre_ping",
+    "timeout": "pool_timeout",
+    "use_lifo": "pool_use_lifo",
+    "class": "poolclass",
+}
+
+# Pool classes that can be named by 'poolclass', with their lowercase aliases
+POOL_CLASSES = {
+    "queuepool": "QueuePool",
+    "queue": "QueuePool",
+    "nullpool": "NullPool",
+    "null": "NullPool",
+    "staticpool": "StaticPool",
+    "static": "StaticPool",
+    "singletonthreadpool": "SingletonThreadPool",
+    "singletonthread": "SingletonThreadPool",
+    "assertionpool": "AssertionPool",
+}
+
+# Options that only apply to pools which keep a queue of connections
+QUEUE_POOL_OPTIONS = ["pool_size", "max_overflow", "pool_timeout", "pool_use_lifo"]
+
+
+def get_engine_options(connection_config: dict) -> dict:
+    """
+    Validates the 'engine' and 'pool' sections of a connection configuration and returns them as keyword
+    arguments for `sqlalchemy.create_engine`.
+
+    The 'engine' section takes `create_engine` keywords directly (e.g. 'pool_size', 'pool_pre_ping',
+    'connect_args'). The 'pool' section takes the same pool settings without the 'pool_' prefix
+    (e.g. 'size', 'recycle', 'pre_ping', 'class'). 'poolclass' names a SQLAlchemy pool class such as
+    'QueuePool', 'NullPool' or 'StaticPool'.
+
+    Parameters
+    ----------
+    connection_config : dict
+        A dictionary containing the database connection parameters, optionally including 'engine' and
+        'pool' sections.
+
+    Returns
+    -------
+    dict
+        The keyword arguments to pass to `sqlalchemy.create_engine`. Empty if neither section is present.
+
+    Raises
+    ------
+    ValueError
+        If a section contains an unknown key, a value of the wrong type, an unknown pool class, the same
+        setting in both sections, or queue settings such as 'pool_size' alongside a pool class that does
+        not support them.
+
+    Examples
+    --------
+    >>> get_engine_options({"pool": {"size": 20, "pre_ping": True}, "engine": {"pool_recycle": 1800}})
+    {'pool_recycle': 1800, 'pool_size': 20, 'pool_pre_ping': True}
+    """
+    engine_section = connection_config.get("engine") or {}
+    pool_section = connection_config.get("pool") or {}
+    if not isinstance(engine_section, dict) or not isinstance(pool_section, dict):
+        raise ValueError(
+            "The 'engine' and 'pool' configuration sections must be mappings"
+        )
+
+    unknown_keys = [key for key in engine_section if key not in ENGINE_OPTION_TYPES]
+    unknown_keys += [
+        f"pool.{key}" for key in pool_section if key not in POOL_OPTION_KEYS
+    ]
+    if unknown_keys:
+        raise ValueError(f"Unknown engine options: {', '.join(unknown_keys)}")
+
+    options = dict(engine_section)
+    for key, value in pool_section.items():
+        option = POOL_OPTION_KEYS[key]
+        if option in options:
+            raise ValueError(
+                f"Engine option '{option}' is set in both the 'engine' and 'pool' sections"
+            )
+        options[option] = value
+
+    for option, value in options.items():
+        expected_type = ENGINE_OPTION_TYPES[option]
+        # bool is a subclass of int, so reject it explicitly for numeric options
+        if not isinstance(value, expected_type) or (
+            isinstance(value, bool) and expected_type is not bool
+        ):
+            raise ValueError(f"Engine option '{option}' has invalid value {value!r}")
+
+    if "poolclass" in options:
+        class_name = POOL_CLASSES.get(options["poolclass"].lower())
+        if class_name is None:
+            raise ValueError(f"Unknown pool class '{options['poolclass']}'")
+
+        if class_name != "QueuePool":
+            invalid_options = [key for key in QUEUE_POOL_OPTIONS if key in options]
+            if invalid_options:
+                raise ValueError(
+                    f"Engine options {', '.join(invalid_options)} are not supported by {class_name}"
+                )
+
+        import sqlalchemy.pool
+
+        options["poolclass"] = getattr(sqlalchemy.pool, class_name)
+
+    return options
 
 
-def get_credentials(connection_config: dict) -> tuple:
+# Keys accepted in the 'slow_query' section, with their expected types
+SLOW_QUERY_OPTION_TYPES = {
+    "threshold": (int, float),
+    "explain": bool,
+}
+
+
+def get_slow_query_options(connection_config: dict) -> dict | None:
+    """
+    Validates the 'slow_query' section of a connection configuration.
+
+    Parameters
+    ----------
+    connection_config : dict
+        A dictionary containing the database connection parameters, optionally including a 'slow_query' section
+        with a 'threshold' in seconds and whether to 'explain' slow queries.
+
+    Returns
+    -------
+    dict or None
+        The 'threshold' and 'explain' options, or None if the section is not present.
+
+    Raises
+    ------
+    ValueError
+        If the section is not a mapping, contains an unknown key or a value of the wrong type, or has no positive
+        'threshold'.
+
+    Examples
+    --------
+    >>> get_slow_query_options({"slow_query": {"threshold": 5}})
+    {'threshold': 5.0, 'explain': False}
+    """
+    section = connection_config.get("slow_query")
+    if section is None:
+        return None
+    if not isinstance(section, dict):
+        raise ValueError("The 'slow_query' configuration section must be a mapping")
+
+    unknown_keys = [key for key in section if key not in SLOW_QUERY_OPTION_TYPES]
+    if unknown_keys:
+        raise ValueError(f"Unknown slow_query options: {', '.join(unknown_keys)}")
+
+    for option, value in section.items():
+        expected_type = SLOW_QUERY_OPTION_TYPES[option]
+        if not isinstance(value, expected_type) or (
+            isinstance(value, bool) and expected_type is not bool
+        ):
+            raise ValueError(
+                f"slow_query option '{option}' has invalid value {value!r}"
+            )
+
+    if section.get("threshold", 0) <= 0:
+        raise ValueError("slow_query requires a positive 'threshold' in seconds")
+
+    return {
+        "threshold": float(section["threshold"]),
+        "explain": section.get("explain", False),
+    }
+
+
+def get_credentials(
+    connection_config: dict, credential_provider: credentials.CredentialProvider = None
+) -> tuple:
     """
     Retrieves credentials from environment variables based on the provided connection configuration.
     If 'username' or 'password' keys are not present in connection_config, returns None for them.
@@ -188,12 +442,14 @@ def get_credentials(connection_config: dict) -> tuple:
     Parameters
     ----------
     connection_config (dict): A dictionary possibly containing keys 'username' and 'password' with environment variable names.
+    credential_provider (CredentialProvider, optional): The provider used to resolve the environment variables.
+        Defaults to `credentials.get_default_provider()`, which reads the environment and a cached 'sqlconnect.env'.
 
     Returns
     -------
     tuple: A tuple containing the username and password, or None for each if not found.
     """
-    load_environment_file([Path("sqlconnect.env"), Path.home() / "sqlconnect.env"])
+    provider = credential_provider or credentials.get_default_provider()
 
     env_username_key = connection_config.get("username")
     env_password_key = connection_config.get("password")
@@ -202,14 +458,14 @@ def get_credentials(connection_config: dict) -> tuple:
     if env_password_key:
         env_password_key = env_password_key.strip("${}")
 
-    # Get username and password from environment variables, or default to None.
-    username = os.getenv(env_username_key) if env_username_key else None
-    password = os.getenv(env_password_key) if env_password_key else None
+    # Get username and password from the credential provider, or default to None.
+    username = provider.get(env_username_key) if env_username_key else None
+    password = provider.get(env_password_key) if env_password_key else None
 
     if (env_username_key and not username) or (env_password_key and not password):
         raise EnvironmentError(
             f"Environment variables '{env_username_key}' and/or '{env_password_key}' not "
-            f"found in {Path('sqlconnect.env').absolute()} or {Path.home() / 'sqlconnect.env'}"
+            f"found in {provider.describe()}"
         )
 
     return username, password
@@ -12,6 +12,22 @@ Dependencies:
     - sqlalchemy: Required for database connection and query execution.
     - pathlib: Utilised for handling file paths.
     - sqlconnect.config: A custom module for handling configuration details.
+    - sqlconnect.registry: A custom module for sharing engines between connectors.
+    - sqlconnect.sqlfiles: A custom module caching loaded .sql files between calls.
+    - sqlconnect.arrow: A custom module converting query results to Apache Arrow. Requires the optional pyarrow.
+    - sqlconnect.export: A custom module streaming Arrow record batches to Parquet, CSV and Arrow IPC files.
+    - sqlconnect.bulk: A custom module providing dialect-aware bulk insertion methods.
+    - sqlconnect.upsert: A custom module building dialect-specific upsert statements.
+    - sqlconnect.transfer: A custom module copying query results between connections on a reader thread.
+    - sqlconnect.parallel: A custom module running independent queries concurrently.
+    - sqlconnect.resultcache: A custom module caching query results on disk or in memory.
+    - sqlconnect.metrics: A custom module recording phase timings and pool usage of instrumented calls.
+    - sqlconnect.slowlog: A custom module logging calls exceeding a connection's slow-query threshold.
+    - sqlconnect.health: A custom module pre-opening pooled connections and replacing dead idle ones.
+    - sqlconnect.dtypes: A custom module converting query results to memory-efficient dtypes.
+    - sqlconnect.incremental: A custom module persisting watermarks and snapshots of incremental reads.
+
+    pandas and sqlalchemy are imported on first use rather than at import time, keeping `import sqlconnect` fast.
 
 Example:
     >>> import sqlconnect as sc
@@ -24,12 +40,96 @@ Example:
 
 """
 
-from typing import Union, Generator
+from __future__ import annotations
+
+import copy
+import itertools
+import logging
+import weakref
+from collections.abc import Mapping
+from contextlib import contextmanager
+from functools import partial
+from typing import TYPE_CHECKING, Iterable, Iterator, Union
 from pathlib import Path
-import pandas as pd
-import sqlalchemy
-from sqlalchemy import text
-from sqlconnect import config
+from sqlconnect import config, credentials, metrics, registry, sqlfiles
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    from sqlconnect import export, incremental, parallel, resultcache, transfer
+
+logger = logging.getLogger(__name__)
+
+# Parameter sets sent per executemany call by execute_many
+EXECUTE_MANY_BATCH_SIZE = 1000
+
+# Rows read and written per chunk by transfer
+TRANSFER_CHUNKSIZE = 50000
+
+# Chunks held in memory between the reader thread and the writer by transfer
+TRANSFER_QUEUE_SIZE = 2
+
+# The arguments of sql_to_df and sql_to_df_str that change a cached result, with their defaults
+CACHED_READ_DEFAULTS = {
+    "index_col": None,
+    "coerce_float": True,
+    "parse_dates": None,
+    "dtype": None,
+    "dtype_backend": None,
+    "optimize_memory": False,
+}
+
+
+def _set_oracle_fetch_size(connection, rows: int) -> None:
+    """Make oracledb fetch `rows` rows per round trip on cursors opened by `connection`."""
+    from sqlalchemy import event
+
+    @event.listens_for(connection, "before_cursor_execute")
+    def set_fetch_size(conn, cursor, statement, parameters, context, executemany):
+        cursor.arraysize = rows
+        cursor.prefetchrows = rows
+
+
+class _StreamedChunks:
+    """
+    An iterator over the DataFrame chunks of a streamed query, holding a dedicated connection.
+
+    The connection is released when the iterator is exhausted, when `close()` is called, when it is used as a
+    context manager and the block exits, or when it is garbage collected.
+    """
+
+    def __init__(self, chunks, connection):
+        self._chunks = chunks
+        self._connection = connection
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._connection is None:
+            raise StopIteration
+        try:
+            return next(self._chunks)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Stop streaming and release the connection."""
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            if hasattr(self._chunks, "close"):
+                self._chunks.close()
+            connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
 
 
 class Sqlconnector:
@@ -48,20 +148,60 @@ class Sqlconnector:
         The file path of `sqlconnect.yaml`. If not provided, the current directory or home directory is used.
     config_dict : dict, optional
         A dictionary containing database connection configurations. If provided, it overrides
-        the configurations from the file specified in `config_path`.
+        the configurations from the file specified in `config_path`. Connection pool and engine
+        settings are read from its optional `engine` and `pool` sections.
+    share_engine : bool, default True
+        Share a single engine, and therefore a single connection pool, with every other connector
+        built from an identical configuration. Set to False to give this connector a private engine.
+    credential_provider : CredentialProvider, optional
+        The provider used to resolve the `${ENV_VAR}` username and password references. Defaults to the
+        process environment followed by a cached `sqlconnect.env` file.
+    result_cache : ResultCache, optional
+        The cache used by `sql_to_df` and `sql_to_df_str` when called with `cache=True`, e.g. a DiskResultCache
+        or MemoryResultCache.
+    instrument : bool, default False
+        Record phase timings, row counts, approximate bytes and pool occupancy for every call, available from
+        `stats()` and passed to callbacks added with `instrumentation.add_callback`. When False, no
+        instrumentation is installed unless the connection configures a 'slow_query' section.
+    warm_connections : int, default 0
+        The number of pooled connections to open during construction, so the first queries do not wait for a
+        login. See `warm_up`.
+    health_check_interval : float, optional
+        If given, ping the idle pooled connections every this many seconds on a background thread and replace
+        those that fail, e.g. after a database failover. Connectors sharing an engine share one thread, which
+        runs at the interval of the first of them and stops once all of them have been closed.
 
     Attributes
     ----------
     connection_name : str
         The name of the connection.
+    result_cache : ResultCache or None
+        The cache used when `cache=True`.
+    instrumentation : Instrumentation or None
+        The instrumentation recording this connector's calls, if enabled.
+    slow_query_log : SlowQueryLog or None
+        The log of calls exceeding the 'slow_query' threshold of the connection, if configured.
+    health_checker : HealthChecker or None
+        The background health check of the pooled connections, if enabled.
     engine : sqlalchemy.engine.Engine
         The SQLAlchemy engine object used for database connections.
     """
 
     def __init__(
-        self, connection_name: str, config_path: str = None, config_dict: dict = None
+        self,
+        connection_name: str,
+        config_path: str = None,
+        config_dict: dict = None,
+        share_engine: bool = True,
+        credential_provider: credentials.CredentialProvider = None,
+        result_cache: resultcache.ResultCache = None,
+        instrument: bool = False,
+        warm_connections: int = 0,
+        health_check_interval: float = None,
     ):
         self.connection_name = connection_name
+        self.result_cache = result_cache
+        self._session_connection = None
 
         if config_dict is None:
             if config_path is not None:
@@ -73,9 +213,201 @@ class Sqlconnector:
                 # Instantiation with only the connection name (default config)
                 config_dict = config.get_connection_config(connection_name)
 
-        self.__database_url = config.get_db_url(config_dict)
+        self.__database_url = config.get_db_url(config_dict, credential_provider)
+        engine_options = config.get_engine_options(config_dict)
+        slow_query_options = config.get_slow_query_options(config_dict)
+
+        if share_engine:
+            self.engine, key = registry.acquire_engine(
+                self.__database_url, engine_options
+            )
+            self._finalizer = weakref.finalize(
+                self, registry.release_engine, key, self.engine
+            )
+        else:
+            import sqlalchemy
+
+            self.engine = sqlalchemy.create_engine(
+                self.__database_url, **engine_options
+            )
+            self._finalizer = weakref.finalize(self, self.engine.dispose)
+
+        self.instrumentation = None
+        if instrument or slow_query_options is not None:
+            self.instrumentation = metrics.Instrumentation(self.engine)
+            weakref.finalize(self, self.instrumentation.close)
+
+        self.slow_query_log = None
+        if slow_query_options is not None:
+            from sqlconnect import slowlog
+
+            self.slow_query_log = slowlog.SlowQueryLog(
+                self.engine, **slow_query_options
+            )
+            self.instrumentation.add_callback(self.slow_query_log)
+
+        if warm_connections:
+            self.warm_up(warm_connections)
+
+        self.health_checker = None
+        if health_check_interval is not None:
+            self.health_checker = registry.acquire_health_checker(
+                self.engine, health_check_interval
+            )
+            self._health_finalizer = weakref.finalize(
+                self, registry.release_health_checker, self.engine
+            )
+
+    def close(self) -> None:
+        """
+        Release this connector's engine.
+
+        A shared engine is disposed once every connector using it has been closed or garbage collected;
+        a private engine is disposed immediately. Calling `close()` more than once has no further effect.
+        Closing a connector yielded by `session()` has no effect; the session ends with its `with` block.
+        """
+        if self._session_connection is not None:
+            return
+        if self.health_checker is not None:
+            self._health_finalizer()
+        if self.instrumentation is not None:
+            self.instrumentation.close()
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def warm_up(self, connections: int = None) -> int:
+        """
+        Open pooled connections ahead of the first queries, so they do not wait for a login.
+
+        The connections are opened concurrently and returned to the pool as idle connections. Pools that do not
+        keep idle connections, e.g. NullPool, are not warmed.
+
+        Parameters
+        ----------
+        connections : int, optional
+            The number of connections to have open. Defaults to, and is capped at, the pool size.
+
+        Returns
+        -------
+        int
+            The number of connections checked out.
+
+        Raises
+        ------
+        TypeError
+            If 'connections' is not an integer.
+        RuntimeError
+            If a connection cannot be opened.
+
+        Examples
+        --------
+        >>> connection = sc.Sqlconnector("My_Database")
+        >>> connection.warm_up(8)
+        8
+        """
+        if connections is not None and (
+            isinstance(connections, bool) or not isinstance(connections, int)
+        ):
+            raise TypeError("connections must be an integer")
+
+        from sqlconnect import health
+
+        try:
+            return health.warm_up(self.engine, connections)
+        except Exception as e:
+            raise RuntimeError(f"Error opening connections: {e}")
+
+    @contextmanager
+    def session(self) -> Iterator[Sqlconnector]:
+        """
+        Run many operations on one connection, in one transaction committed when the block exits.
+
+        Yields a connector whose methods all run on a single connection checked out for the block, rather than
+        checking out a connection and committing per call. The work is committed once when the block exits, or
+        rolled back if it raises. Temporary tables created in the session are visible to all of its calls.
+
+        Concurrent reads (`sql_to_dfs`, `sql_to_df_partitioned`) run one query at a time on the session's
+        connection. Statements that fail inside a session are not rolled back individually; on some databases,
+        e.g. PostgreSQL, the session must then be ended. Use `transaction()` in the session to roll back a
+        group of calls on its own.
+
+        Yields
+        ------
+        Sqlconnector
+            A connector bound to the session's connection.
+
+        Raises
+        ------
+        RuntimeError
+            If called on a connector that is already in a session.
+
+        Examples
+        --------
+        >>> with connection.session() as s:
+        ...     s.execute_sql_str("CREATE TEMPORARY TABLE ids (id INTEGER)")
+        ...     s.execute_many("INSERT INTO ids VALUES (?)", [(1,), (2,)])
+        ...     df = s.sql_to_df_str("SELECT o.* FROM orders o JOIN ids ON o.id = ids.id")
+        """
+        if self._session_connection is not None:
+            raise RuntimeError(
+                "A session is already in progress; use transaction() for a nested transaction"
+            )
+
+        with self.engine.connect() as connection:
+            with connection.begin():
+                session = copy.copy(self)
+                session._session_connection = connection
+                yield session
+
+    @contextmanager
+    def transaction(self) -> Iterator[Sqlconnector]:
+        """
+        Run many operations atomically: committed together when the block exits, or rolled back if it raises.
+
+        On a connector that is not in a session, this is `session()`. Inside a session, it opens a savepoint on
+        the session's connection, so only the work in the block is rolled back if it raises and the session can
+        continue.
+
+        Yields
+        ------
+        Sqlconnector
+            A connector bound to the transaction's connection.
 
-        self.engine = sqlalchemy.create_engine(self.__database_url)
+        Examples
+        --------
+        >>> with connection.transaction() as t:
+        ...     t.execute_sql_str("UPDATE accounts SET balance = balance - 10 WHERE id = 1")
+        ...     t.execute_sql_str("UPDATE accounts SET balance = balance + 10 WHERE id = 2")
+        """
+        if self._session_connection is None:
+            with self.session() as session:
+                yield session
+        else:
+            with self._session_connection.begin_nested():
+                yield self
+
+    @contextmanager
+    def _connect(self):
+        """Yield the connection of the session, or a new connection released when the block exits."""
+        if self._session_connection is not None:
+            yield self._session_connection
+        else:
+            with self.engine.connect() as connection:
+                yield connection
+
+    @contextmanager
+    def _begin(self):
+        """Yield the connection of the session, or a new connection in a transaction committed on exit."""
+        if self._session_connection is not None:
+            yield self._session_connection
+        else:
+            with self.engine.begin() as connection:
+                yield connection
 
     def sql_to_df(
         self,
@@ -86,9 +418,14 @@ class Sqlconnector:
         parse_dates=None,
         chunksize=None,
         dtype=None,
-    ) -> Union[pd.DataFrame, Generator[pd.DataFrame, None, None]]:
+        stream_results=True,
+        dtype_backend=None,
+        cache=None,
+        optimize_memory=False,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Execute a SQL query from a file and return the results in a pandas DataFrame.
+        The file is cached after the first call and only read again when it changes.
         This method allows additional keyword arguments that are passed directly to
         pandas.read_sql_query from the pandas library https://pandas.pydata.org/docs/reference/api/pandas.read_sql_query.html
 
@@ -106,14 +443,31 @@ class Sqlconnector:
             - List of column names to parse as dates.
             - Dict of {column_name: format string} where format string is strftime compatible in case of parsing string times or is one of (D, s, ns, ms, us) in case of parsing integer timestamps.
         chunksize : int, optional
-            Return Pandas DataFrames as a generator.
+            Return Pandas DataFrames as an iterator, each holding at most 'chunksize' rows.
         dtype : Type name or dict of column -> type, optional
             Data type for data or columns. E.g. {'a': np.float64, 'b': np.int32, 'c': 'Int64'}.
+        stream_results : bool, default True
+            When 'chunksize' is specified, fetch rows from a server-side cursor on a dedicated connection so that
+            only one chunk is held in memory at a time. The connection is released when the iterator is
+            exhausted, closed or garbage collected. Set to False to let the driver buffer the whole result.
+        dtype_backend : {'numpy_nullable', 'pyarrow'}, optional
+            Back the DataFrame with nullable dtypes instead of object-dtype columns. With 'pyarrow', the result is
+            fetched as Arrow record batches, as in `sql_to_arrow`, and its columns stay Arrow arrays rather than
+            passing through Python row tuples. Requires pyarrow for 'pyarrow'.
+        cache : bool, 'refresh' or ResultCache, optional
+            Serve the result from a result cache when available, otherwise query the database and store the result.
+            True uses the connector's 'result_cache'; 'refresh' queries the database and replaces the cached
+            result; a ResultCache instance is used directly. Cannot be combined with 'chunksize'.
+        optimize_memory : bool, default False
+            Convert the result to compact dtypes: integers to the smallest type holding their values, floats to
+            float32 where no precision is lost and low-cardinality strings to categoricals. With 'chunksize', the
+            dtypes are planned from the first chunk and widened only if a later chunk does not fit. The bytes
+            saved are stored in `df.attrs["sqlconnect_memory_saved"]`.
 
         Returns
         -------
-        Union[pandas.DataFrame, Generator[pandas.DataFrame, None, None]]
-            A DataFrame containing the results of the SQL query, or a generator yielding
+        Union[pandas.DataFrame, Iterator[pandas.DataFrame]]
+            A DataFrame containing the results of the SQL query, or an iterator yielding
             DataFrames if 'chunksize' is specified.
 
         Raises
@@ -122,6 +476,8 @@ class Sqlconnector:
             If the file cannot be found or if there is an error in executing the query.
         TypeError
             If the provided query_path is not a string
+        ValueError
+            If 'cache' is combined with 'chunksize', or is True without a connector 'result_cache'.
 
         Examples
         --------
@@ -131,21 +487,29 @@ class Sqlconnector:
         if not isinstance(query_path, str):
             raise TypeError("query_path must be a string")
 
+        result_cache, refresh = self._resolve_cache(cache, chunksize)
+
         try:
-            full_path = Path(query_path).resolve()
-            query = full_path.read_text(encoding="utf-8")
-            return pd.read_sql_query(
-                sql=query,
-                con=self.engine,
-                index_col=index_col,
-                coerce_float=coerce_float,
-                params=params,
-                parse_dates=parse_dates,
-                chunksize=chunksize,
-                dtype=dtype,
-            )
+            query = sqlfiles.sql_file_cache.load(query_path).text
+            with self._measure("sql_to_df", query, params) as call:
+                df = self._read_sql(
+                    query,
+                    stream_results,
+                    index_col=index_col,
+                    coerce_float=coerce_float,
+                    params=params,
+                    parse_dates=parse_dates,
+                    chunksize=chunksize,
+                    dtype=dtype,
+                    dtype_backend=dtype_backend,
+                    result_cache=result_cache,
+                    refresh=refresh,
+                    optimize_memory=optimize_memory,
+                )
+                call.set_result(df)
+            return df
         except FileNotFoundError:
-            raise RuntimeError(f"File not found at: {full_path}")
+            raise RuntimeError(f"File not found at: {Path(query_path).resolve()}")
         except Exception as e:
             raise RuntimeError(f"Error executing query: {e}")
 
@@ -158,7 +522,11 @@ class Sqlconnector:
         parse_dates=None,
         chunksize=None,
         dtype=None,
-    ) -> Union[pd.DataFrame, Generator[pd.DataFrame, None, None]]:
+        stream_results=True,
+        dtype_backend=None,
+        cache=None,
+        optimize_memory=False,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Execute a SQL query from a string and return the results in a pandas DataFrame.
         This method allows additional keyword arguments that are passed directly to
@@ -178,14 +546,31 @@ class Sqlconnector:
             - List of column names to parse as dates.
             - Dict of {column_name: format string} where format string is strftime compatible in case of parsing string times or is one of (D, s, ns, ms, us) in case of parsing integer timestamps.
         chunksize : int, optional
-            Return Pandas DataFrames as a generator.
+            Return Pandas DataFrames as an iterator, each holding at most 'chunksize' rows.
         dtype : Type name or dict of column -> type, optional
             Data type for data or columns. E.g. {'a': np.float64, 'b': np.int32, 'c': 'Int64'}.
+        stream_results : bool, default True
+            When 'chunksize' is specified, fetch rows from a server-side cursor on a dedicated connection so that
+            only one chunk is held in memory at a time. The connection is released when the iterator is
+            exhausted, closed or garbage collected. Set to False to let the driver buffer the whole result.
+        dtype_backend : {'numpy_nullable', 'pyarrow'}, optional
+            Back the DataFrame with nullable dtypes instead of object-dtype columns. With 'pyarrow', the result is
+            fetched as Arrow record batches, as in `sql_to_arrow`, and its columns stay Arrow arrays rather than
+            passing through Python row tuples. Requires pyarrow for 'pyarrow'.
+        cache : bool, 'refresh' or ResultCache, optional
+            Serve the result from a result cache when available, otherwise query the database and store the result.
+            True uses the connector's 'result_cache'; 'refresh' queries the database and replaces the cached
+            result; a ResultCache instance is used directly. Cannot be combined with 'chunksize'.
+        optimize_memory : bool, default False
+            Convert the result to compact dtypes: integers to the smallest type holding their values, floats to
+            float32 where no precision is lost and low-cardinality strings to categoricals. With 'chunksize', the
+            dtypes are planned from the first chunk and widened only if a later chunk does not fit. The bytes
+            saved are stored in `df.attrs["sqlconnect_memory_saved"]`.
 
         Returns
         -------
-        Union[pandas.DataFrame, Generator[pandas.DataFrame, None, None]]
-            A DataFrame containing the results of the SQL query, or a generator yielding
+        Union[pandas.DataFrame, Iterator[pandas.DataFrame]]
+            A DataFrame containing the results of the SQL query, or an iterator yielding
             DataFrames if 'chunksize' is specified.
 
         Raises
@@ -194,6 +579,8 @@ class Sqlconnector:
             If there is an error in executing the query.
         TypeError
             If the provided query is not a string
+        ValueError
+            If 'cache' is combined with 'chunksize', or is True without a connector 'result_cache'.
 
         Examples
         --------
@@ -204,148 +591,1432 @@ class Sqlconnector:
         if not isinstance(query, str):
             raise TypeError("query must be a string")
 
+        result_cache, refresh = self._resolve_cache(cache, chunksize)
+
         try:
-            return pd.read_sql_query(
-                sql=query,
-                con=self.engine,
-                index_col=index_col,
-                coerce_float=coerce_float,
-                params=params,
-                parse_dates=parse_dates,
-                chunksize=chunksize,
-                dtype=dtype,
-            )
+            with self._measure("sql_to_df_str", query, params) as call:
+                df = self._read_sql(
+                    query,
+                    stream_results,
+                    index_col=index_col,
+                    coerce_float=coerce_float,
+                    params=params,
+                    parse_dates=parse_dates,
+                    chunksize=chunksize,
+                    dtype=dtype,
+                    dtype_backend=dtype_backend,
+                    result_cache=result_cache,
+                    refresh=refresh,
+                    optimize_memory=optimize_memory,
+                )
+                call.set_result(df)
+            return df
         except Exception as e:
             raise RuntimeError(f"Error executing query: {e}")
 
-    def execute_sql(self, sql_path: str) -> None:
+    def _resolve_cache(self, cache, chunksize) -> tuple:
+        """Return the result cache selected by a `cache` argument, and whether to refresh it."""
+        if cache is None or cache is False:
+            return None, False
+        if chunksize is not None:
+            raise ValueError("cache cannot be combined with chunksize")
+
+        from sqlconnect import resultcache
+
+        if isinstance(cache, resultcache.ResultCache):
+            return cache, False
+        if cache is not True and cache != "refresh":
+            raise ValueError("cache must be a bool, 'refresh' or a ResultCache")
+        if self.result_cache is None:
+            raise ValueError("cache requires the connector to have a result_cache")
+        return self.result_cache, cache == "refresh"
+
+    def _read_sql(
+        self,
+        sql,
+        stream_results: bool,
+        chunksize=None,
+        dtype_backend=None,
+        result_cache: resultcache.ResultCache = None,
+        refresh: bool = False,
+        optimize_memory: bool = False,
+        **kwargs,
+    ):
+        """Read a query with pandas, from a result cache or in streamed chunks if requested."""
+        import pandas as pd
+        from sqlconnect import dtypes
+
+        if dtype_backend is not None:
+            kwargs["dtype_backend"] = dtype_backend
+
+        if result_cache is not None:
+            key = self._cache_key(sql, optimize_memory, **kwargs)
+            df = None if refresh else result_cache.get(key)
+            if df is None:
+                if dtype_backend == "pyarrow":
+                    df = self._read_sql_arrow(sql, **kwargs)
+                else:
+                    with self._connect() as connection:
+                        df = pd.read_sql_query(sql, con=connection, **kwargs)
+                if optimize_memory:
+                    df = dtypes.optimize(df)
+                result_cache.put(key, df)
+            return df
+
+        if dtype_backend == "pyarrow":
+            return self._read_sql_arrow(
+                sql, chunksize, stream_results, optimize_memory, **kwargs
+            )
+
+        if (
+            chunksize is None
+            or not stream_results
+            or self._session_connection is not None
+        ):
+            # A session's connection is shared between calls, so it is not set up for streaming
+            result = pd.read_sql_query(
+                sql,
+                con=self._session_connection or self.engine,
+                chunksize=chunksize,
+                **kwargs,
+            )
+            if optimize_memory:
+                if chunksize is None:
+                    return dtypes.optimize(result)
+                return dtypes.optimize_chunks(result)
+            return result
+
+        connection = self.engine.connect()
+        try:
+            # Server-side cursor: named cursor on psycopg2, SSCursor on PyMySQL
+            connection.execution_options(yield_per=chunksize)
+            if self.engine.dialect.name == "oracle":
+                _set_oracle_fetch_size(connection, chunksize)
+            chunks = pd.read_sql_query(
+                sql, con=connection, chunksize=chunksize, **kwargs
+            )
+            if optimize_memory:
+                chunks = dtypes.optimize_chunks(chunks)
+        except BaseException:
+            connection.close()
+            raise
+        return _StreamedChunks(chunks, connection)
+
+    def _read_sql_arrow(
+        self,
+        sql,
+        chunksize=None,
+        stream_results: bool = False,
+        optimize_memory: bool = False,
+        params=None,
+        index_col=None,
+        coerce_float: bool = True,
+        parse_dates=None,
+        dtype=None,
+        dtype_backend=None,
+    ):
+        """Read a query into Arrow-backed DataFrames, converted from Arrow record batches rather than row tuples."""
+        import pandas as pd
+        from sqlconnect import arrow, dtypes
+
+        pa = arrow.import_pyarrow()
+
+        def to_frame(data):
+            # Apply the read_sql_query options pandas would, keeping the columns Arrow-backed
+            df = data.to_pandas(types_mapper=pd.ArrowDtype)
+            if coerce_float:
+                for field in data.schema:
+                    if pa.types.is_decimal(field.type):
+                        df[field.name] = df[field.name].astype(
+                            pd.ArrowDtype(pa.float64())
+                        )
+            date_columns = (
+                [parse_dates] if isinstance(parse_dates, str) else parse_dates
+            )
+            for name in date_columns or ():
+                date_format = (
+                    parse_dates[name] if isinstance(parse_dates, dict) else None
+                )
+                options = (
+                    date_format
+                    if isinstance(date_format, dict)
+                    else {"format": date_format}
+                )
+                df[name] = pd.to_datetime(df[name], **options).convert_dtypes(
+                    dtype_backend="pyarrow"
+                )
+            if dtype is not None:
+                df = df.astype(dtype)
+            if index_col is not None:
+                df = df.set_index(index_col)
+            return df
+
+        if chunksize is None:
+            df = to_frame(self._read_arrow(sql, params))
+            return dtypes.optimize(df) if optimize_memory else df
+
+        if stream_results and self._session_connection is None:
+            reader = self._read_arrow(sql, params, chunksize)
+        else:
+            reader = None
+            table = self._read_arrow(sql, params)
+        batches = reader if reader is not None else table.to_batches(chunksize)
+        chunks = (to_frame(batch) for batch in batches)
+        if optimize_memory:
+            chunks = dtypes.optimize_chunks(chunks)
+        # The reader holds the streaming connection until it is exhausted or closed
+        return chunks if reader is None else _StreamedChunks(chunks, reader)
+
+    def _cache_key(self, sql: str, optimize_memory: bool = False, **kwargs) -> str:
+        """Return the result cache key of a query read with the given pandas.read_sql_query arguments."""
+        from sqlconnect import resultcache
+
+        options = {"optimize_memory": True} if optimize_memory else {}
+        return resultcache.cache_key(
+            f"{self.connection_name} {self.engine.url}", sql, **kwargs, **options
+        )
+
+    def invalidate_cache(self, query: str, params=None, **read_kwargs) -> None:
         """
-        Execute a SQL command from a file.
+        Remove the cached result of a query, so that the next cached read queries the database.
+
+        The cache key is computed as by `sql_to_df` and `sql_to_df_str`, so 'params' and the other arguments
+        that change the returned DataFrame must be those of the cached read. Arguments left out take the
+        defaults of those methods.
 
         Parameters
         ----------
-        sql_path : str
-            The file path of the SQL command to be executed.
+        query : str
+            The SQL query, or the file path of a .sql file, as passed to `sql_to_df_str` or `sql_to_df`.
+        params : list, tuple or dict, optional, default: None
+            The parameters of the cached read.
+        **read_kwargs
+            Further arguments of the cached read: 'index_col', 'coerce_float', 'parse_dates', 'dtype',
+            'dtype_backend' and 'optimize_memory'. 'cache' may name a ResultCache to remove the result from;
+            by default it is removed from the connector's 'result_cache'.
 
         Raises
         ------
         RuntimeError
-            If there is an error in reading the file or executing the SQL command.
-            This includes file not found errors and other general exceptions.
+            If the file cannot be found.
+        TypeError
+            If the provided query is not a string or an argument does not change cached results.
+        ValueError
+            If no ResultCache is given and the connector has no 'result_cache'.
+
+        Examples
+        --------
+        >>> connection.invalidate_cache("monthly_revenue.sql", params={"year": 2024})
         """
-        with self.engine.connect() as connection:
-            trans = connection.begin()
+        if not isinstance(query, str):
+            raise TypeError("query must be a string")
+        cache = read_kwargs.pop("cache", True)
+        unknown = sorted(set(read_kwargs) - set(CACHED_READ_DEFAULTS))
+        if unknown:
+            raise TypeError(f"arguments that do not change cached results: {unknown}")
+
+        result_cache, _ = self._resolve_cache(cache, None)
+        if result_cache is None:
+            return
+
+        if query.lower().endswith(".sql"):
             try:
-                full_path = Path(sql_path).resolve()
-                command = full_path.read_text(encoding="utf-8")
-                command = text(command)
-                connection.execute(command)
-                trans.commit()  # Explicitly commit the transaction
+                query = sqlfiles.sql_file_cache.load(query).text
             except FileNotFoundError:
-                trans.rollback()  # Rollback in case of an error
-                raise RuntimeError(f"File not found at: {full_path}")
-            except Exception as e:
-                trans.rollback()  # Rollback in case of an error
-                raise RuntimeError(f"An error occurred: {e}")
+                raise RuntimeError(f"File not found at: {Path(query).resolve()}")
 
-    def execute_sql_str(self, command: str) -> None:
+        options = {**CACHED_READ_DEFAULTS, **read_kwargs}
+        optimize_memory = options.pop("optimize_memory")
+        if options["dtype_backend"] is None:
+            # Passed to pandas, and so part of the key, only when given
+            del options["dtype_backend"]
+        result_cache.invalidate(
+            self._cache_key(query, optimize_memory, params=params, **options)
+        )
+
+    def _measure(self, operation: str, statement: str = None, params=None):
+        """Return a context manager measuring a call, or a no-op one if instrumentation is disabled."""
+        if self.instrumentation is None:
+            return metrics.NOT_MEASURED
+        return self.instrumentation.measure(operation, statement, params)
+
+    def stats(self) -> dict:
         """
-        Execute a SQL command from a string.
+        Return a snapshot of the instrumentation totals of this connector.
+
+        Returns
+        -------
+        dict
+            The calls, errors, rows, approximate bytes and seconds spent in checkout, execution and the remainder
+            (fetching and DataFrame construction) per operation, under "operations", and the connections checked
+            out of the pool and its capacity, under "pool". Empty if the connector was created without
+            `instrument=True`.
+
+        Examples
+        --------
+        >>> connection = sc.Sqlconnector("My_Database", instrument=True)
+        >>> df = connection.sql_to_df("path/to/sql_query.sql")
+        >>> connection.stats()["operations"]["sql_to_df"]
+        {'calls': 1, 'errors': 0, 'elapsed': 2.41, 'checkout': 0.02, 'execute': 0.35, 'process': 2.04, ...}
+        """
+        return self.instrumentation.stats() if self.instrumentation is not None else {}
+
+    def cache_stats(self) -> dict:
+        """
+        Return a snapshot of the counters of this connector's result cache.
+
+        Returns
+        -------
+        dict
+            Hits, misses and evictions, plus the entries and bytes held for a MemoryResultCache. Empty if the
+            connector has no result cache.
+        """
+        return self.result_cache.stats() if self.result_cache is not None else {}
+
+    def sql_to_dfs(
+        self,
+        queries: Union[list, dict],
+        max_workers: int = None,
+        as_completed: bool = False,
+        **kwargs,
+    ) -> Union[dict, Iterator[parallel.QueryResult]]:
+        """
+        Execute many independent SQL queries concurrently and return their results as pandas DataFrames.
+
+        Queries run on a thread pool, each on its own pooled connection, so the total wall time approaches that
+        of the slowest query rather than the sum of all of them. A failing query does not cancel the others.
 
         Parameters
         ----------
-        command : str
-            The SQL command to be executed.
+        queries : list or dict
+            The queries to execute, either as a list or as a dict of {key: query}. Each query ending in '.sql' is
+            read from that file with `sql_to_df`; any other string is executed with `sql_to_df_str`. For a list,
+            each query is also its key.
+        max_workers : int, optional
+            The number of queries run at once. Defaults to the number of connections the engine's pool can hand
+            out (pool size plus overflow), capped at the number of queries.
+        as_completed : bool, default False
+            Return an iterator yielding a `QueryResult` (key, df, error, elapsed) as each query completes,
+            instead of waiting for all of them. Errors are yielded rather than raised.
+        **kwargs
+            Further keyword arguments passed to `sql_to_df` and `sql_to_df_str` for every query,
+            e.g. 'params' or 'parse_dates'.
+
+        Returns
+        -------
+        Union[dict, Iterator[QueryResult]]
+            A dict of {key: DataFrame} in the order the queries were given, or an iterator of QueryResult if
+            'as_completed' is True. The seconds each query took are stored in `df.attrs["sqlconnect_elapsed"]`.
 
         Raises
         ------
-        Exception
-            If there is an error in executing the command.
+        QueryBatchError
+            If any query fails, once every query has completed. Its 'results' and 'errors' attributes hold the
+            DataFrames of the successful queries and the exceptions of the failed ones.
+        TypeError
+            If the provided queries are not a list or dict of strings.
+
+        Examples
+        --------
+        >>> dfs = connection.sql_to_dfs(["sales.sql", "stock.sql", "SELECT COUNT(*) FROM company.employees"])
+        >>> dfs["sales.sql"].attrs["sqlconnect_elapsed"]
+        1.84
         """
-        with self.engine.connect() as connection:
-            trans = connection.begin()
-            try:
-                command = text(command.replace("\n", " "))
-                connection.execute(command)
-                trans.commit()  # Explicitly commit the transaction
-            except Exception as e:
-                trans.rollback()  # Rollback in case of an error
-                print(f"An error occurred: {e}")
+        if isinstance(queries, dict):
+            named_queries = dict(queries)
+        elif isinstance(queries, (list, tuple)):
+            named_queries = {query: query for query in queries}
+        else:
+            raise TypeError("queries must be a list or dict")
+        if not all(isinstance(query, str) for query in named_queries.values()):
+            raise TypeError("each query must be a string")
 
-    def df_to_sql(
+        from sqlconnect import parallel
+
+        tasks = {
+            key: (
+                partial(self.sql_to_df, query, **kwargs)
+                if query.lower().endswith(".sql")
+                else partial(self.sql_to_df_str, query, **kwargs)
+            )
+            for key, query in named_queries.items()
+        }
+
+        if self._session_connection is not None:
+            # A session has one connection, which cannot run queries concurrently
+            max_workers = 1
+        elif max_workers is None:
+            capacity = parallel.pool_capacity(self.engine) or parallel.MAX_WORKERS
+            max_workers = max(1, min(capacity, len(tasks)))
+
+        results = parallel.run_concurrently(tasks, max_workers)
+        if as_completed:
+            return (self._timed_result(result) for result in results)
+
+        dfs, errors = {}, {}
+        for result in map(self._timed_result, results):
+            if result.error is None:
+                dfs[result.key] = result.df
+            else:
+                errors[result.key] = result.error
+
+        ordered = {key: dfs[key] for key in named_queries if key in dfs}
+        if errors:
+            raise parallel.QueryBatchError(ordered, errors)
+        return ordered
+
+    def sql_to_df_partitioned(
         self,
-        df: pd.DataFrame,
-        name: str,
-        schema: str = None,
-        if_exists: str = "fail",
-        index: bool = True,
-        index_label=None,
-        chunksize: int = None,
-        dtype=None,
-        method=None,
-    ) -> Union[int, None]:
+        query: str,
+        partition_column: str = None,
+        lower_bound=None,
+        upper_bound=None,
+        num_partitions: int = None,
+        predicates: list = None,
+        max_workers: int = None,
+        **kwargs,
+    ) -> pd.DataFrame:
         """
-        Write a pandas DataFrame to a SQL database table.
+        Execute a large SQL query as several range-restricted queries in parallel and return the combined results.
 
-        This method allows for explicit control over how the DataFrame is written to the SQL table. The parameters correspond to those in pandas.DataFrame.to_sql, allowing for a detailed specification of the SQL writing process. See the pandas documentation for more details: https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.to_sql.html
+        The query is wrapped as a subquery and split either into ranges of 'partition_column', or by explicit
+        WHERE clause 'predicates'. Each partition runs concurrently on its own pooled connection, and the
+        results are concatenated in partition order. This is similar to Spark's JDBC partitioned read.
 
         Parameters
         ----------
-        df : pandas.DataFrame
-            The DataFrame to be written to the SQL table.
-        name : str
-            Name of the SQL table to which the DataFrame should be written.
-        schema : str, optional
-            Specify the schema (if database flavor supports this). If None, use default schema.
-        if_exists : str, default 'fail'
-            How to behave if the table already exists. Values include 'fail', 'replace', 'append'.
-        index : bool, default True
-            Write DataFrame index as a column. Uses index_label as the column name in the table.
-        index_label : str or sequence, optional
-            Column label for index columns(s). If None is given and index is True, then the index names are used.
-        chunksize : int, optional
-            Specify the number of rows in each batch to be written at a time. By default, all rows will be written at once.
-        dtype : dict or scalar, optional
-            Specifying the datatype for columns. If a dictionary is used, the keys should be column names and the values should be SQLAlchemy types.
-        method : {None, 'multi', callable}, optional
-            Controls the SQL insertion clause used.
+        query : str
+            The SQL query to be executed, or the file path of a .sql file. The query must be valid as a subquery
+            (e.g. no ORDER BY on SQL Server).
+        partition_column : str, optional
+            The numeric, date or datetime column to partition on. Required with the bounds.
+        lower_bound, upper_bound : optional
+            The range of 'partition_column' divided into 'num_partitions' strides of equal width. Rows outside the
+            range are read by the first and last partitions, so the bounds affect only performance, not results.
+        num_partitions : int, optional
+            The number of partitions to split the range into.
+        predicates : list of str, optional
+            Explicit WHERE clause predicates, one per partition, used instead of a partition column and bounds.
+            The predicates should not overlap, and should together cover every row.
+        max_workers : int, optional
+            The number of partitions read at once. Defaults to the number of connections the engine's pool can
+            hand out, capped at the number of partitions.
+        **kwargs
+            Further keyword arguments passed to `sql_to_df_str` for every partition, e.g. 'params' or 'dtype'.
 
         Returns
         -------
-        Union[int, None]
-            The number of rows inserted, if known, otherwise None.
+        pandas.DataFrame
+            The results of all partitions, in partition order.
 
         Raises
         ------
+        QueryBatchError
+            If any partition fails, once every partition has completed. Its 'errors' are keyed by partition number.
+        ValueError
+            If neither 'predicates' nor all of 'partition_column', 'lower_bound', 'upper_bound' and
+            'num_partitions' are given.
         RuntimeError
-            If there is an error in writing to the SQL table.
-        TypeError
-            If the provided DataFrame or table name is not of the correct type.
+            If the file cannot be found.
 
         Examples
         --------
-        >>> df = pd.DataFrame({'col1': [1, 2], 'col2': [3, 4]})
-        >>> connection.df_to_sql(df, 'table_name', if_exists='append', index=False)
-        This will write the DataFrame 'df' to the 'table_name' table in the connected SQL database, appending the data without including the index.
+        >>> df = connection.sql_to_df_partitioned(
+        ...     "SELECT * FROM sales.fact_orders",
+        ...     partition_column="order_id",
+        ...     lower_bound=1,
+        ...     upper_bound=1_000_000_000,
+        ...     num_partitions=16,
+        ... )
         """
+        if not isinstance(query, str):
+            raise TypeError("query must be a string")
 
-        if not isinstance(df, pd.DataFrame):
-            raise TypeError("df must be a pandas DataFrame")
-        if not isinstance(name, str):
-            raise TypeError("name must be a string")
+        if query.lower().endswith(".sql"):
+            try:
+                query = sqlfiles.sql_file_cache.load(query).text
+            except FileNotFoundError:
+                raise RuntimeError(f"File not found at: {Path(query).resolve()}")
 
-        try:
-            result = df.to_sql(
-                name,
-                self.engine,
-                schema=schema,
-                if_exists=if_exists,
-                index=index,
-                index_label=index_label,
-                chunksize=chunksize,
-                dtype=dtype,
-                method=method,
+        from sqlconnect import parallel
+
+        if predicates is None:
+            if None in (partition_column, lower_bound, upper_bound, num_partitions):
+                raise ValueError(
+                    "Either predicates or partition_column, lower_bound, upper_bound and "
+                    "num_partitions must be given"
+                )
+            predicates = parallel.partition_predicates(
+                self.engine.dialect.identifier_preparer.quote(partition_column),
+                lower_bound,
+                upper_bound,
+                num_partitions,
+                self._render_literal,
             )
-            return result
+
+        partitions = {
+            i: parallel.restrict_query(query, predicate)
+            for i, predicate in enumerate(predicates)
+        }
+        dfs = self.sql_to_dfs(partitions, max_workers=max_workers, **kwargs)
+
+        import pandas as pd
+
+        keep_index = kwargs.get("index_col") is not None
+        return pd.concat(dfs.values(), ignore_index=not keep_index)
+
+    def sql_to_df_incremental(
+        self,
+        query: str,
+        watermark_column: str,
+        key_columns: list = None,
+        snapshot_path: str = None,
+        initial_watermark=None,
+        full_refresh: bool = False,
+        watermark_store: incremental.WatermarkStore = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Execute a SQL query, reading only the rows added since the previous read of the same query.
+
+        The largest value of 'watermark_column' read is stored per connection and query. The next call wraps the
+        query as a subquery restricted to rows above that value, so only new rows are transferred. If a
+        'snapshot_path' is given, the new rows are merged into a local Parquet file holding every row read so far,
+        and the full, up-to-date result is returned.
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to be executed, or the file path of a .sql file. The query must be valid as a subquery.
+        watermark_column : str
+            A column of the query whose values only increase, e.g. an identity column or a last-modified
+            timestamp.
+        key_columns : list of str, optional
+            Columns uniquely identifying a row. If given, rows equal to the watermark are read again and a new row
+            replaces the snapshot row with the same key, so updated rows are not duplicated. Otherwise only rows
+            strictly above the watermark are read.
+        snapshot_path : str, optional
+            The Parquet file to merge new rows into. Requires pyarrow (`pip install sqlconnect[arrow]`). If the
+            file does not exist, the query is read in full.
+        initial_watermark : optional
+            The watermark used when none is stored, e.g. to skip historical rows on the first read.
+        full_refresh : bool, default False
+            Ignore the stored watermark and snapshot, and read the query in full.
+        watermark_store : WatermarkStore, optional
+            Where watermarks are stored. Defaults to `~/.cache/sqlconnect/watermarks.json`.
+        **kwargs
+            Further keyword arguments passed to `sql_to_df_str`, e.g. 'params' or 'parse_dates'.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The new rows, or the merged snapshot if 'snapshot_path' is given. The number of new rows is stored in
+            `df.attrs["sqlconnect_new_rows"]`.
+
+        Raises
+        ------
+        RuntimeError
+            If the file cannot be found or if there is an error in executing the query.
+        TypeError
+            If the provided query or watermark column is not a string.
+        ValueError
+            If 'chunksize' is given.
+
+        Examples
+        --------
+        >>> df = connection.sql_to_df_incremental(
+        ...     "SELECT * FROM sales.orders",
+        ...     watermark_column="last_modified",
+        ...     key_columns=["order_id"],
+        ...     snapshot_path="snapshots/orders.parquet",
+        ... )
+        """
+        if not isinstance(query, str):
+            raise TypeError("query must be a string")
+        if not isinstance(watermark_column, str):
+            raise TypeError("watermark_column must be a string")
+        if kwargs.get("chunksize") is not None:
+            raise ValueError("chunksize cannot be combined with incremental reads")
+
+        if query.lower().endswith(".sql"):
+            try:
+                query = sqlfiles.sql_file_cache.load(query).text
+            except FileNotFoundError:
+                raise RuntimeError(f"File not found at: {Path(query).resolve()}")
+
+        from sqlconnect import incremental, parallel
+
+        store = (
+            watermark_store
+            if watermark_store is not None
+            else incremental.watermark_store
+        )
+        key = incremental.state_key(
+            f"{self.connection_name} {self.engine.url}", query, watermark_column
+        )
+
+        snapshot, watermark = None, None
+        if not full_refresh:
+            if snapshot_path is not None:
+                snapshot = incremental.read_snapshot(snapshot_path)
+            if snapshot_path is None or snapshot is not None:
+                watermark = store.get(key)
+        if watermark is None:
+            watermark = initial_watermark
+
+        sql = query
+        if watermark is not None:
+            operator = ">=" if key_columns else ">"
+            column = self.engine.dialect.identifier_preparer.quote(watermark_column)
+            sql = parallel.restrict_query(
+                query, f"{column} {operator} {self._render_literal(watermark)}"
+            )
+
+        new_rows = self.sql_to_df_str(sql, **kwargs)
+
+        if snapshot_path is not None:
+            result = incremental.merge_snapshot(snapshot, new_rows, key_columns)
+            incremental.write_snapshot(result, snapshot_path)
+        else:
+            result = new_rows
+
+        # Saved last, so a failed read or snapshot write is retried from the previous watermark
+        if len(new_rows):
+            store.set(key, incremental.max_watermark(new_rows, watermark_column))
+        result.attrs["sqlconnect_new_rows"] = len(new_rows)
+        return result
+
+    def _render_literal(self, value) -> str:
+        """Render a Python value as a SQL literal in this connector's dialect."""
+        from sqlconnect import parallel
+
+        return parallel.render_literal(value, self.engine.dialect)
+
+    @staticmethod
+    def _timed_result(result: parallel.QueryResult) -> parallel.QueryResult:
+        """Record the elapsed time of a concurrent query on its DataFrame."""
+        if result.df is not None and hasattr(result.df, "attrs"):
+            result.df.attrs["sqlconnect_elapsed"] = result.elapsed
+        return result
+
+    def sql_to_arrow(
+        self, query_path: str, params=None, batch_size: int = None
+    ) -> Union[pa.Table, pa.RecordBatchReader]:
+        """
+        Execute a SQL query from a file and return the results as an Apache Arrow table.
+        Rows are fetched from a server-side cursor and converted to Arrow one batch at a time, without creating
+        per-row pandas objects. Requires pyarrow (`pip install sqlconnect[arrow]`).
+
+        Parameters
+        ----------
+        query_path : str
+            The file path of the SQL query to be executed.
+        params : list, tuple or dict, optional, default: None
+            List of parameters to pass to execute method.
+        batch_size : int, optional
+            Return a `pyarrow.RecordBatchReader` streaming record batches of at most 'batch_size' rows. The
+            reader holds a dedicated connection until it is exhausted or closed. Column types are those
+            reported by the driver, or are inferred from the values of the first batches in which they are
+            not NULL (see `arrow.fixed_schema`).
+
+        Returns
+        -------
+        Union[pyarrow.Table, pyarrow.RecordBatchReader]
+            A table containing the results of the SQL query, or a record batch reader if 'batch_size' is
+            specified.
+
+        Raises
+        ------
+        RuntimeError
+            If the file cannot be found or if there is an error in executing the query.
+        TypeError
+            If the provided query_path is not a string
+        ImportError
+            If pyarrow is not installed.
+
+        Examples
+        --------
+        >>> table = connection.sql_to_arrow("path/to/sql_query.sql")
+        >>> df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        """
+        if not isinstance(query_path, str):
+            raise TypeError("query_path must be a string")
+
+        from sqlconnect import arrow
+
+        arrow.import_pyarrow()
+
+        try:
+            query = sqlfiles.sql_file_cache.load(query_path).text
+            with self._measure("sql_to_arrow", query, params) as call:
+                table = self._read_arrow(query, params, batch_size)
+                call.set_result(table)
+            return table
+        except FileNotFoundError:
+            raise RuntimeError(f"File not found at: {Path(query_path).resolve()}")
+        except Exception as e:
+            raise RuntimeError(f"Error executing query: {e}")
+
+    def sql_to_arrow_str(
+        self, query: str, params=None, batch_size: int = None
+    ) -> Union[pa.Table, pa.RecordBatchReader]:
+        """
+        Execute a SQL query from a string and return the results as an Apache Arrow table.
+        Rows are fetched from a server-side cursor and converted to Arrow one batch at a time, without creating
+        per-row pandas objects. Requires pyarrow (`pip install sqlconnect[arrow]`).
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to be executed.
+        params : list, tuple or dict, optional, default: None
+            List of parameters to pass to execute method.
+        batch_size : int, optional
+            Return a `pyarrow.RecordBatchReader` streaming record batches of at most 'batch_size' rows. The
+            reader holds a dedicated connection until it is exhausted or closed. Column types are those
+            reported by the driver, or are inferred from the values of the first batches in which they are
+            not NULL (see `arrow.fixed_schema`).
+
+        Returns
+        -------
+        Union[pyarrow.Table, pyarrow.RecordBatchReader]
+            A table containing the results of the SQL query, or a record batch reader if 'batch_size' is
+            specified.
+
+        Raises
+        ------
+        RuntimeError
+            If there is an error in executing the query.
+        TypeError
+            If the provided query is not a string
+        ImportError
+            If pyarrow is not installed.
+
+        Examples
+        --------
+        >>> reader = connection.sql_to_arrow_str("SELECT * FROM sales.invoices", batch_size=100_000)
+        >>> for batch in reader:
+        ...     process(batch)
+        """
+        if not isinstance(query, str):
+            raise TypeError("query must be a string")
+
+        from sqlconnect import arrow
+
+        arrow.import_pyarrow()
+
+        try:
+            with self._measure("sql_to_arrow_str", query, params) as call:
+                table = self._read_arrow(query, params, batch_size)
+                call.set_result(table)
+            return table
+        except Exception as e:
+            raise RuntimeError(f"Error executing query: {e}")
+
+    def _read_arrow(self, sql: str, params, batch_size: int = None):
+        """Execute a query on a streaming connection and convert the result to Arrow."""
+        from sqlconnect import arrow
+
+        pa = arrow.import_pyarrow()
+        fetch_size = batch_size or arrow.DEFAULT_BATCH_SIZE
+
+        session = self._session_connection
+        connection = session or self.engine.connect()
+        # A session's connection stays open and unchanged for the session's later calls
+        release = connection.close if session is None else lambda: None
+        try:
+            if session is None:
+                connection.execution_options(yield_per=fetch_size)
+                if self.engine.dialect.name == "oracle":
+                    _set_oracle_fetch_size(connection, fetch_size)
+            # Execute as a driver-level string, as pandas does, so params use the driver's paramstyle
+            result = connection.exec_driver_sql(sql, *([params] if params else []))
+            batches = arrow.result_batches(result, fetch_size)
+
+            if batch_size is None:
+                tables = [pa.Table.from_batches([batch]) for batch in batches]
+                release()
+                return pa.concat_tables(tables, promote_options="permissive")
+
+            # A stream needs its schema up front, before column types have been seen in every batch
+            schema, converted = arrow.fixed_schema(batches)
+        except BaseException:
+            release()
+            raise
+
+        def stream():
+            try:
+                yield from converted
+            finally:
+                converted.close()
+                release()
+
+        return pa.RecordBatchReader.from_batches(schema, stream())
+
+    def sql_to_parquet(
+        self,
+        query: str,
+        path: str,
+        params=None,
+        batch_size: int = None,
+        row_group_size: int = None,
+        compression: str = "snappy",
+        max_file_bytes: int = None,
+    ) -> export.ExportResult:
+        """
+        Execute a SQL query and stream the results to a Parquet file.
+        Rows are fetched from a server-side cursor and written one batch at a time, so the full result is never
+        held in memory. Requires pyarrow (`pip install sqlconnect[arrow]`).
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to be executed, or the file path of a .sql file.
+        path : str
+            The output file. Its directory is created if it does not exist.
+        params : list, tuple or dict, optional, default: None
+            List of parameters to pass to execute method.
+        batch_size : int, optional
+            The number of rows fetched and written per batch. Defaults to 65,536.
+        row_group_size : int, optional
+            The number of rows per Parquet row group. By default each batch is written as its own row group.
+        compression : str, default 'snappy'
+            The compression codec, e.g. 'snappy', 'zstd', 'gzip' or 'none'.
+        max_file_bytes : int, optional
+            Roll over to a new file once the current one reaches this size. The files are numbered from
+            `<stem>-00000.parquet`.
+
+        Returns
+        -------
+        ExportResult
+            The number of rows and bytes written, and the paths of the files written.
+
+        Raises
+        ------
+        RuntimeError
+            If the file cannot be found or if there is an error in executing the query or writing the file.
+        TypeError
+            If the provided query or path is not a string.
+        ImportError
+            If pyarrow is not installed.
+
+        Examples
+        --------
+        >>> connection.sql_to_parquet("SELECT * FROM sales.invoices", "exports/invoices.parquet", compression="zstd")
+        ExportResult(rows=1250000, bytes=48213577, files=['exports/invoices.parquet'])
+        """
+        return self._export(
+            query,
+            path,
+            "parquet",
+            params,
+            batch_size,
+            compression=compression,
+            row_group_size=row_group_size,
+            max_file_bytes=max_file_bytes,
+        )
+
+    def sql_to_csv(
+        self,
+        query: str,
+        path: str,
+        params=None,
+        batch_size: int = None,
+        compression: str = None,
+        max_file_bytes: int = None,
+    ) -> export.ExportResult:
+        """
+        Execute a SQL query and stream the results to a CSV file with a header row.
+        Rows are fetched from a server-side cursor and written one batch at a time, so the full result is never
+        held in memory. Requires pyarrow (`pip install sqlconnect[arrow]`).
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to be executed, or the file path of a .sql file.
+        path : str
+            The output file. Its directory is created if it does not exist.
+        params : list, tuple or dict, optional, default: None
+            List of parameters to pass to execute method.
+        batch_size : int, optional
+            The number of rows fetched and written per batch. Defaults to 65,536.
+        compression : str, optional
+            Compress the file, e.g. with 'gzip' or 'bz2'. By default the file is uncompressed.
+        max_file_bytes : int, optional
+            Roll over to a new file once the current one reaches this size. The files are numbered from
+            `<stem>-00000.csv`, each with its own header row.
+
+        Returns
+        -------
+        ExportResult
+            The number of rows and bytes written, and the paths of the files written.
+
+        Raises
+        ------
+        RuntimeError
+            If the file cannot be found or if there is an error in executing the query or writing the file.
+        TypeError
+            If the provided query or path is not a string.
+        ImportError
+            If pyarrow is not installed.
+
+        Examples
+        --------
+        >>> connection.sql_to_csv("invoices.sql", "exports/invoices.csv.gz", compression="gzip")
+        """
+        return self._export(
+            query,
+            path,
+            "csv",
+            params,
+            batch_size,
+            compression=compression,
+            max_file_bytes=max_file_bytes,
+        )
+
+    def sql_to_ipc(
+        self,
+        query: str,
+        path: str,
+        params=None,
+        batch_size: int = None,
+        compression: str = None,
+        max_file_bytes: int = None,
+    ) -> export.ExportResult:
+        """
+        Execute a SQL query and stream the results to an Arrow IPC (Feather) file.
+        Rows are fetched from a server-side cursor and written one batch at a time, so the full result is never
+        held in memory. Requires pyarrow (`pip install sqlconnect[arrow]`).
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to be executed, or the file path of a .sql file.
+        path : str
+            The output file. Its directory is created if it does not exist.
+        params : list, tuple or dict, optional, default: None
+            List of parameters to pass to execute method.
+        batch_size : int, optional
+            The number of rows fetched and written per batch. Defaults to 65,536.
+        compression : {'lz4', 'zstd'}, optional
+            Compress the record batches. By default the file is uncompressed.
+        max_file_bytes : int, optional
+            Roll over to a new file once the current one reaches this size. The files are numbered from
+            `<stem>-00000.arrow`.
+
+        Returns
+        -------
+        ExportResult
+            The number of rows and bytes written, and the paths of the files written.
+
+        Raises
+        ------
+        RuntimeError
+            If the file cannot be found or if there is an error in executing the query or writing the file.
+        TypeError
+            If the provided query or path is not a string.
+        ImportError
+            If pyarrow is not installed.
+
+        Examples
+        --------
+        >>> connection.sql_to_ipc("SELECT * FROM sales.invoices", "exports/invoices.arrow", compression="lz4")
+        """
+        return self._export(
+            query,
+            path,
+            "ipc",
+            params,
+            batch_size,
+            compression=compression,
+            max_file_bytes=max_file_bytes,
+        )
+
+    def _export(
+        self, query: str, path, file_format: str, params, batch_size: int, **options
+    ) -> export.ExportResult:
+        """Stream the results of a query or .sql file to files of the given format."""
+        if not isinstance(query, str):
+            raise TypeError("query must be a string")
+        if not isinstance(path, (str, Path)):
+            raise TypeError("path must be a string")
+
+        from sqlconnect import arrow, export
+
+        arrow.import_pyarrow()
+
+        if query.lower().endswith(".sql"):
+            try:
+                query = sqlfiles.sql_file_cache.load(query).text
+            except FileNotFoundError:
+                raise RuntimeError(f"File not found at: {Path(query).resolve()}")
+
+        try:
+            with self._measure(f"sql_to_{file_format}", query, params) as call:
+                reader = self._read_arrow(
+                    query, params, batch_size or arrow.DEFAULT_BATCH_SIZE
+                )
+                with reader:
+                    result = export.write_batches(reader, path, file_format, **options)
+                call.set_result(result.rows)
+            return result
+        except Exception as e:
+            raise RuntimeError(f"Error exporting query: {e}")
+
+    def execute_sql(self, sql_path: str) -> None:
+        """
+        Execute a SQL command from a file.
+        The file and its prepared statement are cached after the first call and only read again when it changes.
+
+        Parameters
+        ----------
+        sql_path : str
+            The file path of the SQL command to be executed.
+
+        Raises
+        ------
+        RuntimeError
+            If there is an error in reading the file or executing the SQL command.
+            This includes file not found errors and other general exceptions.
+        """
+        try:
+            command = sqlfiles.sql_file_cache.load(sql_path).clause
+        except FileNotFoundError:
+            raise RuntimeError(f"File not found at: {Path(sql_path).resolve()}")
+
+        with self._measure("execute_sql", command.text):
+            try:
+                # Committed on exit, or by the session; rolled back in case of an error
+                with self._begin() as connection:
+                    connection.execute(command)
+            except Exception as e:
+                raise RuntimeError(f"An error occurred: {e}")
+
+    def execute_sql_str(self, command: str) -> None:
+        """
+        Execute a SQL command from a string.
+
+        Parameters
+        ----------
+        command : str
+            The SQL command to be executed.
+
+        Raises
+        ------
+        Exception
+            If there is an error in executing the command.
+        """
+        from sqlalchemy import text
+
+        with self._measure("execute_sql_str", command):
+            try:
+                # Committed on exit, or by the session; rolled back in case of an error
+                with self._begin() as connection:
+                    connection.execute(text(command.replace("\n", " ")))
+            except Exception as e:
+                print(f"An error occurred: {e}")
+
+    def execute_many(
+        self, sql: str, params: Iterable, batch_size: int = EXECUTE_MANY_BATCH_SIZE
+    ) -> Union[int, None]:
+        """
+        Execute a parameterised SQL command once for every set of parameters, in a single transaction.
+
+        Parameters are sent to the driver's `executemany` in batches of 'batch_size', so each batch is one call
+        rather than one round trip per row. They are read lazily from 'params', so a generator is never
+        materialised beyond one batch.
+
+        Parameters
+        ----------
+        sql : str
+            The SQL command, e.g. an INSERT, UPDATE or DELETE. With dict parameters, it uses `:name` placeholders.
+            With tuple parameters, it uses the driver's own positional placeholders (e.g. `?` or `%s`).
+        params : iterable of dict or tuple
+            The parameters of each execution, e.g. a list or a generator.
+        batch_size : int, default 1000
+            The number of parameter sets sent to the driver per `executemany` call.
+
+        Returns
+        -------
+        Union[int, None]
+            The total number of rows affected, or None if the driver does not report it.
+
+        Raises
+        ------
+        RuntimeError
+            If there is an error in executing the command. The transaction is rolled back, so no batch is applied.
+        TypeError
+            If the provided sql is not a string.
+        ValueError
+            If 'batch_size' is not a positive integer.
+
+        Examples
+        --------
+        >>> connection.execute_many(
+        ...     "UPDATE company.employees SET salary = :salary WHERE employee_id = :employee_id",
+        ...     ({"employee_id": e, "salary": s} for e, s in raises),
+        ... )
+        1250
+        """
+        from sqlalchemy import text
+
+        if not isinstance(sql, str):
+            raise TypeError("sql must be a string")
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        rows = iter(params)
+        total = 0
+        try:
+            with self._measure("execute_many", sql) as call:
+                with self._begin() as connection:
+                    while True:
+                        batch = list(itertools.islice(rows, batch_size))
+                        if not batch:
+                            break
+                        if isinstance(batch[0], Mapping):
+                            result = connection.execute(text(sql), batch)
+                        else:
+                            result = connection.exec_driver_sql(sql, batch)
+                        if total is not None:
+                            total = (
+                                total + result.rowcount
+                                if result.rowcount >= 0
+                                else None
+                            )
+                call.set_result(total)
+        except Exception as e:
+            raise RuntimeError(f"An error occurred: {e}")
+        return total
+
+    def df_to_sql(
+        self,
+        df: pd.DataFrame,
+        name: str,
+        schema: str = None,
+        if_exists: str = "fail",
+        index: bool = True,
+        index_label=None,
+        chunksize: int = None,
+        dtype=None,
+        method=None,
+        bulk: bool = False,
+    ) -> Union[int, None]:
+        """
+        Write a pandas DataFrame to a SQL database table.
+
+        This method allows for explicit control over how the DataFrame is written to the SQL table. The parameters correspond to those in pandas.DataFrame.to_sql, allowing for a detailed specification of the SQL writing process. See the pandas documentation for more details: https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.to_sql.html
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            The DataFrame to be written to the SQL table.
+        name : str
+            Name of the SQL table to which the DataFrame should be written.
+        schema : str, optional
+            Specify the schema (if database flavor supports this). If None, use default schema.
+        if_exists : str, default 'fail'
+            How to behave if the table already exists. Values include 'fail', 'replace', 'append'.
+        index : bool, default True
+            Write DataFrame index as a column. Uses index_label as the column name in the table.
+        index_label : str or sequence, optional
+            Column label for index columns(s). If None is given and index is True, then the index names are used.
+        chunksize : int, optional
+            Specify the number of rows in each batch to be written at a time. By default, all rows will be written at once.
+        dtype : dict or scalar, optional
+            Specifying the datatype for columns. If a dictionary is used, the keys should be column names and the values should be SQLAlchemy types.
+        method : {None, 'multi', callable}, optional
+            Controls the SQL insertion clause used.
+        bulk : bool, default False
+            Insert rows with the fastest bulk path of the database driver instead of parameterised INSERT statements:
+            `COPY FROM STDIN` for psycopg2, `fast_executemany` for pyodbc, array-bound `executemany` for oracledb and
+            batched `executemany` for PyMySQL and SQLite. Rows are sent in chunks of 'chunksize', defaulting to
+            10,000. Cannot be combined with 'method'.
+
+        Returns
+        -------
+        Union[int, None]
+            The number of rows inserted, if known, otherwise None.
+
+        Raises
+        ------
+        RuntimeError
+            If there is an error in writing to the SQL table.
+        TypeError
+            If the provided DataFrame or table name is not of the correct type.
+        ValueError
+            If both 'bulk' and 'method' are specified.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({'col1': [1, 2], 'col2': [3, 4]})
+        >>> connection.df_to_sql(df, 'table_name', if_exists='append', index=False)
+        This will write the DataFrame 'df' to the 'table_name' table in the connected SQL database, appending the data without including the index.
+        """
+
+        import pandas as pd
+
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("df must be a pandas DataFrame")
+        if not isinstance(name, str):
+            raise TypeError("name must be a string")
+
+        if bulk:
+            if method is not None:
+                raise ValueError("method cannot be specified when bulk is True")
+            from sqlconnect import bulk as bulk_insert
+
+            method = bulk_insert.insert_method(self.engine.dialect)
+            chunksize = chunksize or bulk_insert.BULK_CHUNKSIZE
+
+        try:
+            with self._measure("df_to_sql", name) as call:
+                result = df.to_sql(
+                    name,
+                    self._session_connection or self.engine,
+                    schema=schema,
+                    if_exists=if_exists,
+                    index=index,
+                    index_label=index_label,
+                    chunksize=chunksize,
+                    dtype=dtype,
+                    method=method,
+                )
+                call.set_result(df)
+            return result
+        except Exception as e:
+            raise RuntimeError(f"Error writing to SQL table: {e}")
+
+    def df_upsert(
+        self,
+        df: pd.DataFrame,
+        name: str,
+        keys: list,
+        schema: str = None,
+        chunksize: int = None,
+        dtype=None,
+        bulk: bool = True,
+    ) -> Union[int, None]:
+        """
+        Insert the rows of a pandas DataFrame into a SQL table, updating the rows whose keys already exist.
+
+        The DataFrame is loaded into a staging table, which is then merged into the target table with a single
+        set-based statement: `INSERT ... ON CONFLICT` for PostgreSQL and SQLite, `INSERT ... ON DUPLICATE KEY
+        UPDATE` for MySQL and MariaDB, and `MERGE` for SQL Server and Oracle. The staging table is dropped
+        afterwards, even if the merge fails.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            The rows to upsert. Its columns must exist in the target table; the index is not written.
+        name : str
+            Name of the target SQL table, which must already exist.
+        keys : list of str
+            The columns identifying a row. For PostgreSQL, SQLite and MySQL these need a primary key or unique
+            constraint on the target table.
+        schema : str, optional
+            The schema of the target table, also used for the staging table. If None, use default schema.
+        chunksize : int, optional
+            The number of rows written to the staging table at a time.
+        dtype : dict or scalar, optional
+            SQLAlchemy types of the staging table columns, as for `df_to_sql`.
+        bulk : bool, default True
+            Load the staging table with the fastest bulk path of the database driver, as for `df_to_sql`.
+
+        Returns
+        -------
+        Union[int, None]
+            The number of rows affected as reported by the driver, if known, otherwise None. MySQL counts an
+            updated row twice.
+
+        Raises
+        ------
+        RuntimeError
+            If there is an error in writing to the SQL table.
+        TypeError
+            If the provided DataFrame or table name is not of the correct type.
+        ValueError
+            If 'keys' is empty or names columns missing from the DataFrame, or the dialect is not supported.
+
+        Examples
+        --------
+        >>> connection.df_upsert(df, "customers", keys=["customer_id"], schema="sales")
+        """
+        import pandas as pd
+        from sqlalchemy import MetaData, Table
+        from sqlconnect import bulk as bulk_insert
+        from sqlconnect import upsert
+
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("df must be a pandas DataFrame")
+        if not isinstance(name, str):
+            raise TypeError("name must be a string")
+        if isinstance(keys, str):
+            keys = [keys]
+        if not keys:
+            raise ValueError("keys must name at least one column")
+        missing = [key for key in keys if key not in df.columns]
+        if missing:
+            raise ValueError(f"keys not found in DataFrame columns: {missing}")
+
+        dialect = self.engine.dialect
+        staging = upsert.staging_table_name()
+        metadata = MetaData()
+        statement = upsert.upsert_statement(
+            dialect,
+            dialect.identifier_preparer.format_table(
+                Table(name, metadata, schema=schema)
+            ),
+            dialect.identifier_preparer.format_table(
+                Table(staging, metadata, schema=schema)
+            ),
+            [str(column) for column in df.columns],
+            keys,
+        )
+
+        method = None
+        if bulk:
+            method = bulk_insert.insert_method(dialect)
+            chunksize = chunksize or bulk_insert.BULK_CHUNKSIZE
+
+        try:
+            with self._measure("df_upsert", name) as call:
+                with self._begin() as connection:
+                    df.to_sql(
+                        staging,
+                        connection,
+                        schema=schema,
+                        index=False,
+                        chunksize=chunksize,
+                        dtype=dtype,
+                        method=method,
+                    )
+                    result = connection.exec_driver_sql(statement)
+                call.set_result(df)
+            return result.rowcount if result.rowcount >= 0 else None
         except Exception as e:
             raise RuntimeError(f"Error writing to SQL table: {e}")
+        finally:
+            # Dropped separately, as a failed merge aborts the transaction on some databases. Inside a session
+            # or transaction that transaction is still aborted, so a failing drop is logged rather than raised
+            # in place of the error of the merge.
+            try:
+                with self._begin() as connection:
+                    Table(staging, metadata, schema=schema).drop(
+                        connection, checkfirst=True
+                    )
+            except Exception as e:
+                logger.warning("Could not drop staging table %s: %s", staging, e)
+
+    def transfer(
+        self,
+        source_query: str,
+        target_connector: Sqlconnector,
+        target_table: str,
+        schema: str = None,
+        if_exists: str = "append",
+        chunksize: int = TRANSFER_CHUNKSIZE,
+        params=None,
+        bulk: bool = True,
+        queue_size: int = TRANSFER_QUEUE_SIZE,
+        progress=None,
+        start_chunk: int = 0,
+    ) -> transfer.TransferProgress:
+        """
+        Copy the results of a SQL query on this connection into a table of another connection.
+
+        Chunks are streamed from a server-side cursor on a reader thread and written to the target on the calling
+        thread, so reading the next chunk overlaps with writing the previous one. At most 'queue_size' chunks
+        wait in memory between the two. Each chunk is written in its own transaction.
+
+        Parameters
+        ----------
+        source_query : str
+            The SQL query to be executed on this connection, or the file path of a .sql file. To resume a failed
+            transfer, the query must return rows in a stable order, e.g. with an ORDER BY clause.
+        target_connector : Sqlconnector
+            The connection to write to.
+        target_table : str
+            Name of the SQL table to write to.
+        schema : str, optional
+            The schema of the target table. If None, use default schema.
+        if_exists : str, default 'append'
+            How to behave if the target table already exists, as for `df_to_sql`. Applies to the first chunk;
+            later chunks, and every chunk of a resumed transfer, are appended.
+        chunksize : int, default 50000
+            The number of rows read and written per chunk.
+        params : list, tuple or dict, optional, default: None
+            List of parameters to pass to execute method.
+        bulk : bool, default True
+            Write each chunk with the fastest bulk path of the target's driver, as for `df_to_sql`.
+        queue_size : int, default 2
+            The number of chunks read ahead of the writer.
+        progress : callable, optional
+            Called with a TransferProgress (chunks, rows, elapsed) after each chunk is written.
+        start_chunk : int, default 0
+            Resume a failed transfer by skipping this many chunks, e.g. `TransferError.chunks_completed`.
+
+        Returns
+        -------
+        TransferProgress
+            The chunks completed, the rows written and the seconds taken.
+
+        Raises
+        ------
+        TransferError
+            If reading or writing a chunk fails. Its 'chunks_completed' attribute holds the 'start_chunk' to resume
+            from.
+        TypeError
+            If the provided query or table name is not a string, or the target is not a Sqlconnector.
+        ValueError
+            If this connector and the target are in the same session.
+
+        Examples
+        --------
+        >>> source = sc.Sqlconnector("MSSQL")
+        >>> target = sc.Sqlconnector("Postgres")
+        >>> source.transfer("SELECT * FROM sales.orders ORDER BY order_id", target, "orders", schema="staging")
+        TransferProgress(chunks=214, rows=10680213, elapsed=412.8)
+        """
+        if not isinstance(source_query, str):
+            raise TypeError("source_query must be a string")
+        if not isinstance(target_connector, Sqlconnector):
+            raise TypeError("target_connector must be a Sqlconnector")
+        if not isinstance(target_table, str):
+            raise TypeError("target_table must be a string")
+        if (
+            self._session_connection is not None
+            and self._session_connection is target_connector._session_connection
+        ):
+            raise ValueError(
+                "transfer cannot read and write on the same session, as chunks are read on another thread"
+            )
+
+        from sqlconnect import transfer
+
+        read = (
+            self.sql_to_df
+            if source_query.lower().endswith(".sql")
+            else self.sql_to_df_str
+        )
+        try:
+            chunks = read(source_query, params=params, chunksize=chunksize)
+        except RuntimeError as e:
+            raise transfer.TransferError(str(e), start_chunk, 0) from e
+
+        def write(chunk: pd.DataFrame, number: int) -> None:
+            target_connector.df_to_sql(
+                chunk,
+                target_table,
+                schema=schema,
+                if_exists=if_exists if number == 0 else "append",
+                index=False,
+                bulk=bulk,
+            )
+
+        try:
+            return transfer.run_pipeline(
+                chunks, write, queue_size, progress, start_chunk
+            )
+        finally:
+            chunks.close()
@@ -0,0 +1,153 @@
+"""
+This module provides credential providers, used by `config.get_credentials` to resolve the '${ENV_VAR}'
+references given as 'username' and 'password' in `sqlconnect.yaml`.
+
+A provider maps a variable name to its value. The default provider reads the process environment and then the
+first `sqlconnect.env` file found in the current directory or the user's home directory. The file is parsed
+once per process into an in-memory map and only re-read when its modification time, size or inode changes, so
+resolving credentials does not read from disk on every connection.
+
+Classes:
+    CredentialProvider: Base class for credential providers.
+    EnvironmentProvider: Resolves variables from the process environment.
+    EnvFileProvider: Resolves variables from the process environment, then from a cached `sqlconnect.env` file.
+    CallableProvider: Resolves variables by calling a user supplied function.
+
+Functions:
+    get_default_provider: Returns the provider used when none is given explicitly.
+    set_default_provider: Replaces the provider used when none is given explicitly.
+
+Example Usage:
+    >>> import sqlconnect as sc
+    >>> from sqlconnect.credentials import CallableProvider
+    >>>
+    >>> provider = CallableProvider(lambda key: vault.read_secret(key))
+    >>> connection = sc.Sqlconnector("My_Database", credential_provider=provider)
+"""
+
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Optional
+
+
+class CredentialProvider(ABC):
+    """
+    Abstract base class for credential providers.
+
+    Subclasses must implement `get`, returning the value of a variable or None if it is not available, and may
+    override `describe`, used to tell the user where the variable was looked for.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the value of the variable `key`, or None if it is not available."""
+
+    def describe(self) -> str:
+        """Return a short description of where variables are looked for, used in error messages."""
+        return type(self).__name__
+
+
+class EnvironmentProvider(CredentialProvider):
+    """Resolves variables from the process environment."""
+
+    def get(self, key: str) -> Optional[str]:
+        return os.environ.get(key)
+
+    def describe(self) -> str:
+        return "the environment"
+
+
+class EnvFileProvider(CredentialProvider):
+    """
+    Resolves variables from the process environment, then from the first existing environment file.
+
+    Parameters
+    ----------
+    file_paths : list of Path, optional
+        The environment files to search, in order. Defaults to `sqlconnect.env` in the current directory,
+        then in the user's home directory.
+
+    Notes
+    -----
+    Variables already set in the process environment take precedence over the file, matching the behaviour
+    of `dotenv.load_dotenv`. The parsed file is cached and re-read only when its modification time, size or
+    inode changes.
+    """
+
+    def __init__(self, file_paths: Optional[list] = None):
+        self.file_paths = (
+            [Path(path) for path in file_paths]
+            if file_paths is not None
+            else [Path("sqlconnect.env"), Path.home() / "sqlconnect.env"]
+        )
+        self._cache = {}  # absolute path -> (stat signature, values)
+
+    def get(self, key: str) -> Optional[str]:
+        value = os.environ.get(key)
+        if value is not None:
+            return value
+        return self.values().get(key)
+
+    def values(self) -> dict:
+        """Return the variables of the first existing environment file, or an empty dict if there is none."""
+        for file_path in self.file_paths:
+            path = file_path.absolute()
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            cached = self._cache.get(path)
+            if cached is None or cached[0] != signature:
+                from dotenv import dotenv_values
+
+                cached = (signature, dotenv_values(path))
+                self._cache[path] = cached
+            return cached[1]
+        return {}
+
+    def clear(self) -> None:
+        """Discard the cached environment files, forcing the next lookup to read from disk."""
+        self._cache.clear()
+
+    def describe(self) -> str:
+        return " or ".join(str(path.absolute()) for path in self.file_paths)
+
+
+class CallableProvider(CredentialProvider):
+    """
+    Resolves variables by calling a user supplied function.
+
+    Parameters
+    ----------
+    func : callable
+        A function taking a variable name and returning its value, or None if it is not available.
+        Useful for fetching credentials from a secrets manager.
+    """
+
+    def __init__(self, func: Callable[[str], Optional[str]]):
+        self.func = func
+
+    def get(self, key: str) -> Optional[str]:
+        return self.func(key)
+
+    def describe(self) -> str:
+        return f"credential callable {getattr(self.func, '__name__', repr(self.func))}"
+
+
+_default_provider = EnvFileProvider()
+
+
+def get_default_provider() -> CredentialProvider:
+    """Return the credential provider used when none is given explicitly."""
+    return _default_provider
+
+
+def set_default_provider(provider: CredentialProvider) -> None:
+    """Replace the credential provider used when none is given explicitly."""
+    global _default_provider
+    if not isinstance(provider, CredentialProvider):
+        raise TypeError("provider must be a CredentialProvider")
+    _default_provider = provider
@@ -0,0 +1,172 @@
+"""
+This module provides memory-optimising dtype inference for query results, used by the Sqlconnector class when
+`sql_to_df` and `sql_to_df_str` are called with `optimize_memory=True`.
+
+Integer columns are downcast to the smallest integer type holding their values, float columns to float32 when no
+precision is lost, and string columns with few distinct values are converted to categoricals. For chunked reads,
+the dtypes are planned from the first chunk and applied to every chunk, widened only when a later chunk holds
+values the planned dtype cannot.
+
+Functions:
+    plan_dtypes: Returns the compact dtype of each column of a DataFrame that can be stored more compactly.
+    widen_plan: Returns a plan widened to fit the values of another DataFrame.
+    apply_plan: Converts the columns of a DataFrame to the dtypes of a plan, recording the memory saved.
+    optimize: Converts a DataFrame to compact dtypes.
+    optimize_chunks: Converts each DataFrame of a chunked read to compact dtypes consistent across chunks.
+
+Example Usage:
+    # Used within Sqlconnector class
+    df = optimize(pd.read_sql_query(sql, con=engine))
+    df.attrs["sqlconnect_memory_saved"]  # Bytes saved
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# String columns whose distinct values are at most this share of the rows become categoricals
+CATEGORY_RATIO = 0.5
+
+INTEGER_DTYPES = ("int8", "int16", "int32", "int64")
+
+
+def _integer_dtype(series: pd.Series) -> str:
+    """Return the smallest signed integer dtype holding the values of an integer column."""
+    import numpy as np
+
+    low, high = series.min(), series.max()
+    for dtype in INTEGER_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    return "int64"
+
+
+def _column_dtype(series: pd.Series, category_ratio: float):
+    """Return the compact dtype of a column, or None if it cannot be stored more compactly."""
+    import numpy as np
+    import pandas as pd
+
+    dtype = series.dtype
+    if len(series) == 0:
+        return None
+
+    if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+        compact = _integer_dtype(series)
+        return compact if np.dtype(compact).itemsize < dtype.itemsize else None
+
+    if isinstance(dtype, np.dtype) and dtype.kind == "f" and dtype.itemsize > 4:
+        values = series.to_numpy()
+        if np.array_equal(values.astype("float32"), values, equal_nan=True):
+            return "float32"
+        return None
+
+    if pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.StringDtype):
+        if pd.api.types.infer_dtype(series, skipna=True) != "string":
+            return None
+        if series.nunique() <= category_ratio * len(series):
+            return "category"
+    return None
+
+
+def plan_dtypes(df: pd.DataFrame, category_ratio: float = CATEGORY_RATIO) -> dict:
+    """
+    Returns the compact dtype of each column of a DataFrame that can be stored more compactly.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The DataFrame to plan, e.g. the first chunk of a chunked read.
+    category_ratio : float, default 0.5
+        String columns whose number of distinct values is at most this share of the rows become categoricals.
+
+    Returns
+    -------
+    dict
+        The plan, as {column: dtype}. Columns already stored compactly are omitted.
+    """
+    plan = {}
+    for column in df.columns:
+        dtype = _column_dtype(df[column], category_ratio)
+        if dtype is not None:
+            plan[column] = dtype
+    return plan
+
+
+def widen_plan(plan: dict, df: pd.DataFrame) -> dict:
+    """
+    Returns a plan widened to fit the values of another DataFrame.
+
+    Integer dtypes are widened to hold the new values. Columns whose values no longer suit the planned dtype,
+    e.g. float values that would lose precision or integers that became floats because of NULLs, are dropped
+    from the plan and keep the dtype pandas gives them.
+    """
+    import numpy as np
+
+    widened = {}
+    for column, dtype in plan.items():
+        if column not in df.columns:
+            continue
+        series = df[column]
+        if dtype in INTEGER_DTYPES:
+            if not (isinstance(series.dtype, np.dtype) and series.dtype.kind in "iu"):
+                continue
+            needed = _integer_dtype(series) if len(series) else dtype
+            widened[column] = max(dtype, needed, key=INTEGER_DTYPES.index)
+        elif dtype == "float32":
+            if len(series) and _column_dtype(series, 1.0) != "float32":
+                continue
+            widened[column] = dtype
+        elif dtype == "category":
+            if len(series) and _column_dtype(series, 1.0) != "category":
+                continue
+            widened[column] = dtype
+    return widened
+
+
+def apply_plan(df: pd.DataFrame, plan: dict) -> pd.DataFrame:
+    """
+    Converts the columns of a DataFrame to the dtypes of a plan.
+
+    The bytes saved, measured with `DataFrame.memory_usage(deep=True)`, are stored in
+    `df.attrs["sqlconnect_memory_saved"]`.
+    """
+    before = int(df.memory_usage(deep=True).sum())
+    plan = {column: dtype for column, dtype in plan.items() if column in df.columns}
+    optimized = df.astype(plan) if plan else df
+    optimized.attrs["sqlconnect_memory_saved"] = before - int(
+        optimized.memory_usage(deep=True).sum()
+    )
+    return optimized
+
+
+def optimize(df: pd.DataFrame, category_ratio: float = CATEGORY_RATIO) -> pd.DataFrame:
+    """Converts a DataFrame to compact dtypes, recording the bytes saved in `df.attrs["sqlconnect_memory_saved"]`."""
+    return apply_plan(df, plan_dtypes(df, category_ratio))
+
+
+def optimize_chunks(
+    chunks: Iterable[pd.DataFrame], category_ratio: float = CATEGORY_RATIO
+) -> Iterator[pd.DataFrame]:
+    """
+    Converts each DataFrame of a chunked read to compact dtypes consistent across chunks.
+
+    The plan is made from the first chunk. A later chunk that does not fit widens the plan for itself and every
+    following chunk, so dtypes never narrow between chunks. Categoricals keep the categories found in each chunk;
+    combine them with `pandas.api.types.union_categoricals` if needed.
+    """
+    plan = None
+    try:
+        for chunk in chunks:
+            plan = (
+                plan_dtypes(chunk, category_ratio)
+                if plan is None
+                else widen_plan(plan, chunk)
+            )
+            yield apply_plan(chunk, plan)
+    finally:
+        if hasattr(chunks, "close"):
+            chunks.close()
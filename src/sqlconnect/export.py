@@ -0,0 +1,217 @@
+"""
+This module writes streams of Arrow record batches to Parquet, CSV and Arrow IPC files, used by the Sqlconnector
+class to export query results to disk without holding the full result in memory.
+
+Batches are written as they are fetched from the cursor, so memory use is bounded by the batch size (and, for
+Parquet, the row group size). Output can be rolled over to a new file once a file reaches a given size.
+
+Classes:
+    ExportResult: The rows, bytes and files written by an export.
+
+Functions:
+    write_batches: Writes a stream of record batches to one or more files.
+
+Dependencies:
+    - pyarrow: Required. Install with `pip install sqlconnect[arrow]`.
+
+Example Usage:
+    # Used within Sqlconnector class
+    result = write_batches(reader, "exports/sales.parquet", "parquet", compression="zstd")
+"""
+
+from __future__ import annotations
+
+import contextlib
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+from sqlconnect import arrow
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+FILE_FORMATS = ("parquet", "csv", "ipc")
+
+
+class ExportResult(NamedTuple):
+    """The rows, bytes and files written by an export."""
+
+    rows: int
+    bytes: int
+    files: list
+
+
+def _file_path(path: Path, index: int, rollover: bool) -> Path:
+    """Return the path of the index-th output file, numbering the files when rolling over."""
+    if not rollover:
+        return path
+    suffixes = "".join(path.suffixes)
+    stem = path.name[: len(path.name) - len(suffixes)] if suffixes else path.name
+    return path.with_name(f"{stem}-{index:05d}{suffixes}")
+
+
+class _FileWriter:
+    """Writes record batches to a single file in one of FILE_FORMATS."""
+
+    def __init__(
+        self,
+        path: Path,
+        schema: pa.Schema,
+        file_format: str,
+        compression: str = None,
+        row_group_size: int = None,
+    ):
+        pa = arrow.import_pyarrow()
+
+        self.sink = pa.OSFile(str(path), "wb")
+        self.row_group_size = row_group_size
+        self._buffer = []
+        self._buffered_rows = 0
+        self._stream = None
+
+        try:
+            if file_format == "parquet":
+                import pyarrow.parquet as pq
+
+                self.writer = pq.ParquetWriter(
+                    self.sink, schema, compression=compression or "snappy"
+                )
+            elif file_format == "csv":
+                import pyarrow.csv as csv
+
+                if compression is not None:
+                    self._stream = pa.CompressedOutputStream(self.sink, compression)
+                self.writer = csv.CSVWriter(self._stream or self.sink, schema)
+            else:
+                options = pa.ipc.IpcWriteOptions(compression=compression)
+                self.writer = pa.ipc.new_file(self.sink, schema, options=options)
+        except BaseException:
+            self.sink.close()
+            raise
+
+    def bytes_written(self) -> int:
+        return self.sink.tell()
+
+    def write(self, batch: pa.RecordBatch) -> None:
+        if self.row_group_size is None:
+            self.writer.write_batch(batch)
+            return
+
+        # Buffer batches into full row groups, as each Parquet write call starts a new row group
+        self._buffer.append(batch)
+        self._buffered_rows += batch.num_rows
+        if self._buffered_rows >= self.row_group_size:
+            self._flush(complete_only=True)
+
+    def _flush(self, complete_only: bool = False) -> None:
+        import pyarrow as pa
+
+        if not self._buffer:
+            return
+        table = pa.Table.from_batches(self._buffer)
+        size = table.num_rows
+        if complete_only:
+            size -= size % self.row_group_size
+        self.writer.write_table(
+            table.slice(0, size), row_group_size=self.row_group_size
+        )
+        remainder = table.slice(size)
+        self._buffer = remainder.to_batches() if remainder.num_rows else []
+        self._buffered_rows = remainder.num_rows
+
+    def close(self) -> None:
+        try:
+            self._flush()
+            self.writer.close()
+            if self._stream is not None:
+                self._stream.close()
+        finally:
+            self.sink.close()
+
+
+def write_batches(
+    reader: pa.RecordBatchReader,
+    path: str | Path,
+    file_format: str,
+    compression: str = None,
+    row_group_size: int = None,
+    max_file_bytes: int = None,
+) -> ExportResult:
+    """
+    Writes a stream of record batches to one or more files.
+
+    Parameters
+    ----------
+    reader : pyarrow.RecordBatchReader
+        The record batches to write.
+    path : str or Path
+        The output file. Its directory is created if it does not exist. With 'max_file_bytes', the files are
+        numbered from `<stem>-00000<suffixes>`.
+    file_format : {'parquet', 'csv', 'ipc'}
+        The file format.
+    compression : str, optional
+        The compression codec. Parquet defaults to 'snappy' and accepts e.g. 'zstd', 'gzip' or 'none'. CSV files
+        are uncompressed by default and accept e.g. 'gzip' or 'bz2'. Arrow IPC files are uncompressed by default
+        and accept 'lz4' or 'zstd'.
+    row_group_size : int, optional
+        The number of rows per Parquet row group. By default each batch is written as its own row group.
+    max_file_bytes : int, optional
+        Start a new file once the current one reaches this size. The check is made after each batch, so files
+        exceed the limit by up to one batch.
+
+    Returns
+    -------
+    ExportResult
+        The number of rows and bytes written, and the paths of the files written.
+
+    Raises
+    ------
+    ValueError
+        If the file format is not supported, or 'row_group_size' is given for a format other than Parquet.
+    """
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"file_format must be one of {', '.join(FILE_FORMATS)}")
+    if row_group_size is not None and file_format != "parquet":
+        raise ValueError("row_group_size is only supported for Parquet files")
+
+    path = Path(path).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rollover = max_file_bytes is not None
+
+    files, rows, total_bytes = [], 0, 0
+    writer = None
+    try:
+        for batch in reader:
+            if writer is None:
+                files.append(_file_path(path, len(files), rollover))
+                writer = _FileWriter(
+                    files[-1], reader.schema, file_format, compression, row_group_size
+                )
+            writer.write(batch)
+            rows += batch.num_rows
+
+            if rollover and writer.bytes_written() >= max_file_bytes:
+                writer.close()
+                writer = None
+                total_bytes += files[-1].stat().st_size
+
+        if not files:
+            # A result without batches still produces a file holding its schema
+            files.append(_file_path(path, 0, rollover))
+            writer = _FileWriter(
+                files[-1], reader.schema, file_format, compression, row_group_size
+            )
+
+        if writer is not None:
+            writer.close()
+            total_bytes += files[-1].stat().st_size
+    except BaseException:
+        # Close quietly so the original error is raised, and remove the incomplete output
+        if writer is not None:
+            with contextlib.suppress(Exception):
+                writer.close()
+        for file in files:
+            with contextlib.suppress(OSError):
+                file.unlink()
+        raise
+
+    return ExportResult(rows, total_bytes, [str(file) for file in files])
@@ -0,0 +1,197 @@
+"""
+This module keeps the connection pool of an engine warm and healthy, used by the Sqlconnector class to take connection
+setup and stale connections off the request path.
+
+`warm_up` opens pooled connections ahead of the first queries, concurrently so that slow logins overlap.
+`HealthChecker` runs a background thread that periodically pings the idle connections of the pool, discards those
+that fail, e.g. after a database failover, and opens replacements.
+
+Only pools that keep idle connections (QueuePool, the default for server databases and SQLite files) are warmed
+and checked. Other pools, e.g. NullPool, are left as they are.
+
+Classes:
+    HealthChecker: Periodically replaces dead idle connections of an engine's pool on a background thread.
+
+Functions:
+    warm_up: Opens connections in an engine's pool so they are ready for the first queries.
+    check_idle: Pings the idle connections of an engine's pool and replaces those that fail.
+
+Example Usage:
+    # Used within Sqlconnector class
+    warm_up(engine, 8)
+    checker = HealthChecker(engine, interval=30)
+    checker.stop()
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on connections opened at once by warm_up
+MAX_WARM_UP_WORKERS = 16
+
+# The key in a pooled connection's record_info marking it as pinged by the running check_idle
+CHECK_MARKER = "sqlconnect_health_check"
+
+
+def _keeps_idle_connections(pool) -> bool:
+    return hasattr(pool, "size") and hasattr(pool, "checkedin")
+
+
+def warm_up(engine: Engine, connections: int = None) -> int:
+    """
+    Opens connections in an engine's pool so they are ready for the first queries.
+
+    The connections are checked out at the same time, so the pool opens new ones rather than reusing one, and are
+    returned to the pool as idle connections. Connections are opened concurrently, so slow logins overlap.
+
+    Parameters
+    ----------
+    engine : sqlalchemy.engine.Engine
+        The engine whose pool is warmed.
+    connections : int, optional
+        The number of connections to have open. Defaults to the pool size, and is capped at it, as connections
+        beyond the pool size are closed when returned.
+
+    Returns
+    -------
+    int
+        The number of connections checked out, or 0 if the pool does not keep idle connections.
+    """
+    pool = engine.pool
+    if not _keeps_idle_connections(pool):
+        return 0
+    size = pool.size()
+    connections = size if connections is None else min(connections, size)
+    if connections <= 0:
+        return 0
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(
+        max_workers=min(connections, MAX_WARM_UP_WORKERS),
+        thread_name_prefix="sqlconnect-warm-up",
+    ) as executor:
+        # Each connection is held until every one is open, so none is handed out twice
+        futures = [executor.submit(pool.connect) for _ in range(connections)]
+
+    opened, error = [], None
+    for future in futures:
+        try:
+            opened.append(future.result())
+        except Exception as e:
+            error = error or e
+    for connection in opened:
+        connection.close()
+    if error is not None:
+        raise error
+    return len(opened)
+
+
+def check_idle(engine: Engine) -> int:
+    """
+    Pings the idle connections of an engine's pool and replaces those that fail.
+
+    The idle connections are checked out one at a time, pinged with the dialect's ping query (as `pool_pre_ping`
+    does) and returned before the next is checked out, so the check holds at most one connection and never
+    starves concurrent queries. Connections that fail are discarded, and are reopened by a second pass once
+    every idle connection has been pinged.
+
+    A pool returning the most recently used connection first (`pool_use_lifo=True`) hands back the connection
+    just returned, so only that connection is checked; the pool pre-ping covers the rest.
+
+    Parameters
+    ----------
+    engine : sqlalchemy.engine.Engine
+        The engine whose pool is checked.
+
+    Returns
+    -------
+    int
+        The number of connections replaced.
+    """
+    pool = engine.pool
+    if not _keeps_idle_connections(pool):
+        return 0
+
+    # Marks the connections pinged by this check, to stop when the pool hands one back again
+    checked = object()
+    dead = 0
+    for _ in range(pool.checkedin()):
+        if pool.checkedin() == 0:
+            break
+        connection = pool.connect()
+        try:
+            if connection.record_info.get(CHECK_MARKER) is checked:
+                break
+            connection.record_info[CHECK_MARKER] = checked
+            try:
+                engine.dialect.do_ping(connection.dbapi_connection)
+            except Exception as e:
+                logger.warning("Replacing a dead pooled connection: %s", e)
+                connection.invalidate(e)
+                dead += 1
+        finally:
+            connection.close()
+
+    if dead:
+        # Invalidated connections reconnect when next checked out, so cycle through the idle ones once more
+        for _ in range(pool.checkedin()):
+            pool.connect().close()
+    return dead
+
+
+class HealthChecker:
+    """
+    Periodically replaces dead idle connections of an engine's pool on a background thread.
+
+    The thread starts when the object is created and runs until `stop()` is called. It holds no reference to the
+    connector, so the connector can still be garbage collected.
+
+    Parameters
+    ----------
+    engine : sqlalchemy.engine.Engine
+        The engine whose pool is checked.
+    interval : float
+        The seconds between checks.
+    """
+
+    def __init__(self, engine: Engine, interval: float):
+        if isinstance(interval, bool) or not isinstance(interval, (int, float)):
+            raise TypeError("interval must be a number")
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+
+        self.interval = interval
+        self.checks = 0
+        self.replaced = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(engine,),
+            name="sqlconnect-health-check",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self, engine: Engine) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.replaced += check_idle(engine)
+            except Exception:
+                # The database may be unreachable; the next check tries again
+                logger.exception("Connection health check failed")
+            self.checks += 1
+
+    def stop(self) -> None:
+        """Stop the thread, waiting for a check in progress to finish. Calling `stop()` again has no effect."""
+        self._stop.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
@@ -0,0 +1,187 @@
+"""
+This module provides the state behind incremental extraction, used by `Sqlconnector.sql_to_df_incremental` to
+read only the rows added to a table since the previous read.
+
+A query is read incrementally by declaring a watermark column whose values only increase (e.g. an identity
+column or a last-modified timestamp). The largest value read is stored per connection and query, and the next
+read is restricted to rows above it. New rows can be merged into a local Parquet snapshot of the full result.
+
+Classes:
+    WatermarkStore: Persists the last watermark of each incremental query in a JSON file.
+
+Attributes:
+    watermark_store: The WatermarkStore used by default, saving to `~/.cache/sqlconnect/watermarks.json`.
+
+Functions:
+    state_key: Returns the key under which the watermark of a query is stored.
+    max_watermark: Returns the largest value of a watermark column as a plain Python value.
+    merge_snapshot: Appends new rows to a snapshot, replacing rows with the same key.
+    read_snapshot: Reads a Parquet snapshot, or returns None if it does not exist.
+    write_snapshot: Writes a Parquet snapshot atomically.
+
+Dependencies:
+    - pyarrow: Required for snapshots. Install with `pip install sqlconnect[arrow]`.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+from sqlconnect import arrow, resultcache
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _encode(value) -> dict:
+    """Encode a watermark as JSON, tagging dates and datetimes so they are restored with their type."""
+    if isinstance(value, datetime.datetime):
+        return {"type": "datetime", "value": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"type": "date", "value": value.isoformat()}
+    return {"type": "value", "value": value}
+
+
+def _decode(entry: dict):
+    if entry["type"] == "datetime":
+        return datetime.datetime.fromisoformat(entry["value"])
+    if entry["type"] == "date":
+        return datetime.date.fromisoformat(entry["value"])
+    return entry["value"]
+
+
+class WatermarkStore:
+    """
+    Persists the last watermark of each incremental query in a JSON file.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        The JSON file holding the watermarks. Its directory is created if it does not exist. Defaults to
+        `~/.cache/sqlconnect/watermarks.json`.
+
+    Notes
+    -----
+    Watermarks may be integers, floats, strings, dates or datetimes. The file is re-read on every access and
+    replaced atomically on every update, so several processes can share it.
+    """
+
+    def __init__(self, path: str | Path = None):
+        self.path = (
+            Path(path).expanduser()
+            if path is not None
+            else Path.home() / ".cache" / "sqlconnect" / "watermarks.json"
+        )
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _save(self, entries: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(entries, file, indent=2)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def get(self, key: str):
+        """Return the stored watermark for `key`, or None if there is none."""
+        with self._lock:
+            entry = self._load().get(key)
+        return _decode(entry) if entry is not None else None
+
+    def set(self, key: str, value) -> None:
+        """Store the watermark for `key`."""
+        with self._lock:
+            entries = self._load()
+            entries[key] = _encode(value)
+            self._save(entries)
+
+    def delete(self, key: str) -> None:
+        """Remove the watermark for `key`, so that the next read is a full read."""
+        with self._lock:
+            entries = self._load()
+            if entries.pop(key, None) is not None:
+                self._save(entries)
+
+
+# The store used when no other is given
+watermark_store = WatermarkStore()
+
+
+def state_key(connection: str, query: str, watermark_column: str) -> str:
+    """Returns the key under which the watermark of a query is stored."""
+    return resultcache.cache_key(connection, query, watermark_column=watermark_column)
+
+
+def max_watermark(df: pd.DataFrame, watermark_column: str):
+    """Returns the largest value of a watermark column as a plain Python value, or None if it has none."""
+    import pandas as pd
+
+    value = df[watermark_column].max()
+    if pd.isna(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value.item() if hasattr(value, "item") else value
+
+
+def merge_snapshot(
+    snapshot: Optional[pd.DataFrame], new_rows: pd.DataFrame, key_columns: list = None
+) -> pd.DataFrame:
+    """
+    Appends new rows to a snapshot.
+
+    If 'key_columns' are given, a new row replaces any snapshot row with the same key, so updated rows
+    (e.g. tracked by a last-modified watermark) are not duplicated.
+    """
+    import pandas as pd
+
+    if snapshot is None:
+        merged = new_rows.reset_index(drop=True)
+    else:
+        merged = pd.concat([snapshot, new_rows], ignore_index=True)
+    if key_columns:
+        merged = merged.drop_duplicates(subset=key_columns, keep="last")
+        merged = merged.reset_index(drop=True)
+    return merged
+
+
+def read_snapshot(path: str | Path) -> Optional[pd.DataFrame]:
+    """Reads a Parquet snapshot, or returns None if it does not exist."""
+    arrow.import_pyarrow()
+    import pandas as pd
+
+    path = Path(path).expanduser()
+    if not path.exists():
+        return None
+    return pd.read_parquet(path)
+
+
+def write_snapshot(df: pd.DataFrame, path: str | Path) -> None:
+    """Writes a Parquet snapshot to a temporary file and renames it, so readers never see a partial file."""
+    arrow.import_pyarrow()
+
+    path = Path(path).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
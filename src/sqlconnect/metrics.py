@@ -0,0 +1,318 @@
+"""
+This module provides opt-in instrumentation of Sqlconnector calls, enabled with `Sqlconnector(..., instrument=True)`.
+
+Each instrumented call is split into phases using SQLAlchemy pool and cursor events: the wait to check out a pooled
+connection, the time spent executing statements, and the remainder spent fetching rows and building or converting
+DataFrames. Row counts, approximate bytes and pool occupancy are recorded alongside, totals are kept per operation,
+and each call's metrics are passed to registered callbacks, e.g. to forward them to Prometheus or StatsD.
+
+When instrumentation is not enabled no event listeners are registered, so uninstrumented connectors pay nothing.
+
+Classes:
+    CallMetrics: The metrics of one instrumented call.
+    Instrumentation: Records the metrics of calls made through one engine.
+
+Example Usage:
+    >>> import sqlconnect as sc
+    >>>
+    >>> connection = sc.Sqlconnector("My_Database", instrument=True)
+    >>> connection.instrumentation.add_callback(lambda m: statsd.timing(f"sql.{m.operation}", m.elapsed))
+    >>> df = connection.sql_to_df("path/to/sql_query.sql")
+    >>> connection.stats()["operations"]["sql_to_df"]["execute"]
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+
+logger = logging.getLogger(__name__)
+
+# The totals kept per operation by Instrumentation.stats
+_TOTALS = (
+    "calls",
+    "errors",
+    "elapsed",
+    "checkout",
+    "execute",
+    "process",
+    "rows",
+    "bytes",
+)
+
+
+class CallMetrics(NamedTuple):
+    """
+    The metrics of one instrumented call. Times are in seconds.
+
+    Attributes
+    ----------
+    operation : str
+        The Sqlconnector method, e.g. 'sql_to_df' or 'df_to_sql'.
+    statement : str or None
+        The SQL text of a query or command, or the table name written to.
+    elapsed : float
+        The total duration of the call.
+    checkout : float
+        The time from the start of the call until a pooled connection was checked out, including any wait for a
+        free connection.
+    execute : float
+        The time spent executing statements on the database cursor.
+    process : float
+        The remaining time: fetching rows and building the DataFrame for reads, converting rows for writes.
+    rows : int or None
+        The number of rows returned or written, if known. Chunked reads return before rows are fetched.
+    bytes : int or None
+        The approximate size of the rows returned or written, from `DataFrame.memory_usage(deep=False)`.
+    pool_checked_out : int or None
+        The number of connections checked out of the pool, including this call's, at checkout.
+    pool_capacity : int or None
+        The number of connections the pool can hand out, or None if unbounded.
+    statements : int
+        The number of statements executed.
+    params : object
+        The query parameters of the call, if any.
+    error : str or None
+        The exception raised by the call, if it failed.
+    """
+
+    operation: str
+    statement: Optional[str]
+    elapsed: float
+    checkout: float
+    execute: float
+    process: float
+    rows: Optional[int]
+    bytes: Optional[int]
+    pool_checked_out: Optional[int]
+    pool_capacity: Optional[int]
+    statements: int
+    params: object
+    error: Optional[str]
+
+
+class _Call:
+    """The metrics of a call in progress, updated by the event listeners on the calling thread."""
+
+    __slots__ = (
+        "start",
+        "checkout",
+        "execute",
+        "execute_start",
+        "statements",
+        "pool_checked_out",
+        "rows",
+        "bytes",
+        "params",
+    )
+
+    def __init__(self, params=None):
+        self.start = time.perf_counter()
+        self.checkout = None
+        self.execute = 0.0
+        self.execute_start = None
+        self.statements = 0
+        self.pool_checked_out = None
+        self.rows = None
+        self.bytes = None
+        self.params = params
+
+    def set_result(self, result) -> None:
+        """Record the rows and approximate bytes of a DataFrame or Arrow table, or a row count."""
+        if hasattr(result, "memory_usage"):
+            self.rows = len(result)
+            self.bytes = int(result.memory_usage(deep=False).sum())
+        elif hasattr(result, "num_rows"):
+            self.rows = result.num_rows
+            self.bytes = result.nbytes
+        elif isinstance(result, int):
+            self.rows = result
+
+
+class _Unmeasured:
+    """A reusable stand-in for `Instrumentation.measure` when instrumentation is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def set_result(self, result) -> None:
+        pass
+
+
+NOT_MEASURED = _Unmeasured()
+
+
+class Instrumentation:
+    """
+    Records the metrics of calls made through one engine.
+
+    Parameters
+    ----------
+    engine : sqlalchemy.engine.Engine
+        The engine to listen to. Only calls measured with `measure` on this object are recorded, so an engine
+        shared with other connectors is measured only for this connector's calls.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self._totals = {}
+        self._listeners = [
+            (engine.pool, "checkout", self._on_checkout),
+            (engine, "before_cursor_execute", self._before_execute),
+            (engine, "after_cursor_execute", self._after_execute),
+        ]
+
+        from sqlalchemy import event
+
+        for target, name, listener in self._listeners:
+            event.listen(target, name, listener)
+
+    def close(self) -> None:
+        """Remove the event listeners from the engine. Calling `close()` more than once has no further effect."""
+        from sqlalchemy import event
+
+        listeners, self._listeners = self._listeners, []
+        for target, name, listener in listeners:
+            event.remove(target, name, listener)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        call = getattr(self._local, "call", None)
+        if call is not None and call.checkout is None:
+            call.checkout = time.perf_counter() - call.start
+            pool = self.engine.pool
+            if hasattr(pool, "checkedout"):
+                call.pool_checked_out = pool.checkedout()
+
+    def _before_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        call = getattr(self._local, "call", None)
+        if call is not None:
+            call.execute_start = time.perf_counter()
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        call = getattr(self._local, "call", None)
+        if call is not None and call.execute_start is not None:
+            call.execute += time.perf_counter() - call.execute_start
+            call.execute_start = None
+            call.statements += 1
+
+    @contextmanager
+    def measure(
+        self, operation: str, statement: str = None, params=None
+    ) -> Iterator[_Call]:
+        """
+        Measure a call on the current thread, yielding an object whose `set_result` records its rows and bytes.
+
+        Calls nested in a measured call on the same thread are counted as part of the outer call.
+        """
+        outer = getattr(self._local, "call", None)
+        if outer is not None:
+            yield outer
+            return
+
+        from sqlconnect import parallel
+
+        call = _Call(params)
+        self._local.call = call
+        error = None
+        try:
+            yield call
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self._local.call = None
+            elapsed = time.perf_counter() - call.start
+            checkout = call.checkout or 0.0
+            self._record(
+                CallMetrics(
+                    operation=operation,
+                    statement=statement,
+                    elapsed=elapsed,
+                    checkout=checkout,
+                    execute=call.execute,
+                    process=max(0.0, elapsed - checkout - call.execute),
+                    rows=call.rows,
+                    bytes=call.bytes,
+                    pool_checked_out=call.pool_checked_out,
+                    pool_capacity=parallel.pool_capacity(self.engine),
+                    statements=call.statements,
+                    params=call.params,
+                    error=error,
+                )
+            )
+
+    def _record(self, metrics: CallMetrics) -> None:
+        with self._lock:
+            totals = self._totals.setdefault(
+                metrics.operation, dict.fromkeys(_TOTALS, 0)
+            )
+            totals["calls"] += 1
+            totals["errors"] += metrics.error is not None
+            totals["elapsed"] += metrics.elapsed
+            totals["checkout"] += metrics.checkout
+            totals["execute"] += metrics.execute
+            totals["process"] += metrics.process
+            totals["rows"] += metrics.rows or 0
+            totals["bytes"] += metrics.bytes or 0
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
+            try:
+                callback(metrics)
+            except Exception:
+                # A failing callback must not fail the query it reports on
+                logger.exception("Instrumentation callback %r failed", callback)
+
+    def add_callback(self, callback: Callable[[CallMetrics], None]) -> None:
+        """Call `callback` with the CallMetrics of every instrumented call, on the thread that made the call."""
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[CallMetrics], None]) -> None:
+        """Stop calling `callback`."""
+        with self._lock:
+            self._callbacks.remove(callback)
+
+    def stats(self) -> dict:
+        """
+        Return a snapshot of the totals per operation and the current pool occupancy.
+
+        Returns
+        -------
+        dict
+            {"operations": {operation: {calls, errors, elapsed, checkout, execute, process, rows, bytes}},
+            "pool": {checked_out, capacity}}
+        """
+        from sqlconnect import parallel
+
+        pool = self.engine.pool
+        with self._lock:
+            operations = {name: dict(totals) for name, totals in self._totals.items()}
+        return {
+            "operations": operations,
+            "pool": {
+                "checked_out": pool.checkedout()
+                if hasattr(pool, "checkedout")
+                else None,
+                "capacity": parallel.pool_capacity(self.engine),
+            },
+        }
+
+    def reset(self) -> None:
+        """Clear the totals."""
+        with self._lock:
+            self._totals.clear()
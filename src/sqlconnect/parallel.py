@@ -0,0 +1,203 @@
+"""
+This module provides concurrent execution of independent queries, used by `Sqlconnector.sql_to_dfs` to run many
+queries at once on a thread pool sized to the connector's connection pool.
+
+Classes:
+    QueryResult: The outcome of one query run concurrently.
+    QueryBatchError: Raised when one or more queries of a batch fail.
+
+Functions:
+    pool_capacity: Returns the number of connections an engine's pool can hand out at once.
+    run_concurrently: Runs callables on a thread pool, yielding a QueryResult as each completes.
+    render_literal: Renders a Python value as a SQL literal in a dialect, with dates comparable to any date type.
+"""
+
+from __future__ import annotations
+
+import datetime
+import time
+from typing import TYPE_CHECKING, Callable, Iterator, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from sqlalchemy import Dialect, Engine
+
+# Upper bound on worker threads when the pool does not limit connections (e.g. NullPool)
+MAX_WORKERS = 32
+
+
+class QueryResult(NamedTuple):
+    """The outcome of one query run concurrently: its DataFrame or error, and the seconds it took."""
+
+    key: str
+    df: Optional[pd.DataFrame]
+    error: Optional[Exception]
+    elapsed: float
+
+
+class QueryBatchError(RuntimeError):
+    """
+    Raised when one or more queries of a batch fail, after every query has completed.
+
+    Attributes
+    ----------
+    results : dict
+        The DataFrames of the queries that succeeded, by key.
+    errors : dict
+        The exceptions of the queries that failed, by key.
+    """
+
+    def __init__(self, results: dict, errors: dict):
+        self.results = results
+        self.errors = errors
+        details = "; ".join(f"{key}: {error}" for key, error in errors.items())
+        super().__init__(
+            f"{len(errors)} of {len(results) + len(errors)} queries failed: {details}"
+        )
+
+
+def pool_capacity(engine: Engine) -> Optional[int]:
+    """
+    Returns the number of connections an engine's pool can hand out at once, or None if it is unbounded.
+
+    Pools that share a single connection (StaticPool, SingletonThreadPool) report 1 so that the connection is
+    never used from two threads at the same time.
+    """
+    pool = engine.pool
+    pool_name = type(pool).__name__
+    if pool_name in ("StaticPool", "SingletonThreadPool", "AssertionPool"):
+        return 1
+    if not hasattr(pool, "size"):
+        return None
+
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    if max_overflow < 0:
+        return None
+    return pool.size() + max_overflow
+
+
+def run_concurrently(tasks: dict, max_workers: int) -> Iterator[QueryResult]:
+    """
+    Runs callables on a thread pool, yielding a QueryResult as each completes.
+
+    Parameters
+    ----------
+    tasks : dict
+        Callables taking no arguments and returning a DataFrame, by key.
+    max_workers : int
+        The number of worker threads.
+
+    Yields
+    ------
+    QueryResult
+        The result of each task in order of completion. A failing task yields its exception
+        rather than raising, so the remaining tasks are not cancelled.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    def timed(key: str, task: Callable) -> QueryResult:
+        start = time.perf_counter()
+        try:
+            df = task()
+        except Exception as e:
+            return QueryResult(key, None, e, time.perf_counter() - start)
+        return QueryResult(key, df, None, time.perf_counter() - start)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(timed, key, task) for key, task in tasks.items()]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def partition_predicates(
+    column: str,
+    lower_bound,
+    upper_bound,
+    num_partitions: int,
+    render_literal: Callable = repr,
+) -> list:
+    """
+    Returns WHERE clause predicates splitting a column's range into contiguous partitions.
+
+    The range from `lower_bound` to `upper_bound` is divided into `num_partitions` strides of equal width.
+    As in Spark's JDBC partitioned read, the bounds only decide the stride: rows below `lower_bound` (and NULLs)
+    fall in the first partition and rows above `upper_bound` in the last, so every row is read exactly once.
+
+    Parameters
+    ----------
+    column : str
+        The quoted name of the partition column.
+    lower_bound, upper_bound : int, float, datetime or date
+        The range to divide. Any type supporting subtraction and division of the difference works.
+    num_partitions : int
+        The number of partitions. Reduced if the range has fewer distinct integer values.
+    render_literal : callable, default repr
+        A function rendering a boundary value as a SQL literal.
+
+    Returns
+    -------
+    list of str
+        The predicates, one per partition, in ascending order of the partition column.
+
+    Raises
+    ------
+    ValueError
+        If `num_partitions` is not positive or `upper_bound` is below `lower_bound`.
+    """
+    if not isinstance(num_partitions, int) or num_partitions < 1:
+        raise ValueError("num_partitions must be a positive integer")
+    if upper_bound < lower_bound:
+        raise ValueError("upper_bound must not be less than lower_bound")
+
+    span = upper_bound - lower_bound
+    if isinstance(span, int):
+        num_partitions = max(1, min(num_partitions, span))
+    if num_partitions == 1:
+        return ["1 = 1"]
+
+    stride = span / num_partitions
+    if isinstance(span, int):
+        stride = max(1, span // num_partitions)
+    bounds = [
+        render_literal(lower_bound + stride * i) for i in range(1, num_partitions)
+    ]
+
+    predicates = [f"{column} < {bounds[0]} OR {column} IS NULL"]
+    predicates += [
+        f"{column} >= {low} AND {column} < {high}"
+        for low, high in zip(bounds, bounds[1:])
+    ]
+    predicates.append(f"{column} >= {bounds[-1]}")
+    return predicates
+
+
+def restrict_query(query: str, predicate: str) -> str:
+    """Wrap a query as a subquery restricted by a WHERE clause predicate."""
+    query = query.strip().rstrip(";")
+    return f"SELECT * FROM ({query}) sqlconnect_partition WHERE {predicate}"
+
+
+def render_literal(value, dialect: Dialect) -> str:
+    """
+    Renders a Python value as a SQL literal in a dialect, used for watermarks and partition bounds.
+
+    SQLAlchemy renders dates and datetimes as plain strings, which SQL Server converts according to the session's
+    language and DATEFORMAT and rejects for DATETIME columns when they have more than three fractional digits.
+    On SQL Server they are therefore converted explicitly from ISO 8601 to DATE, DATETIME2 or DATETIMEOFFSET,
+    which compare with every date and time type. Other values, and all values in other dialects, are rendered
+    by SQLAlchemy.
+    """
+    if dialect.name == "mssql" and isinstance(value, datetime.date):
+        if not isinstance(value, datetime.datetime):
+            return f"CONVERT(date, '{value.isoformat()}', 23)"
+        text = value.isoformat(timespec="microseconds")
+        if value.tzinfo is not None:
+            return f"CONVERT(datetimeoffset, '{text}', 127)"
+        return f"CONVERT(datetime2, '{text}', 126)"
+
+    from sqlalchemy import literal
+
+    return str(
+        literal(value).compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    )
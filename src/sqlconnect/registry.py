@@ -0,0 +1,165 @@
+"""
+This module provides a process-wide registry of SQLAlchemy engines, used by the Sqlconnector class so that
+connectors built from identical configurations share a single engine and therefore a single connection pool.
+
+Engines are keyed by the fully rendered database URL (including credentials) together with the options passed
+to `sqlalchemy.create_engine`. Each acquisition increments a reference count and each release decrements it;
+an engine is disposed, closing its pooled connections, once its last reference is released. Background health
+checks are counted the same way, so connectors sharing an engine share one health check thread.
+
+Functions:
+    acquire_engine: Returns a shared engine for a URL and options, creating it on first use.
+    release_engine: Releases a reference to a shared engine, disposing it when no references remain.
+    dispose_all: Disposes every registered engine and empties the registry.
+    acquire_health_checker: Returns the health checker of an engine, starting it on first use.
+    release_health_checker: Releases a reference to the health checker of an engine, stopping it when no
+        references remain.
+
+Used By:
+    - Sqlconnector: Acquires an engine, and a health checker if enabled, on instantiation and releases them on
+      `close()` or garbage collection.
+
+Example Usage:
+    # Used within Sqlconnector class
+    engine, key = acquire_engine(db_url)
+    ...
+    release_engine(key, engine)
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy import URL
+    from sqlalchemy.engine import Engine
+    from sqlconnect.health import HealthChecker
+
+# Re-entrant, as a connector garbage collected while the lock is held releases its engine from the same thread
+_lock = threading.RLock()
+_engines = {}  # key -> [engine, reference count]
+_health_checkers = {}  # id(engine) -> [engine, HealthChecker, reference count]
+
+
+def _freeze(value):
+    """Return a hashable representation of an engine option value."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def engine_key(url: URL, engine_options: dict = None) -> tuple:
+    """Return the registry key for a database URL and a dictionary of `create_engine` options."""
+    return (
+        url.render_as_string(hide_password=False),
+        _freeze(engine_options or {}),
+    )
+
+
+def acquire_engine(url: URL, engine_options: dict = None) -> tuple:
+    """
+    Returns a shared SQLAlchemy engine for the given URL and options, creating it on first use.
+
+    Parameters
+    ----------
+    url : URL
+        The database connection URL.
+    engine_options : dict, optional
+        Keyword arguments passed to `sqlalchemy.create_engine` when the engine is first created.
+
+    Returns
+    -------
+    tuple
+        The engine and the registry key, both of which must be passed to `release_engine`.
+    """
+    key = engine_key(url, engine_options)
+    with _lock:
+        entry = _engines.get(key)
+        if entry is None:
+            import sqlalchemy
+
+            entry = [sqlalchemy.create_engine(url, **(engine_options or {})), 0]
+            _engines[key] = entry
+        entry[1] += 1
+        return entry[0], key
+
+
+def release_engine(key: tuple, engine) -> None:
+    """
+    Release a reference to a shared engine, disposing the engine when no references remain.
+
+    Releases of an engine no longer registered under its key, e.g. after `dispose_all()` replaced it with a new
+    engine for the same key, are ignored, so they cannot release a reference held by another connector.
+    """
+    with _lock:
+        entry = _engines.get(key)
+        if entry is None or entry[0] is not engine:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _engines[key]
+    entry[0].dispose()
+
+
+def dispose_all() -> None:
+    """
+    Dispose every registered engine and empty the registry.
+
+    Connectors still holding a disposed engine remain usable; SQLAlchemy opens fresh connections on next use.
+    """
+    with _lock:
+        entries = list(_engines.values())
+        _engines.clear()
+    for engine, _ in entries:
+        engine.dispose()
+
+
+def acquire_health_checker(engine: Engine, interval: float) -> HealthChecker:
+    """
+    Returns the health checker of an engine, starting it on first use.
+
+    Connectors sharing an engine share its health checker, so the engine's pool is checked by a single thread.
+    The interval of the first connector applies until every connector has released the checker.
+
+    Parameters
+    ----------
+    engine : Engine
+        The engine whose pool is checked.
+    interval : float
+        The seconds between checks, used when the checker is started.
+
+    Returns
+    -------
+    HealthChecker
+        The running health checker, to be released with `release_health_checker`.
+    """
+    with _lock:
+        entry = _health_checkers.get(id(engine))
+        if entry is None:
+            from sqlconnect import health
+
+            entry = [engine, health.HealthChecker(engine, interval), 0]
+            _health_checkers[id(engine)] = entry
+        entry[2] += 1
+        return entry[1]
+
+
+def release_health_checker(engine: Engine) -> None:
+    """Release a reference to the health checker of an engine, stopping it when no references remain."""
+    with _lock:
+        entry = _health_checkers.get(id(engine))
+        if entry is None:
+            return
+        entry[2] -= 1
+        if entry[2] > 0:
+            return
+        del _health_checkers[id(engine)]
+    entry[1].stop()
@@ -0,0 +1,353 @@
+"""
+This module provides opt-in caches of query results, used by the Sqlconnector class through the `cache` argument
+of `sql_to_df` and `sql_to_df_str` so that repeated reads of the same query are served without the database.
+
+Results are keyed by a hash of the connection, the normalised SQL text, the query parameters and the options
+that shape the returned DataFrame.
+
+Classes:
+    ResultCache: Abstract base class for result caches.
+    DiskResultCache: Stores results as Parquet or Arrow IPC files in a directory, with TTL and LRU eviction.
+    MemoryResultCache: Holds results in process memory within a byte budget, with TTL and LRU eviction.
+
+Functions:
+    normalize_sql: Collapses whitespace outside string literals and strips a trailing semicolon.
+    cache_key: Returns the cache key of a query.
+
+Dependencies:
+    - pyarrow: Required by DiskResultCache. Install with `pip install sqlconnect[arrow]`.
+    - pandas: MemoryResultCache measures entries with `DataFrame.memory_usage(deep=True)`.
+
+Example Usage:
+    >>> import sqlconnect as sc
+    >>> from sqlconnect.resultcache import DiskResultCache
+    >>>
+    >>> connection = sc.Sqlconnector("My_Database", result_cache=DiskResultCache("~/.cache/sqlconnect", ttl=3600))
+    >>> df = connection.sql_to_df("monthly_revenue.sql", cache=True)  # Read from the database
+    >>> df = connection.sql_to_df("monthly_revenue.sql", cache=True)  # Read from the cache
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# String literals and quoted identifiers, whose whitespace is significant
+_QUOTED = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")""")
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace outside string literals and quoted identifiers, and strip a trailing semicolon."""
+    parts = _QUOTED.split(sql.strip().rstrip(";").strip())
+    # Odd parts are the quoted sections captured by the split
+    return "".join(
+        part if i % 2 else re.sub(r"\s+", " ", part) for i, part in enumerate(parts)
+    )
+
+
+def _stable_repr(value) -> str:
+    """Return a representation of a value that does not depend on dict ordering."""
+    if isinstance(value, dict):
+        items = sorted((repr(k), _stable_repr(v)) for k, v in value.items())
+        return "{" + ", ".join(f"{k}: {v}" for k, v in items) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_stable_repr(v) for v in value) + "]"
+    return repr(value)
+
+
+def cache_key(connection: str, sql: str, params=None, **options) -> str:
+    """
+    Returns the cache key of a query.
+
+    Parameters
+    ----------
+    connection : str
+        Identifies the database, e.g. the connection name and URL without password.
+    sql : str
+        The SQL text, normalised with `normalize_sql`.
+    params : list, tuple or dict, optional
+        The query parameters.
+    **options
+        Further options that change the returned DataFrame, e.g. 'index_col' or 'dtype'.
+
+    Returns
+    -------
+    str
+        A hexadecimal SHA-256 digest.
+    """
+    payload = "\n".join(
+        [connection, normalize_sql(sql), _stable_repr(params), _stable_repr(options)]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache(ABC):
+    """
+    Abstract base class for result caches.
+
+    Subclasses must implement `get`, `put`, `invalidate` and `clear`, and count hits and misses in `stats`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """Return the cached DataFrame for `key`, or None if it is missing or expired."""
+
+    @abstractmethod
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """Store a DataFrame under `key`."""
+
+    @abstractmethod
+    def invalidate(self, key: str) -> None:
+        """Remove the entry for `key`, if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    def stats(self) -> dict:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[counter] += amount
+
+
+class DiskResultCache(ResultCache):
+    """
+    Stores query results as Parquet or Arrow IPC files in a directory.
+
+    Parameters
+    ----------
+    directory : str or Path, optional
+        The directory holding the cached files. Created if it does not exist. Defaults to
+        `~/.cache/sqlconnect`.
+    ttl : float, optional
+        Seconds after which an entry expires. By default entries do not expire.
+    max_bytes : int, optional
+        The maximum total size of the cached files. When exceeded, the least recently used files are
+        removed. By default the size is not limited.
+    file_format : {'parquet', 'ipc'}, default 'parquet'
+        Store results as Parquet files, or as uncompressed Arrow IPC (Feather) files that load faster.
+
+    Notes
+    -----
+    The DataFrame index is preserved. The last use of an entry is tracked by the access time of its file, set
+    explicitly on every hit, and its age by the modification time. Files are written to a temporary file and
+    renamed, so concurrent readers never see a partial file.
+    """
+
+    SUFFIXES = {"parquet": ".parquet", "ipc": ".arrow"}
+
+    def __init__(
+        self,
+        directory: str | Path = None,
+        ttl: float = None,
+        max_bytes: int = None,
+        file_format: str = "parquet",
+    ):
+        super().__init__()
+        if file_format not in self.SUFFIXES:
+            raise ValueError("file_format must be 'parquet' or 'ipc'")
+        self.directory = (
+            Path(directory).expanduser()
+            if directory is not None
+            else Path.home() / ".cache" / "sqlconnect"
+        )
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.file_format = file_format
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.SUFFIXES[self.file_format]}"
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        path = self._path(key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+
+        now = time.time()
+        if self.ttl is not None and now - stat.st_mtime > self.ttl:
+            path.unlink(missing_ok=True)
+            self._count("misses")
+            return None
+
+        try:
+            table = self._read(path)
+        except FileNotFoundError:
+            # Removed by another process since the stat
+            self._count("misses")
+            return None
+
+        os.utime(path, (now, stat.st_mtime))
+        self._count("hits")
+        return table.to_pandas()
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(df)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            self._write(table, temp_path)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+        if self.max_bytes is not None:
+            self._evict()
+
+    def _read(self, path: Path):
+        if self.file_format == "parquet":
+            import pyarrow.parquet as pq
+
+            return pq.read_table(path)
+
+        import pyarrow.feather as feather
+
+        return feather.read_table(path, memory_map=True)
+
+    def _write(self, table, path: str) -> None:
+        if self.file_format == "parquet":
+            import pyarrow.parquet as pq
+
+            pq.write_table(table, path)
+        else:
+            import pyarrow.feather as feather
+
+            feather.write_feather(table, path, compression="uncompressed")
+
+    def _evict(self) -> None:
+        """Remove the least recently used files until the total size is within max_bytes."""
+        entries = []
+        for path in self.directory.glob(f"*{self.SUFFIXES[self.file_format]}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self._count("evictions")
+
+    def invalidate(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path in self.directory.glob(f"*{self.SUFFIXES[self.file_format]}"):
+            path.unlink(missing_ok=True)
+
+
+class MemoryResultCache(ResultCache):
+    """
+    Holds query results in process memory within a byte budget.
+
+    Parameters
+    ----------
+    max_bytes : int, default 256 MiB
+        The maximum total size of the cached DataFrames, measured with `DataFrame.memory_usage(deep=True)`.
+        When exceeded, the least recently used entries are evicted. A DataFrame larger than the budget is
+        not cached.
+    ttl : float, optional
+        Seconds after which an entry expires. By default entries do not expire.
+    copy : bool, default True
+        Store and return deep copies, so that modifying a returned DataFrame never alters the cache. With
+        False, entries are stored as given and returned as shallow copies, which avoids copying but is only safe
+        with pandas Copy-on-Write enabled (the default from pandas 3.0).
+
+    Notes
+    -----
+    `stats()` reports hits, misses, evictions, the number of entries and the bytes held.
+    """
+
+    def __init__(
+        self, max_bytes: int = 256 * 1024 * 1024, ttl: float = None, copy: bool = True
+    ):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.copy = copy
+        self._entries = OrderedDict()  # key -> (DataFrame, bytes, expiry time)
+        self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry[2] is not None
+                and entry[2] < time.monotonic()
+            ):
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            df = entry[0]
+        return df.copy(deep=self.copy)
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            # Too large to cache, but a previous result for the key must not be served in its place
+            self.invalidate(key)
+            return
+        if self.copy:
+            df = df.copy(deep=True)
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (df, size, expires)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "bytes": self._bytes}
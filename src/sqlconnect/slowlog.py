@@ -0,0 +1,221 @@
+"""
+This module provides the slow-query log used by the Sqlconnector class when a connection configures a
+'slow_query' section in `sqlconnect.yaml`.
+
+Calls taking longer than the threshold are logged to the 'sqlconnect.slowlog' logger with a fingerprint of the SQL,
+its parameters and the checkout, execute and process times recorded by `sqlconnect.metrics`. Optionally the
+execution plan of slow queries is captured on a background thread using a separate pooled connection, so the caller
+is not delayed, and logged with the same fingerprint.
+
+Classes:
+    SlowQueryLog: Logs instrumented calls exceeding a threshold, optionally with their execution plan.
+
+Functions:
+    fingerprint: Returns a short hash identifying a SQL statement regardless of its literals and whitespace.
+    explain_statements: Returns the statements capturing the execution plan of a query for a SQLAlchemy dialect.
+
+Plans by dialect:
+    - sqlite: `EXPLAIN QUERY PLAN`.
+    - postgresql, mysql, mariadb: `EXPLAIN`. The query is planned but not run.
+    - mssql: `SET SHOWPLAN_XML ON`, returning the plan XML instead of running the query.
+    - oracle: `EXPLAIN PLAN FOR`, read back with `DBMS_XPLAN.DISPLAY`.
+
+Example Usage:
+    # Configured in sqlconnect.yaml
+    connections:
+      Reporting:
+        ...
+        slow_query:
+          threshold: 5.0 # Seconds
+          explain: true
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+from sqlconnect.resultcache import normalize_sql
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+    from sqlconnect.metrics import CallMetrics
+
+logger = logging.getLogger(__name__)
+
+# Operations whose statement is a query that can be explained
+EXPLAINED_OPERATIONS = (
+    "sql_to_df",
+    "sql_to_df_str",
+    "sql_to_arrow",
+    "sql_to_arrow_str",
+    "sql_to_parquet",
+    "sql_to_csv",
+    "sql_to_ipc",
+)
+
+# Parameters longer than this are truncated in the log
+MAX_PARAMS_LENGTH = 1000
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Returns a short hash identifying a SQL statement regardless of its literals and whitespace.
+
+    String and numeric literals are replaced with '?' before hashing, so a query run with different values inlined
+    has the same fingerprint.
+    """
+    template = _LITERALS.sub("?", normalize_sql(sql))
+    return hashlib.sha256(template.encode("utf-8")).hexdigest()[:16]
+
+
+def explain_statements(dialect_name: str, sql: str) -> tuple:
+    """
+    Returns the statements capturing the execution plan of a query for a SQLAlchemy dialect.
+
+    Parameters
+    ----------
+    dialect_name : str
+        The name of the dialect, e.g. 'postgresql'.
+    sql : str
+        The query to explain.
+
+    Returns
+    -------
+    tuple of (str, bool)
+        The statements to run in order, each with whether it takes the query's parameters. The rows of the last
+        statement are the plan.
+
+    Raises
+    ------
+    ValueError
+        If plans cannot be captured for the dialect.
+    """
+    sql = sql.strip().rstrip(";")
+    if dialect_name == "sqlite":
+        return ((f"EXPLAIN QUERY PLAN {sql}", True),)
+    if dialect_name in ("postgresql", "mysql", "mariadb"):
+        return ((f"EXPLAIN {sql}", True),)
+    if dialect_name == "mssql":
+        return (("SET SHOWPLAN_XML ON", False), (sql, True))
+    if dialect_name == "oracle":
+        return (
+            (f"EXPLAIN PLAN FOR {sql}", True),
+            ("SELECT plan_table_output FROM TABLE(DBMS_XPLAN.DISPLAY())", False),
+        )
+    raise ValueError(f"Execution plans are not supported for dialect '{dialect_name}'")
+
+
+def _driver_params(params):
+    """Return query parameters in the form accepted by `Connection.exec_driver_sql`."""
+    if params is None or isinstance(params, (Mapping, tuple)):
+        return params
+    return tuple(params)
+
+
+def _truncate(value) -> str:
+    text = repr(value)
+    if len(text) > MAX_PARAMS_LENGTH:
+        return text[:MAX_PARAMS_LENGTH] + "..."
+    return text
+
+
+class SlowQueryLog:
+    """
+    Logs instrumented calls exceeding a threshold, optionally with their execution plan.
+
+    Add an instance as a callback of `sqlconnect.metrics.Instrumentation`.
+
+    Parameters
+    ----------
+    engine : sqlalchemy.engine.Engine
+        The engine the calls are made through, used to capture plans.
+    threshold : float
+        The duration in seconds above which a call is logged.
+    explain : bool, default False
+        Capture and log the execution plan of slow queries. One plan is captured at a time; slow queries finishing
+        while a plan is being captured are logged without one.
+    """
+
+    def __init__(self, engine: Engine, threshold: float, explain: bool = False):
+        self.engine = engine
+        self.threshold = threshold
+        self.explain = explain
+        self._explaining = threading.Lock()
+        self._thread = None
+
+    def __call__(self, metrics: CallMetrics) -> None:
+        if metrics.elapsed < self.threshold:
+            return
+
+        statement = metrics.statement or ""
+        key = fingerprint(statement)
+        logger.warning(
+            "Slow %s (%.3fs > %.3fs) fingerprint=%s checkout=%.3fs execute=%.3fs process=%.3fs rows=%s "
+            "params=%s error=%s sql=%s",
+            metrics.operation,
+            metrics.elapsed,
+            self.threshold,
+            key,
+            metrics.checkout,
+            metrics.execute,
+            metrics.process,
+            metrics.rows,
+            _truncate(metrics.params),
+            metrics.error,
+            normalize_sql(statement),
+        )
+
+        if (
+            self.explain
+            and metrics.operation in EXPLAINED_OPERATIONS
+            and metrics.statement
+            and self._explaining.acquire(blocking=False)
+        ):
+            self._thread = threading.Thread(
+                target=self._log_plan,
+                args=(statement, metrics.params, key),
+                name="sqlconnect-explain",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _log_plan(self, sql: str, params, key: str) -> None:
+        try:
+            statements = explain_statements(self.engine.dialect.name, sql)
+            with self.engine.connect() as connection:
+                try:
+                    for statement, takes_params in statements:
+                        if takes_params and params is not None:
+                            result = connection.exec_driver_sql(
+                                statement, _driver_params(params)
+                            )
+                        else:
+                            result = connection.exec_driver_sql(statement)
+                    rows = result.fetchall() if result.returns_rows else []
+                    if self.engine.dialect.name == "mssql":
+                        connection.exec_driver_sql("SET SHOWPLAN_XML OFF")
+                    # Roll back anything explaining wrote, e.g. Oracle's PLAN_TABLE
+                    connection.rollback()
+                except BaseException:
+                    # The connection may be left in a plan-only mode such as SHOWPLAN_XML, in which later
+                    # statements return plans instead of running, so it is discarded rather than pooled
+                    connection.invalidate()
+                    raise
+            plan = "\n".join(" ".join(str(value) for value in row) for row in rows)
+            logger.warning("Plan for fingerprint=%s:\n%s", key, plan)
+        except Exception:
+            logger.exception("Could not capture the plan for fingerprint=%s", key)
+        finally:
+            self._explaining.release()
+
+    def wait(self, timeout: float = None) -> None:
+        """Wait for the plan being captured, if any, to be logged."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
@@ -0,0 +1,140 @@
+"""
+This module provides a least-recently-used cache of loaded .sql files, used by the Sqlconnector class so that
+repeatedly executed files are not read from disk and parsed on every call.
+
+Each entry holds the text of a file and the prepared SQLAlchemy `TextClause`, keyed by the resolved file path
+and validated against the file's modification time and size, so an edited file is loaded again on next use.
+
+Classes:
+    SqlFile: The text and prepared clause of a loaded .sql file.
+    CacheInfo: Hit, miss and eviction counts of a SqlFileCache.
+    SqlFileCache: A size-limited, thread-safe LRU cache of loaded .sql files.
+
+Attributes:
+    sql_file_cache: The SqlFileCache shared by every Sqlconnector.
+
+Example Usage:
+    >>> from sqlconnect.sqlfiles import sql_file_cache
+    >>>
+    >>> sql_file = sql_file_cache.load("path/to/query.sql")
+    >>> sql_file_cache.cache_info()
+    CacheInfo(hits=0, misses=1, evictions=0, currsize=1, maxsize=128)
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from sqlalchemy import TextClause
+
+
+class SqlFile(NamedTuple):
+    """The text and prepared clause of a loaded .sql file."""
+
+    path: Path
+    text: str
+    clause: TextClause
+
+
+class CacheInfo(NamedTuple):
+    """Hit, miss and eviction counts of a SqlFileCache, in the style of `functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: int
+
+
+class SqlFileCache:
+    """
+    A size-limited, thread-safe LRU cache of loaded .sql files.
+
+    Parameters
+    ----------
+    maxsize : int, default 128
+        The maximum number of files kept. The least recently used file is evicted when the cache is full.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # resolved path -> (stat signature, SqlFile)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def load(self, path: str | Path) -> SqlFile:
+        """
+        Return the loaded .sql file at `path`, reading it from disk only if it is not cached or has changed.
+
+        Parameters
+        ----------
+        path : str or Path
+            The file path of the .sql file.
+
+        Returns
+        -------
+        SqlFile
+            The resolved path, text and prepared `TextClause` of the file.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file does not exist.
+        """
+        full_path = Path(path).resolve()
+        stat = full_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._entries.get(full_path)
+            if cached is not None and cached[0] == signature:
+                self._entries.move_to_end(full_path)
+                self._hits += 1
+                return cached[1]
+            self._misses += 1
+
+        from sqlalchemy import text
+
+        sql = full_path.read_text(encoding="utf-8")
+        sql_file = SqlFile(full_path, sql, text(sql))
+
+        with self._lock:
+            self._entries[full_path] = (signature, sql_file)
+            self._entries.move_to_end(full_path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return sql_file
+
+    def invalidate(self, path: str | Path) -> None:
+        """Remove the file at `path` from the cache, if present."""
+        with self._lock:
+            self._entries.pop(Path(path).resolve(), None)
+
+    def cache_info(self) -> CacheInfo:
+        """Return the hit, miss and eviction counts and the current size of the cache."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self.maxsize,
+            )
+
+    def cache_clear(self) -> None:
+        """Remove every file from the cache and reset its statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+sql_file_cache = SqlFileCache()
@@ -0,0 +1,149 @@
+"""
+This module provides the producer-consumer pipeline used by `Sqlconnector.transfer` to copy query results from one
+database to another, reading the next chunk from the source while the previous one is written to the target.
+
+Chunks are passed from a reader thread to the writing thread through a bounded queue, so at most `queue_size`
+chunks wait in memory however large the transfer is.
+
+Classes:
+    TransferProgress: The progress of a transfer, passed to the progress callback after each chunk.
+    TransferError: Raised when a transfer fails, recording how many chunks were written.
+
+Functions:
+    run_pipeline: Writes chunks read on a background thread, reporting progress after each chunk.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Iterable, NamedTuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Chunks read ahead of the writer by default
+QUEUE_SIZE = 2
+
+# Marks the end of the chunks in the queue
+_DONE = object()
+
+
+class TransferProgress(NamedTuple):
+    """The chunks completed, counted from the start of the query, the rows written and the seconds taken."""
+
+    chunks: int
+    rows: int
+    elapsed: float
+
+
+class TransferError(RuntimeError):
+    """
+    Raised when a transfer fails. Chunks are written in separate transactions, so every chunk before the failed
+    one is in the target table.
+
+    Attributes
+    ----------
+    chunks_completed : int
+        The number of chunks written, counted from the start of the query. Pass it as 'start_chunk' to resume.
+    rows_written : int
+        The number of rows written by the failed call.
+    """
+
+    def __init__(self, message: str, chunks_completed: int, rows_written: int):
+        super().__init__(message)
+        self.chunks_completed = chunks_completed
+        self.rows_written = rows_written
+
+
+def _read_ahead(chunks: Iterable, buffer: queue.Queue, stop: threading.Event) -> None:
+    """Put each chunk in the queue, followed by _DONE or the exception raised while reading."""
+    try:
+        for chunk in chunks:
+            while not stop.is_set():
+                try:
+                    buffer.put(chunk, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if stop.is_set():
+                return
+        item = _DONE
+    except BaseException as e:
+        item = e
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def run_pipeline(
+    chunks: Iterable[pd.DataFrame],
+    write: Callable[[pd.DataFrame, int], None],
+    queue_size: int = QUEUE_SIZE,
+    progress: Callable[[TransferProgress], None] = None,
+    start_chunk: int = 0,
+) -> TransferProgress:
+    """
+    Writes chunks read on a background thread, reporting progress after each chunk.
+
+    Parameters
+    ----------
+    chunks : iterable of pandas.DataFrame
+        The chunks to write, read on a background thread.
+    write : callable
+        Called on the current thread with each chunk and its number, counted from the start of 'chunks'.
+    queue_size : int, default 2
+        The number of chunks read ahead of the writer.
+    progress : callable, optional
+        Called with a TransferProgress after each chunk is written.
+    start_chunk : int, default 0
+        The number of chunks to skip, e.g. those written before a failure. They are read but not written.
+
+    Returns
+    -------
+    TransferProgress
+        The chunks completed, counted from the start of 'chunks', the rows written and the seconds taken.
+
+    Raises
+    ------
+    TransferError
+        If reading or writing a chunk fails. The reader thread is stopped before raising.
+    """
+    buffer = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    reader = threading.Thread(
+        target=_read_ahead,
+        args=(chunks, buffer, stop),
+        name="sqlconnect-transfer-reader",
+        daemon=True,
+    )
+
+    start = time.perf_counter()
+    completed, rows = 0, 0
+    reader.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            if completed >= start_chunk:
+                write(item, completed)
+                rows += len(item)
+            completed += 1
+            if progress is not None and completed > start_chunk:
+                progress(TransferProgress(completed, rows, time.perf_counter() - start))
+    except Exception as e:
+        raise TransferError(
+            f"Transfer failed after {completed} chunks: {e}", completed, rows
+        ) from e
+    finally:
+        stop.set()
+        reader.join()
+
+    return TransferProgress(completed, rows, time.perf_counter() - start)
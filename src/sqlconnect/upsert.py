@@ -0,0 +1,139 @@
+"""
+This module builds the set-based upsert statements used by `Sqlconnector.df_upsert`, which loads a DataFrame into a
+staging table and then inserts or updates every row of the target table with a single statement.
+
+Functions:
+    staging_table_name: Returns a unique name for a staging table.
+    upsert_statement: Returns the statement merging a staging table into a target table for a SQLAlchemy dialect.
+
+Statements by dialect:
+    - postgresql: `INSERT ... SELECT ... ON CONFLICT (keys) DO UPDATE`. The keys need a unique constraint.
+    - sqlite: As postgresql, with `WHERE true` resolving the parsing ambiguity of `SELECT ... ON CONFLICT`.
+    - mysql, mariadb: `INSERT ... SELECT ... ON DUPLICATE KEY UPDATE`. The keys need a unique constraint.
+    - mssql: `MERGE ... WHEN MATCHED THEN UPDATE ... WHEN NOT MATCHED THEN INSERT`.
+    - oracle: As mssql, in Oracle's MERGE syntax.
+
+Example Usage:
+    # Used within Sqlconnector class
+    statement = upsert_statement(engine.dialect, '"sales"."orders"', '"sqlconnect_staging_1f0c"', columns, keys)
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Dialect
+
+STAGING_PREFIX = "sqlconnect_staging_"
+
+SUPPORTED_DIALECTS = ("postgresql", "sqlite", "mysql", "mariadb", "mssql", "oracle")
+
+
+def staging_table_name() -> str:
+    """Returns a unique name for a staging table, short enough for Oracle's 30 character limit."""
+    return f"{STAGING_PREFIX}{os.urandom(5).hex()}"
+
+
+def _on_conflict(
+    target: str, staging: str, columns: list, keys: list, updates: list, where: str
+) -> str:
+    column_list = ", ".join(columns)
+    action = (
+        "DO UPDATE SET " + ", ".join(f"{c} = excluded.{c}" for c in updates)
+        if updates
+        else "DO NOTHING"
+    )
+    return (
+        f"INSERT INTO {target} ({column_list}) SELECT {column_list} FROM {staging}{where} "
+        f"ON CONFLICT ({', '.join(keys)}) {action}"
+    )
+
+
+def _on_duplicate_key(
+    target: str, staging: str, columns: list, keys: list, updates: list
+) -> str:
+    column_list = ", ".join(columns)
+    # Assigning a key to itself leaves existing rows unchanged when every column is a key
+    assignments = [f"{c} = s.{c}" for c in updates] or [f"{keys[0]} = {keys[0]}"]
+    return (
+        f"INSERT INTO {target} ({column_list}) "
+        f"SELECT {', '.join(f's.{c}' for c in columns)} FROM {staging} s "
+        f"ON DUPLICATE KEY UPDATE {', '.join(assignments)}"
+    )
+
+
+def _merge(
+    target: str,
+    staging: str,
+    columns: list,
+    keys: list,
+    updates: list,
+    alias: str,
+    terminator: str,
+) -> str:
+    condition = " AND ".join(f"t.{k} = s.{k}" for k in keys)
+    statement = f"MERGE INTO {target}{alias}t USING {staging}{alias}s ON ({condition})"
+    if updates:
+        statement += " WHEN MATCHED THEN UPDATE SET " + ", ".join(
+            f"t.{c} = s.{c}" for c in updates
+        )
+    statement += (
+        f" WHEN NOT MATCHED THEN INSERT ({', '.join(columns)}) "
+        f"VALUES ({', '.join(f's.{c}' for c in columns)})"
+    )
+    return statement + terminator
+
+
+def upsert_statement(
+    dialect: Dialect, target: str, staging: str, columns: list, keys: list
+) -> str:
+    """
+    Returns the statement merging a staging table into a target table for a SQLAlchemy dialect.
+
+    Rows of the staging table whose keys match a target row update that row's other columns, and the remaining
+    rows are inserted.
+
+    Parameters
+    ----------
+    dialect : Dialect
+        The dialect of the engine being written to.
+    target, staging : str
+        The quoted, schema-qualified names of the target and staging tables.
+    columns : list of str
+        The names of the columns to write, unquoted.
+    keys : list of str
+        The names of the columns identifying a row, unquoted.
+
+    Returns
+    -------
+    str
+        The SQL statement.
+
+    Raises
+    ------
+    ValueError
+        If the dialect is not supported.
+    """
+    quote = dialect.identifier_preparer.quote
+    updates = [quote(c) for c in columns if c not in keys]
+    columns = [quote(c) for c in columns]
+    keys = [quote(k) for k in keys]
+
+    if dialect.name == "postgresql":
+        return _on_conflict(target, staging, columns, keys, updates, where="")
+    if dialect.name == "sqlite":
+        return _on_conflict(
+            target, staging, columns, keys, updates, where=" WHERE true"
+        )
+    if dialect.name in ("mysql", "mariadb"):
+        return _on_duplicate_key(target, staging, columns, keys, updates)
+    if dialect.name == "mssql":
+        return _merge(target, staging, columns, keys, updates, " AS ", ";")
+    if dialect.name == "oracle":
+        return _merge(target, staging, columns, keys, updates, " ", "")
+    raise ValueError(
+        f"Upserts are not supported for dialect '{dialect.name}'. "
+        f"Supported dialects are: {', '.join(SUPPORTED_DIALECTS)}"
+    )
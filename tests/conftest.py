@@ -0,0 +1,39 @@
+import pytest
+from sqlconnect import Sqlconnector
+
+
+@pytest.fixture
+def sqlite_config(tmp_path):
+    # Configuration for a temporary SQLite database file
+    return {
+        "dialect": "sqlite",
+        "dbapi": "pysqlite",
+        "database": str(tmp_path / "test.db"),
+    }
+
+
+@pytest.fixture
+def sqlite_connector(tmp_path):
+    """
+    Return a function creating Sqlconnectors to SQLite database files in the test's temporary directory.
+
+    The function takes the database file name, further connection configuration (e.g. "pool" or "slow_query")
+    as 'config', and keyword arguments for Sqlconnector. Every connector it creates is closed after the test.
+    """
+    connectors = []
+
+    def connect(database: str = "test.db", config: dict = None, **kwargs):
+        config_dict = {
+            "dialect": "sqlite",
+            "dbapi": "pysqlite",
+            "database": str(tmp_path / database),
+            **(config or {}),
+        }
+        connector = Sqlconnector("SQLite", config_dict=config_dict, **kwargs)
+        connectors.append(connector)
+        return connector
+
+    yield connect
+
+    for connector in connectors:
+        connector.close()
@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 import pytest
 import pandas as pd
+import sqlalchemy
 import sqlconnect as sc
 
 if not os.environ.get("RUNNING_IN_DOCKER"):
@@ -48,3 +49,58 @@ def test_sql_to_df_str_oracle(setup_env, setup_connections):
     expected = pd.DataFrame({"name": ["Jane Doe"]})
 
     pd.testing.assert_frame_equal(df, expected)
+
+
+def test_df_to_sql_bulk_oracle(setup_env, setup_connections):
+    conn = sc.Sqlconnector("Oracle")
+
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "amount": [1.5, 2.25, None],
+            "label": ["first", "second", None],
+            "created": pd.to_datetime(
+                ["2024-01-01 09:00:00", "2024-01-02 10:30:00", "2024-01-03 12:00:00"]
+            ),
+        }
+    )
+
+    conn.df_to_sql(df, "sqlconnect_bulk", if_exists="replace", index=False, bulk=True)
+
+    result = conn.sql_to_df_str(
+        "SELECT id, amount, label, created FROM sqlconnect_bulk ORDER BY id",
+        parse_dates=["created"],
+    )
+
+    pd.testing.assert_frame_equal(result, df, check_dtype=False)
+
+
+def test_df_upsert_oracle(setup_env, setup_connections):
+    conn = sc.Sqlconnector("Oracle")
+    conn.execute_sql_str(
+        """ BEGIN
+                EXECUTE IMMEDIATE 'DROP TABLE sqlconnect_upsert';
+            EXCEPTION
+                WHEN OTHERS THEN NULL;
+            END;
+        """
+    )
+    conn.execute_sql_str(
+        "CREATE TABLE sqlconnect_upsert (id INTEGER PRIMARY KEY, amount INTEGER)"
+    )
+    conn.execute_sql_str(
+        "INSERT INTO sqlconnect_upsert SELECT 1, 10 FROM dual UNION ALL SELECT 2, 20 FROM dual"
+    )
+
+    df = pd.DataFrame({"id": [2, 3], "amount": [25, 30]})
+
+    conn.df_upsert(df, "sqlconnect_upsert", keys=["id"])
+
+    result = conn.sql_to_df_str("SELECT id, amount FROM sqlconnect_upsert ORDER BY id")
+
+    assert result.values.tolist() == [[1, 10], [2, 25], [3, 30]]
+    assert not [
+        name
+        for name in sqlalchemy.inspect(conn.engine).get_table_names()
+        if name.startswith("sqlconnect_staging_")
+    ]
@@ -0,0 +1,176 @@
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def connector(sqlite_connector):
+    # Sqlconnector for a temporary SQLite database holding a small table
+    connector = sqlite_connector()
+    connector.execute_sql_str("CREATE TABLE people (id INTEGER, name TEXT)")
+    connector.execute_sql_str(
+        "INSERT INTO people VALUES (1, 'Ann'), (2, NULL), (3, 'Cal')"
+    )
+    return connector
+
+
+def test_sql_to_arrow_str_table(connector):
+    table = connector.sql_to_arrow_str("SELECT id, name FROM people ORDER BY id")
+
+    assert table.schema == pa.schema([("id", pa.int64()), ("name", pa.string())])
+    assert table.to_pydict() == {"id": [1, 2, 3], "name": ["Ann", None, "Cal"]}
+
+
+def test_sql_to_arrow_str_params(connector):
+    table = connector.sql_to_arrow_str("SELECT id FROM people WHERE id > ?", (1,))
+
+    assert table.column("id").to_pylist() == [2, 3]
+
+
+def test_result_batches_types_column_after_null_batch(connector):
+    from sqlconnect.arrow import result_batches
+
+    with connector.engine.connect() as connection:
+        result = connection.exec_driver_sql(
+            "SELECT name FROM people WHERE id = 2 UNION ALL SELECT 'Dee'"
+        )
+        batches = list(result_batches(result, batch_size=1))
+
+    assert [batch.column(0).type for batch in batches] == [pa.null(), pa.string()]
+
+
+def test_sql_to_arrow_str_reader(connector):
+    reader = connector.sql_to_arrow_str(
+        "SELECT id FROM people ORDER BY id", batch_size=2
+    )
+
+    assert isinstance(reader, pa.RecordBatchReader)
+    assert [batch.num_rows for batch in reader] == [2, 1]
+    assert connector.engine.pool.checkedout() == 0
+
+
+def test_sql_to_arrow_str_empty_result(connector):
+    table = connector.sql_to_arrow_str("SELECT id, name FROM people WHERE id > 10")
+
+    assert table.num_rows == 0
+    assert table.column_names == ["id", "name"]
+
+
+def test_sql_to_arrow_file(connector, tmp_path):
+    query_path = tmp_path / "query.sql"
+    query_path.write_text("SELECT COUNT(*) AS total FROM people")
+
+    assert connector.sql_to_arrow(str(query_path)).to_pydict() == {"total": [3]}
+
+
+def test_sql_to_df_str_pyarrow_backend(connector):
+    import pandas as pd
+
+    df = connector.sql_to_df_str("SELECT name FROM people", dtype_backend="pyarrow")
+
+    assert isinstance(df["name"].dtype, pd.ArrowDtype)
+
+
+def test_sql_to_df_str_pyarrow_backend_reads_arrow_batches(connector, monkeypatch):
+    import pandas as pd
+
+    def read_sql_query(*args, **kwargs):
+        raise AssertionError("read through pandas row tuples")
+
+    monkeypatch.setattr(pd, "read_sql_query", read_sql_query)
+    df = connector.sql_to_df_str(
+        "SELECT id, name FROM people ORDER BY id",
+        index_col="id",
+        dtype_backend="pyarrow",
+    )
+
+    assert df.index.tolist() == [1, 2, 3]
+    assert df["name"].dtype.pyarrow_dtype == pa.string()
+    assert pa.array(df["name"].array).to_pylist() == ["Ann", None, "Cal"]
+
+
+def test_sql_to_df_str_pyarrow_backend_chunks(connector):
+    chunks = connector.sql_to_df_str(
+        "SELECT id FROM people ORDER BY id", chunksize=2, dtype_backend="pyarrow"
+    )
+
+    assert [chunk["id"].dtype.pyarrow_dtype for chunk in chunks] == [pa.int64()] * 2
+    assert connector.engine.pool.checkedout() == 0
+
+
+class FakeResult:
+    """A result of fixed rows, with the cursor.description of a driver reporting column types."""
+
+    def __init__(self, names, rows, description=None, driver=None):
+        self._names = names
+        self._rows = list(rows)
+        self.cursor = type("Cursor", (), {"description": description})()
+        dialect = type("Dialect", (), {"driver": driver})()
+        self.context = type("Context", (), {"dialect": dialect})()
+
+    def keys(self):
+        return self._names
+
+    def fetchmany(self, size):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+
+def test_sql_to_arrow_str_promotes_whole_numbers_to_floats(connector):
+    connector.execute_sql_str("CREATE TABLE amounts (amount NUMERIC)")
+    connector.execute_sql_str("INSERT INTO amounts VALUES (1), (2), (2.75)")
+
+    table = connector.sql_to_arrow_str("SELECT amount FROM amounts")
+    assert table.column("amount").type == pa.float64()
+    assert table.column("amount").to_pylist() == [1, 2, 2.75]
+
+    # A stream cannot change its schema after the first batch, so it fails instead of truncating
+    reader = connector.sql_to_arrow_str("SELECT amount FROM amounts", batch_size=2)
+    with pytest.raises(pa.ArrowInvalid, match="amount"):
+        reader.read_all()
+    assert connector.engine.pool.checkedout() == 0
+
+
+def test_result_batches_promotes_decimal_scales():
+    from decimal import Decimal
+    from sqlconnect.arrow import result_batches
+
+    result = FakeResult(["price"], [(Decimal("1.5"),), (Decimal("12.25"),)])
+    batches = list(result_batches(result, batch_size=1))
+    table = pa.concat_tables(
+        [pa.Table.from_batches([batch]) for batch in batches],
+        promote_options="permissive",
+    )
+
+    assert table.column("price").to_pylist() == [Decimal("1.5"), Decimal("12.25")]
+
+
+def test_result_batches_uses_driver_types():
+    from decimal import Decimal
+    from sqlconnect.arrow import result_batches
+
+    # As reported by pyodbc for INT and DECIMAL(10, 2) columns
+    description = [
+        ("id", int, None, 10, 10, 0, True),
+        ("price", Decimal, None, 10, 10, 2, True),
+    ]
+    result = FakeResult(
+        ["id", "price"],
+        [(None, None), (2, Decimal("1.5")), (3, Decimal("12.25"))],
+        description,
+        driver="pyodbc",
+    )
+    batches = list(result_batches(result, batch_size=1))
+
+    assert {batch.schema for batch in batches} == {
+        pa.schema([("id", pa.int64()), ("price", pa.decimal128(10, 2))])
+    }
+
+
+def test_sql_to_arrow_str_reader_types_column_null_in_first_batch(connector):
+    reader = connector.sql_to_arrow_str(
+        "SELECT name FROM people WHERE id = 2 UNION ALL SELECT 'Dee'", batch_size=1
+    )
+
+    assert reader.schema == pa.schema([("name", pa.string())])
+    assert reader.read_all().column("name").to_pylist() == [None, "Dee"]
@@ -0,0 +1,85 @@
+import asyncio
+import pandas as pd
+import pytest
+from sqlconnect import AsyncSqlconnector
+from sqlconnect.async_connector import get_async_config, get_async_engine_options
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+
+def test_get_async_config():
+    connection_config = {"dialect": "postgresql", "dbapi": "psycopg2", "host": "db"}
+
+    assert get_async_config(connection_config)["dbapi"] == "asyncpg"
+    assert connection_config["dbapi"] == "psycopg2"
+
+
+def test_get_async_config_override_and_unknown():
+    assert (
+        get_async_config({"dbapi": "pyodbc", "async_dbapi": "custom"})["dbapi"]
+        == "custom"
+    )
+    with pytest.raises(ValueError):
+        get_async_config({"dbapi": "unknown"})
+
+
+def test_get_async_engine_options_pool_class():
+    import sqlalchemy.pool
+
+    options = get_async_engine_options({"pool": {"class": "QueuePool", "size": 2}})
+
+    assert options == {
+        "poolclass": sqlalchemy.pool.AsyncAdaptedQueuePool,
+        "pool_size": 2,
+    }
+    with pytest.raises(ValueError, match="SingletonThreadPool"):
+        get_async_engine_options({"pool": {"class": "SingletonThreadPool"}})
+
+
+def test_async_connector_with_pool_section(sqlite_config):
+    pool_config = {**sqlite_config, "pool": {"class": "QueuePool", "size": 2}}
+
+    async def run():
+        async with AsyncSqlconnector("SQLite", config_dict=pool_config) as connector:
+            df = await connector.sql_to_df_str("SELECT 1 AS n")
+            return df, connector.engine.pool.size()
+
+    df, size = asyncio.run(run())
+
+    assert df["n"].tolist() == [1]
+    assert size == 2
+
+
+def test_async_round_trip(sqlite_config, tmp_path):
+    query_path = tmp_path / "query.sql"
+    query_path.write_text("SELECT n FROM numbers ORDER BY n")
+
+    async def run():
+        async with AsyncSqlconnector("SQLite", config_dict=sqlite_config) as connector:
+            df = pd.DataFrame({"n": [1, 2, 3]})
+            assert await connector.df_to_sql(df, "numbers", index=False) == 3
+            await connector.execute_sql_str("INSERT INTO numbers VALUES (4)")
+
+            full = await connector.sql_to_df(str(query_path))
+            chunks = [
+                chunk["n"].tolist()
+                async for chunk in await connector.sql_to_df_str(
+                    "SELECT n FROM numbers ORDER BY n", chunksize=3
+                )
+            ]
+            return full, chunks
+
+    full, chunks = asyncio.run(run())
+
+    assert full["n"].tolist() == [1, 2, 3, 4]
+    assert chunks == [[1, 2, 3], [4]]
+
+
+def test_async_query_error(sqlite_config):
+    async def run():
+        async with AsyncSqlconnector("SQLite", config_dict=sqlite_config) as connector:
+            await connector.sql_to_df_str("SELECT * FROM missing_table")
+
+    with pytest.raises(RuntimeError, match="Error executing query"):
+        asyncio.run(run())
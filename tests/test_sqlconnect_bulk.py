@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+from sqlalchemy.dialects.mssql.pyodbc import MSDialect_pyodbc
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.dialects.sqlite.pysqlite import SQLiteDialect_pysqlite
+from sqlconnect import bulk
+
+
+@pytest.mark.parametrize(
+    "dialect, expected",
+    [
+        (PGDialect_psycopg2(), bulk.copy_from_stdin),
+        (MSDialect_pyodbc(), bulk.fast_executemany),
+        (SQLiteDialect_pysqlite(), bulk.executemany),
+    ],
+)
+def test_insert_method(dialect, expected):
+    assert bulk.insert_method(dialect) is expected
+
+
+def test_csv_buffer_marks_nulls():
+    buffer = bulk._csv_buffer([(1, "a,b", None), (2, "", 1.5)])
+
+    assert buffer.read() == '1,"a,b",\\N\r\n2,,1.5\r\n'
+
+
+def test_csv_buffer_quotes_markers_and_encodes_bytes():
+    buffer = bulk._csv_buffer([("\\N", "\\.", 'say "hi"', b"\x00\xff")])
+
+    assert buffer.read() == '"\\N","\\.","say ""hi""",\\x00ff\r\n'
+
+
+@pytest.fixture
+def connector(sqlite_connector):
+    # Sqlconnector for a temporary SQLite database
+    return sqlite_connector()
+
+
+def test_df_to_sql_bulk(connector):
+    df = pd.DataFrame({"id": [1, 2, 3], "score": [1.5, None, 3.0]})
+
+    assert connector.df_to_sql(df, "scores", index=False, bulk=True) == 3
+    assert (
+        connector.df_to_sql(
+            df, "scores", if_exists="append", bulk=True, chunksize=2, index=False
+        )
+        == 3
+    )
+
+    result = connector.sql_to_df_str("SELECT id, score FROM scores ORDER BY id")
+    assert result["id"].tolist() == [1, 1, 2, 2, 3, 3]
+    assert result["score"].isna().sum() == 2
+
+
+def test_df_to_sql_bulk_with_method(connector):
+    df = pd.DataFrame({"id": [1]})
+
+    with pytest.raises(ValueError):
+        connector.df_to_sql(df, "ids", bulk=True, method="multi")
@@ -68,6 +68,37 @@ def test_get_connection_config_invalid_connection_name(mock_config_file_yaml):
         config.get_connection_config("invalid_connection", str(mock_config_file_yaml))
 
 
+def test_get_connection_config_returns_copy(mock_config_file_yaml):
+    # Test that modifying a returned config does not alter the cached file
+    connection_config = config.get_connection_config(
+        "Database_One", str(mock_config_file_yaml)
+    )
+    connection_config["host"] = "changed"
+
+    connection_config = config.get_connection_config(
+        "Database_One", str(mock_config_file_yaml)
+    )
+    assert connection_config["host"] == "dev-server.database.com"
+
+
+def test_load_config_file_cached_until_file_changes(mock_config_file_yaml):
+    # Test that an unchanged file is parsed once and a changed file is parsed again
+    first = config.load_config_file(mock_config_file_yaml)
+    assert config.load_config_file(mock_config_file_yaml) is first
+
+    changed = {"connections": {"Database_Three": {"dialect": "sqlite"}}}
+    mock_config_file_yaml.write_text(yaml.dump(changed))
+
+    assert config.load_config_file(mock_config_file_yaml) == changed
+
+
+def test_clear_config_cache(mock_config_file_yaml):
+    first = config.load_config_file(mock_config_file_yaml)
+    config.clear_config_cache()
+
+    assert config.load_config_file(mock_config_file_yaml) is not first
+
+
 # Mock data with missing connection details
 MISSING_DETAILS_CONFIG_DICT = {
     "connections": {
@@ -167,3 +198,87 @@ def test_get_db_url_missing_environment_variables(monkeypatch, basic_config):
 def test_get_db_url_empty_configuration():
     with pytest.raises(KeyError):
         config.get_db_url({})
+
+
+# Testing config.get_engine_options()
+
+
+def test_get_engine_options_empty(basic_config):
+    assert config.get_engine_options(basic_config) == {}
+
+
+def test_get_engine_options_merges_engine_and_pool(basic_config):
+    basic_config["engine"] = {"pool_recycle": 1800, "connect_args": {"timeout": 5}}
+    basic_config["pool"] = {"size": 20, "max_overflow": 5, "pre_ping": True}
+
+    assert config.get_engine_options(basic_config) == {
+        "pool_recycle": 1800,
+        "connect_args": {"timeout": 5},
+        "pool_size": 20,
+        "max_overflow": 5,
+        "pool_pre_ping": True,
+    }
+
+
+def test_get_engine_options_resolves_pool_class(basic_config):
+    from sqlalchemy.pool import NullPool
+
+    basic_config["pool"] = {"class": "null"}
+
+    assert config.get_engine_options(basic_config) == {"poolclass": NullPool}
+
+
+@pytest.mark.parametrize(
+    "engine, pool",
+    [
+        ({"unknown_option": 1}, {}),
+        ({}, {"unknown_option": 1}),
+        ({"pool_size": "20"}, {}),
+        ({"pool_size": True}, {}),
+        ({"pool_size": 5}, {"size": 10}),
+        ({"poolclass": "NotAPool"}, {}),
+        ({"poolclass": "NullPool", "pool_size": 5}, {}),
+    ],
+)
+def test_get_engine_options_invalid(basic_config, engine, pool):
+    basic_config.update({"engine": engine, "pool": pool})
+    with pytest.raises(ValueError):
+        config.get_engine_options(basic_config)
+
+
+# Testing config.get_slow_query_options()
+
+
+def test_get_slow_query_options(basic_config):
+    assert config.get_slow_query_options(basic_config) is None
+
+    basic_config["slow_query"] = {"threshold": 2}
+    assert config.get_slow_query_options(basic_config) == {
+        "threshold": 2.0,
+        "explain": False,
+    }
+
+
+@pytest.mark.parametrize(
+    "section",
+    [
+        [],
+        {},
+        {"threshold": 0},
+        {"threshold": "5"},
+        {"threshold": True},
+        {"threshold": 5, "explain": "yes"},
+        {"threshold": 5, "unknown_option": 1},
+    ],
+)
+def test_get_slow_query_options_invalid(basic_config, section):
+    basic_config["slow_query"] = section
+    with pytest.raises(ValueError):
+        config.get_slow_query_options(basic_config)
+
+
+def test_get_db_url_sqlite_without_host():
+    configuration = {"dialect": "sqlite", "dbapi": "pysqlite", "database": "test.db"}
+
+    expected_url = URL.create("sqlite+pysqlite", database="test.db")
+    assert config.get_db_url(configuration) == expected_url
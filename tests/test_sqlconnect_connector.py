@@ -1,3 +1,6 @@
+import pandas as pd
+import pytest
+from sqlalchemy import event
 from sqlconnect import Sqlconnector
 
 CONFIG_DICT = {
@@ -17,3 +20,155 @@ def test_Sqlconnector_connection_name_with_config_dict():
 
     # Assertions to check if the instance is initialised as expected
     assert connector.connection_name == "Database_One"
+
+
+def test_Sqlconnector_shares_engine(sqlite_config):
+    first = Sqlconnector("SQLite", config_dict=sqlite_config)
+    second = Sqlconnector("SQLite", config_dict=sqlite_config)
+    private = Sqlconnector("SQLite", config_dict=sqlite_config, share_engine=False)
+
+    assert first.engine is second.engine
+    assert private.engine is not first.engine
+
+
+def test_Sqlconnector_pool_options(sqlite_config):
+    from sqlalchemy.pool import StaticPool
+
+    sqlite_config.update({"database": ":memory:", "pool": {"class": "StaticPool"}})
+
+    with Sqlconnector("SQLite", config_dict=sqlite_config) as connector:
+        assert isinstance(connector.engine.pool, StaticPool)
+
+        # A StaticPool shares one in-memory database across calls
+        connector.execute_sql_str("CREATE TABLE numbers (n INTEGER)")
+        connector.execute_sql_str("INSERT INTO numbers VALUES (1), (2)")
+        df = connector.sql_to_df_str("SELECT n FROM numbers")
+
+    assert df["n"].tolist() == [1, 2]
+
+
+def test_Sqlconnector_sql_files(sqlite_connector, tmp_path):
+    create_path = tmp_path / "create.sql"
+    create_path.write_text("CREATE TABLE numbers (n INTEGER)")
+    query_path = tmp_path / "query.sql"
+    query_path.write_text("SELECT COUNT(*) AS total FROM numbers")
+
+    connector = sqlite_connector()
+    connector.execute_sql(str(create_path))
+
+    assert connector.sql_to_df(str(query_path))["total"].tolist() == [0]
+
+
+def test_Sqlconnector_sql_file_not_found(sqlite_connector, tmp_path):
+    connector = sqlite_connector()
+
+    with pytest.raises(RuntimeError, match="File not found"):
+        connector.sql_to_df(str(tmp_path / "missing.sql"))
+    with pytest.raises(RuntimeError, match="File not found"):
+        connector.execute_sql(str(tmp_path / "missing.sql"))
+
+
+def test_Sqlconnector_streams_chunks(sqlite_connector):
+    connector = sqlite_connector()
+    connector.execute_sql_str("CREATE TABLE numbers (n INTEGER)")
+    connector.execute_sql_str("INSERT INTO numbers VALUES (1), (2), (3), (4), (5)")
+
+    chunks = connector.sql_to_df_str("SELECT n FROM numbers ORDER BY n", chunksize=2)
+    assert connector.engine.pool.checkedout() == 1
+    assert [chunk["n"].tolist() for chunk in chunks] == [[1, 2], [3, 4], [5]]
+    assert connector.engine.pool.checkedout() == 0
+
+    # Closing the iterator early releases its connection
+    chunks = connector.sql_to_df_str("SELECT n FROM numbers", chunksize=2)
+    next(chunks)
+    chunks.close()
+    assert connector.engine.pool.checkedout() == 0
+
+
+def test_Sqlconnector_streamed_query_error(sqlite_connector):
+    connector = sqlite_connector()
+
+    with pytest.raises(RuntimeError, match="Error executing query"):
+        connector.sql_to_df_str("SELECT * FROM missing_table", chunksize=2)
+    assert connector.engine.pool.checkedout() == 0
+
+
+def test_Sqlconnector_execute_many(sqlite_connector):
+    connector = sqlite_connector()
+    connector.execute_sql_str("CREATE TABLE numbers (n INTEGER, label TEXT)")
+
+    inserted = connector.execute_many(
+        "INSERT INTO numbers VALUES (:n, :label)",
+        ({"n": n, "label": str(n)} for n in range(10)),
+        batch_size=3,
+    )
+    assert inserted == 10
+
+    updated = connector.execute_many(
+        "UPDATE numbers SET label = ? WHERE n = ?", [("even", 0), ("even", 2)]
+    )
+    assert updated == 2
+    df = connector.sql_to_df_str("SELECT label FROM numbers WHERE n < 3 ORDER BY n")
+    assert df["label"].tolist() == ["even", "1", "even"]
+
+    # A failing batch rolls back every batch of the call
+    with pytest.raises(RuntimeError):
+        connector.execute_many(
+            "INSERT INTO numbers VALUES (:n, :label)",
+            [{"n": 10, "label": "10"}, {"n": 11}],
+            batch_size=1,
+        )
+    assert len(connector.sql_to_df_str("SELECT * FROM numbers")) == 10
+
+
+def test_Sqlconnector_session(sqlite_connector):
+    connector = sqlite_connector()
+    connector.execute_sql_str("CREATE TABLE numbers (n INTEGER)")
+    checkouts = []
+    event.listen(connector.engine.pool, "checkout", lambda *args: checkouts.append(1))
+
+    with connector.session() as s:
+        s.execute_sql_str("CREATE TEMPORARY TABLE staged (n INTEGER)")
+        s.execute_many("INSERT INTO staged VALUES (?)", [(n,) for n in range(5)])
+        s.execute_sql_str("INSERT INTO numbers SELECT n FROM staged")
+        s.df_to_sql(
+            pd.DataFrame({"n": [5]}), "numbers", if_exists="append", index=False
+        )
+        assert len(s.sql_to_df_str("SELECT * FROM staged")) == 5
+        assert len(s.sql_to_dfs(["SELECT * FROM staged"])["SELECT * FROM staged"]) == 5
+        assert [
+            len(c) for c in s.sql_to_df_str("SELECT * FROM numbers", chunksize=4)
+        ] == [4, 2]
+    assert len(checkouts) == 1
+
+    # Committed once at the end
+    assert len(connector.sql_to_df_str("SELECT * FROM numbers")) == 6
+
+    # Rolled back if the block raises
+    with pytest.raises(ValueError):
+        with connector.session() as s:
+            s.execute_sql_str("DELETE FROM numbers")
+            raise ValueError
+    assert len(connector.sql_to_df_str("SELECT * FROM numbers")) == 6
+    assert connector.engine.pool.checkedout() == 0
+
+
+def test_Sqlconnector_transaction(sqlite_connector):
+    connector = sqlite_connector()
+    connector.execute_sql_str("CREATE TABLE numbers (n INTEGER)")
+
+    with pytest.raises(ValueError):
+        with connector.transaction() as t:
+            t.execute_sql_str("INSERT INTO numbers VALUES (1)")
+            raise ValueError
+    assert connector.sql_to_df_str("SELECT * FROM numbers").empty
+
+    with connector.session() as s:
+        with pytest.raises(RuntimeError):
+            s.session().__enter__()
+        s.execute_sql_str("INSERT INTO numbers VALUES (1)")
+        with pytest.raises(ValueError):
+            with s.transaction() as t:
+                t.execute_sql_str("INSERT INTO numbers VALUES (2)")
+                raise ValueError
+    assert connector.sql_to_df_str("SELECT n FROM numbers")["n"].tolist() == [1]
@@ -0,0 +1,72 @@
+import pytest
+from sqlconnect import config, credentials
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    # Create a temporary sqlconnect.env file for testing
+    env_file = tmp_path / "sqlconnect.env"
+    env_file.write_text("DB_FILE_USER=file_user\nDB_FILE_PASS=file_pass\n")
+    return env_file
+
+
+def test_env_file_provider_reads_file(env_file, monkeypatch):
+    monkeypatch.delenv("DB_FILE_USER", raising=False)
+    provider = credentials.EnvFileProvider([env_file])
+
+    assert provider.get("DB_FILE_USER") == "file_user"
+    assert provider.get("MISSING_KEY") is None
+
+
+def test_env_file_provider_prefers_environment(env_file, monkeypatch):
+    monkeypatch.setenv("DB_FILE_USER", "env_user")
+    provider = credentials.EnvFileProvider([env_file])
+
+    assert provider.get("DB_FILE_USER") == "env_user"
+
+
+def test_env_file_provider_cached_until_file_changes(env_file):
+    provider = credentials.EnvFileProvider([env_file])
+    first = provider.values()
+    assert provider.values() is first
+
+    env_file.write_text("DB_FILE_USER=changed_user\n")
+    assert provider.values() == {"DB_FILE_USER": "changed_user"}
+
+
+def test_env_file_provider_missing_files(tmp_path):
+    provider = credentials.EnvFileProvider([tmp_path / "missing.env"])
+
+    assert provider.values() == {}
+
+
+def test_get_credentials_with_callable_provider():
+    secrets = {"VAULT_USER": "vault_user", "VAULT_PASS": "vault_pass"}
+    provider = credentials.CallableProvider(secrets.get)
+    connection_config = {"username": "${VAULT_USER}", "password": "${VAULT_PASS}"}
+
+    assert config.get_credentials(connection_config, provider) == (
+        "vault_user",
+        "vault_pass",
+    )
+
+
+def test_get_credentials_missing_with_callable_provider():
+    provider = credentials.CallableProvider(lambda key: None)
+    connection_config = {"username": "${VAULT_USER}"}
+
+    with pytest.raises(EnvironmentError, match="credential callable"):
+        config.get_credentials(connection_config, provider)
+
+
+def test_set_default_provider_rejects_other_types():
+    with pytest.raises(TypeError):
+        credentials.set_default_provider(lambda key: None)
+
+
+def test_credential_provider_requires_get():
+    class Incomplete(credentials.CredentialProvider):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
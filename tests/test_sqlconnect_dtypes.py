@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+from sqlconnect.dtypes import optimize, optimize_chunks, plan_dtypes, widen_plan
+
+
+def test_plan_dtypes():
+    df = pd.DataFrame(
+        {
+            "small": [1, 2, 3, 4],
+            "negative": [-40_000, 0, 1, 2],
+            "exact": [0.5, 1.25, 2.0, np.nan],
+            "inexact": [0.1, 0.2, 0.3, 0.4],
+            "region": ["EMEA", "APAC", "EMEA", "EMEA"],
+            "name": ["a", "b", "c", "d"],
+        }
+    )
+
+    assert plan_dtypes(df) == {
+        "small": "int8",
+        "negative": "int32",
+        "exact": "float32",
+        "region": "category",
+    }
+
+
+def test_optimize_reports_memory_saved():
+    df = pd.DataFrame({"n": range(1000), "region": ["EMEA", "APAC"] * 500})
+
+    optimized = optimize(df)
+    assert optimized["n"].dtype == "int16"
+    assert isinstance(optimized["region"].dtype, pd.CategoricalDtype)
+    assert optimized["region"].tolist() == df["region"].tolist()
+    assert optimized.attrs["sqlconnect_memory_saved"] == (
+        df.memory_usage(deep=True).sum() - optimized.memory_usage(deep=True).sum()
+    )
+    assert optimized.attrs["sqlconnect_memory_saved"] > 0
+
+
+def test_widen_plan():
+    plan = {"n": "int8", "x": "float32", "label": "category"}
+    chunk = pd.DataFrame({"n": [1, 1000], "x": [0.1, 0.2], "label": ["a", "b"]})
+
+    assert widen_plan(plan, chunk) == {"n": "int16", "label": "category"}
+    assert widen_plan({"n": "int32"}, pd.DataFrame({"n": [1]})) == {"n": "int32"}
+    assert widen_plan({"n": "int8"}, pd.DataFrame({"n": [1.0, np.nan]})) == {}
+
+
+def test_optimize_chunks_never_narrows():
+    chunks = [
+        pd.DataFrame({"n": [1, 2]}),
+        pd.DataFrame({"n": [300, 2]}),
+        pd.DataFrame({"n": [1, 2]}),
+    ]
+
+    dtypes = [chunk["n"].dtype for chunk in optimize_chunks(iter(chunks))]
+    assert dtypes == ["int8", "int16", "int16"]
+
+
+def test_sql_to_df_str_optimize_memory(sqlite_connector):
+    connector = sqlite_connector()
+    connector.execute_sql_str("CREATE TABLE sales (n INTEGER, region TEXT)")
+    connector.execute_sql_str(
+        "INSERT INTO sales VALUES (1, 'EMEA'), (2, 'EMEA'), (3, 'APAC'), (4, 'EMEA')"
+    )
+
+    df = connector.sql_to_df_str("SELECT * FROM sales", optimize_memory=True)
+    assert df["n"].dtype == "int8"
+    assert isinstance(df["region"].dtype, pd.CategoricalDtype)
+    assert "sqlconnect_memory_saved" in df.attrs
+
+    chunks = list(
+        connector.sql_to_df_str(
+            "SELECT n FROM sales", chunksize=2, optimize_memory=True
+        )
+    )
+    assert [chunk["n"].dtype for chunk in chunks] == ["int8", "int8"]
+    assert connector.engine.pool.checkedout() == 0
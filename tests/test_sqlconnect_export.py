@@ -0,0 +1,138 @@
+import gzip
+import pytest
+
+from sqlconnect.export import write_batches
+
+pa = pytest.importorskip("pyarrow")
+csv = pytest.importorskip("pyarrow.csv")
+feather = pytest.importorskip("pyarrow.feather")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def connector(sqlite_connector):
+    connector = sqlite_connector()
+    connector.execute_sql_str("CREATE TABLE numbers (n INTEGER, label TEXT)")
+    connector.execute_many(
+        "INSERT INTO numbers VALUES (?, ?)", ((n, f"row {n}") for n in range(1000))
+    )
+    return connector
+
+
+def reader(num_batches, rows_per_batch=100):
+    batch = pa.record_batch([pa.array(range(rows_per_batch))], names=["n"])
+    return pa.RecordBatchReader.from_batches(batch.schema, [batch] * num_batches)
+
+
+def test_write_batches_row_groups(tmp_path):
+    result = write_batches(
+        reader(5), tmp_path / "out.parquet", "parquet", row_group_size=200
+    )
+
+    metadata = pq.ParquetFile(result.files[0]).metadata
+    assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [
+        200,
+        200,
+        100,
+    ]
+    assert result.rows == 500
+    assert result.bytes == (tmp_path / "out.parquet").stat().st_size
+
+
+def test_write_batches_rollover(tmp_path):
+    result = write_batches(reader(4), tmp_path / "out.arrow", "ipc", max_file_bytes=1)
+
+    assert [file.rsplit("/", 1)[1] for file in result.files] == [
+        "out-00000.arrow",
+        "out-00001.arrow",
+        "out-00002.arrow",
+        "out-00003.arrow",
+    ]
+    assert sum(feather.read_table(file).num_rows for file in result.files) == 400
+
+
+def test_write_batches_options(tmp_path):
+    with pytest.raises(ValueError):
+        write_batches(reader(1), tmp_path / "out.xlsx", "xlsx")
+    with pytest.raises(ValueError):
+        write_batches(reader(1), tmp_path / "out.csv", "csv", row_group_size=10)
+
+
+def test_write_batches_error_removes_output(tmp_path, monkeypatch):
+    from sqlconnect import export
+
+    def batches():
+        yield from reader(3)
+        raise OSError("connection lost")
+
+    close = export._FileWriter.close
+
+    def failing_close(self):
+        close(self)
+        raise ValueError("close failed")
+
+    monkeypatch.setattr(export._FileWriter, "close", failing_close)
+    failing = pa.RecordBatchReader.from_batches(reader(1).schema, batches())
+
+    with pytest.raises(OSError, match="connection lost"):
+        write_batches(failing, tmp_path / "out.arrow", "ipc")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sql_to_parquet(connector, tmp_path):
+    result = connector.sql_to_parquet(
+        "SELECT * FROM numbers",
+        tmp_path / "exports" / "numbers.parquet",
+        batch_size=300,
+    )
+
+    table = pq.read_table(result.files[0])
+    assert result.rows == table.num_rows == 1000
+    assert table.column("label")[999].as_py() == "row 999"
+    assert connector.engine.pool.checkedout() == 0
+
+
+def test_sql_to_csv(connector, tmp_path):
+    result = connector.sql_to_csv(
+        "SELECT * FROM numbers WHERE n < ?",
+        str(tmp_path / "numbers.csv.gz"),
+        params=(10,),
+        compression="gzip",
+    )
+
+    with gzip.open(result.files[0], "rt") as file:
+        lines = file.read().splitlines()
+    assert lines[0] == '"n","label"'
+    assert len(lines) == 11
+    assert csv.read_csv(result.files[0]).num_rows == result.rows == 10
+
+
+def test_sql_to_ipc_error(connector, tmp_path):
+    with pytest.raises(RuntimeError, match="Error exporting query"):
+        connector.sql_to_ipc("SELECT * FROM missing", str(tmp_path / "out.arrow"))
+    assert connector.engine.pool.checkedout() == 0
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "csv", "ipc"])
+def test_export_column_null_in_first_batches(connector, tmp_path, file_format):
+    # 'note' is NULL for the first 300 rows and has values after, across batches of 100 rows
+    connector.execute_sql_str("ALTER TABLE numbers ADD COLUMN note TEXT")
+    connector.execute_sql_str("UPDATE numbers SET note = 'late' WHERE n >= 300")
+
+    export = getattr(connector, f"sql_to_{file_format}")
+    result = export(
+        "SELECT n, note FROM numbers ORDER BY n",
+        tmp_path / f"out.{file_format}",
+        batch_size=100,
+    )
+
+    if file_format == "parquet":
+        table = pq.read_table(result.files[0])
+    elif file_format == "csv":
+        options = csv.ConvertOptions(strings_can_be_null=True)
+        table = csv.read_csv(result.files[0], convert_options=options)
+    else:
+        table = feather.read_table(result.files[0])
+    notes = table.column("note").to_pylist()
+    assert result.rows == table.num_rows == 1000
+    assert notes[299] is None and notes[300:] == ["late"] * 700
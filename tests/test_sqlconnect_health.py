@@ -0,0 +1,101 @@
+import time
+
+import pytest
+from sqlconnect.health import HealthChecker, check_idle, warm_up
+
+
+def test_warm_up(sqlite_connector):
+    connector = sqlite_connector(share_engine=False, warm_connections=3)
+    pool = connector.engine.pool
+    assert pool.checkedin() == 3
+
+    assert connector.warm_up() == pool.size()
+    assert pool.checkedin() == pool.size()
+    assert connector.warm_up(100) == pool.size()
+    assert pool.checkedout() == 0
+
+    with pytest.raises(TypeError):
+        connector.warm_up("3")
+    connector.close()
+
+
+def test_warm_up_skips_pools_without_idle_connections(sqlite_connector):
+    connector = sqlite_connector(
+        config={"pool": {"class": "NullPool"}}, share_engine=False
+    )
+    assert warm_up(connector.engine) == 0
+    assert check_idle(connector.engine) == 0
+    connector.close()
+
+
+def test_check_idle_replaces_dead_connections(sqlite_connector, monkeypatch):
+    connector = sqlite_connector(share_engine=False, warm_connections=2)
+    engine = connector.engine
+    assert check_idle(engine) == 0
+
+    pings = []
+
+    def ping(dbapi_connection):
+        # Connections are pinged one at a time, leaving the others to concurrent queries
+        assert engine.pool.checkedout() == 1
+        pings.append(dbapi_connection)
+        if len(pings) == 1:
+            raise ConnectionError("server closed the connection")
+        return True
+
+    monkeypatch.setattr(engine.dialect, "do_ping", ping)
+    assert check_idle(engine) == 1
+    assert len(pings) == 2
+    assert engine.pool.checkedin() == 2
+    assert engine.pool.checkedout() == 0
+    assert len(connector.sql_to_df_str("SELECT 1 AS n")) == 1
+    connector.close()
+
+
+def test_check_idle_lifo_pool(sqlite_connector, monkeypatch):
+    connector = sqlite_connector(
+        config={"pool": {"use_lifo": True}}, share_engine=False, warm_connections=2
+    )
+    engine = connector.engine
+    pings = []
+    monkeypatch.setattr(engine.dialect, "do_ping", pings.append)
+
+    assert check_idle(engine) == 0
+    assert len(pings) == 1
+    assert engine.pool.checkedin() == 2
+    connector.close()
+
+
+def test_health_checker(sqlite_connector):
+    connector = sqlite_connector(
+        share_engine=False, warm_connections=1, health_check_interval=0.01
+    )
+    checker = connector.health_checker
+    deadline = time.monotonic() + 5
+    while checker.checks == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert checker.checks > 0
+
+    connector.close()
+    assert not checker._thread.is_alive()
+
+
+def test_health_checker_shared_engine(sqlite_connector):
+    first = sqlite_connector(health_check_interval=0.01)
+    second = sqlite_connector(health_check_interval=0.01)
+    checker = first.health_checker
+    assert second.health_checker is checker
+
+    first.close()
+    assert checker._thread.is_alive()
+
+    second.close()
+    assert not checker._thread.is_alive()
+
+
+@pytest.mark.parametrize("interval, error", [(0, ValueError), ("1", TypeError)])
+def test_health_checker_invalid_interval(sqlite_connector, interval, error):
+    connector = sqlite_connector(share_engine=False)
+    with pytest.raises(error):
+        HealthChecker(connector.engine, interval)
+    connector.close()
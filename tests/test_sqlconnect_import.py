@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+# Heavy dependencies that must only be imported on first use
+HEAVY_MODULES = [
+    "pandas",
+    "sqlalchemy",
+    "yaml",
+    "dotenv",
+    "pyodbc",
+    "psycopg2",
+    "oracledb",
+    "pymysql",
+    "pyarrow",
+]
+
+# Optional sqlconnect modules that must only be imported by the features using them
+LAZY_SUBMODULES = [
+    "sqlconnect.arrow",
+    "sqlconnect.async_connector",
+    "sqlconnect.bulk",
+    "sqlconnect.dtypes",
+    "sqlconnect.export",
+    "sqlconnect.health",
+    "sqlconnect.incremental",
+    "sqlconnect.parallel",
+    "sqlconnect.resultcache",
+    "sqlconnect.slowlog",
+    "sqlconnect.transfer",
+    "sqlconnect.upsert",
+]
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_does_not_load_heavy_dependencies():
+    result = run_python(
+        "import sys, sqlconnect; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_import_does_not_load_optional_submodules():
+    result = run_python(
+        "import sys, sqlconnect; "
+        f"print(','.join(m for m in {LAZY_SUBMODULES!r} if m in sys.modules))"
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_attributes():
+    result = run_python(
+        "import sqlconnect as sc; "
+        "print(sc.AsyncSqlconnector.__name__, sc.QueryBatchError.__name__, sc.TransferError.__name__)"
+    )
+    assert result.stdout.split() == [
+        "AsyncSqlconnector",
+        "QueryBatchError",
+        "TransferError",
+    ]
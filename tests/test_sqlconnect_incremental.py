@@ -0,0 +1,125 @@
+import datetime
+import pandas as pd
+import pytest
+from sqlconnect.incremental import WatermarkStore, merge_snapshot
+
+
+@pytest.fixture
+def connector(sqlite_connector):
+    connector = sqlite_connector()
+    connector.execute_sql_str("CREATE TABLE orders (id INTEGER, amount INTEGER)")
+    connector.execute_sql_str("INSERT INTO orders VALUES (1, 10), (2, 20)")
+    return connector
+
+
+def test_watermark_store_round_trip(tmp_path):
+    store = WatermarkStore(tmp_path / "state" / "watermarks.json")
+    assert store.get("key") is None
+
+    store.set("id", 42)
+    store.set("time", datetime.datetime(2024, 1, 31, 12, 30))
+    store.set("day", datetime.date(2024, 1, 31))
+
+    reopened = WatermarkStore(tmp_path / "state" / "watermarks.json")
+    assert reopened.get("id") == 42
+    assert reopened.get("time") == datetime.datetime(2024, 1, 31, 12, 30)
+    assert reopened.get("day") == datetime.date(2024, 1, 31)
+
+    reopened.delete("id")
+    assert store.get("id") is None
+
+
+def test_merge_snapshot_replaces_keys():
+    snapshot = pd.DataFrame({"id": [1, 2], "amount": [10, 20]})
+    new_rows = pd.DataFrame({"id": [2, 3], "amount": [25, 30]})
+
+    merged = merge_snapshot(snapshot, new_rows, key_columns=["id"])
+    assert merged.values.tolist() == [[1, 10], [2, 25], [3, 30]]
+    assert len(merge_snapshot(snapshot, new_rows)) == 4
+
+
+def test_sql_to_df_incremental(connector, tmp_path):
+    store = WatermarkStore(tmp_path / "watermarks.json")
+    query = "SELECT id, amount FROM orders"
+
+    df = connector.sql_to_df_incremental(query, "id", watermark_store=store)
+    assert df["id"].tolist() == [1, 2]
+
+    connector.execute_sql_str("INSERT INTO orders VALUES (3, 30)")
+    df = connector.sql_to_df_incremental(query, "id", watermark_store=store)
+    assert df["id"].tolist() == [3]
+    assert df.attrs["sqlconnect_new_rows"] == 1
+
+    df = connector.sql_to_df_incremental(query, "id", watermark_store=store)
+    assert df.empty
+
+    df = connector.sql_to_df_incremental(
+        query, "id", watermark_store=store, full_refresh=True
+    )
+    assert df["id"].tolist() == [1, 2, 3]
+
+
+def test_sql_to_df_incremental_datetime_watermark(connector, tmp_path):
+    store = WatermarkStore(tmp_path / "watermarks.json")
+    events = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "modified": pd.to_datetime(
+                ["2024-01-01 09:00:00.250000", "2024-01-01 10:00:00.500000"]
+            ),
+        }
+    )
+    connector.df_to_sql(events, "events", index=False)
+    query = "SELECT id, modified FROM events"
+
+    df = connector.sql_to_df_incremental(
+        query, "modified", watermark_store=store, parse_dates=["modified"]
+    )
+    assert df["id"].tolist() == [1, 2]
+    key = next(iter(store._load()))
+    assert store.get(key) == datetime.datetime(2024, 1, 1, 10, 0, 0, 500000)
+
+    connector.df_to_sql(
+        pd.DataFrame(
+            {"id": [3], "modified": pd.to_datetime(["2024-01-01 10:00:00.750000"])}
+        ),
+        "events",
+        if_exists="append",
+        index=False,
+    )
+    df = connector.sql_to_df_incremental(
+        query, "modified", watermark_store=store, parse_dates=["modified"]
+    )
+    assert df["id"].tolist() == [3]
+
+
+def test_sql_to_df_incremental_snapshot(connector, tmp_path):
+    pytest.importorskip("pyarrow")
+    store = WatermarkStore(tmp_path / "watermarks.json")
+    snapshot_path = tmp_path / "orders.parquet"
+
+    def read():
+        return connector.sql_to_df_incremental(
+            "SELECT id, amount FROM orders",
+            "id",
+            key_columns=["id"],
+            snapshot_path=snapshot_path,
+            watermark_store=store,
+        )
+
+    assert read()["id"].tolist() == [1, 2]
+    connector.execute_sql_str("UPDATE orders SET amount = 25 WHERE id = 2")
+    connector.execute_sql_str("INSERT INTO orders VALUES (3, 30)")
+
+    df = read()
+    assert df.values.tolist() == [[1, 10], [2, 25], [3, 30]]
+    assert df.attrs["sqlconnect_new_rows"] == 2
+    assert pd.read_parquet(snapshot_path).values.tolist() == df.values.tolist()
+
+    snapshot_path.unlink()
+    assert read()["id"].tolist() == [1, 2, 3]
+
+
+def test_sql_to_df_incremental_chunksize(connector, tmp_path):
+    with pytest.raises(ValueError):
+        connector.sql_to_df_incremental("SELECT * FROM orders", "id", chunksize=1)
@@ -0,0 +1,77 @@
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def connector(sqlite_connector):
+    connector = sqlite_connector(instrument=True)
+    yield connector
+    connector.close()
+
+
+def test_phases_recorded(connector):
+    connector.execute_sql_str("CREATE TABLE numbers (n INTEGER)")
+    connector.df_to_sql(
+        pd.DataFrame({"n": range(100)}), "numbers", if_exists="append", index=False
+    )
+    df = connector.sql_to_df_str("SELECT n FROM numbers")
+
+    operations = connector.stats()["operations"]
+    assert set(operations) == {"execute_sql_str", "df_to_sql", "sql_to_df_str"}
+
+    read = operations["sql_to_df_str"]
+    assert read["calls"] == 1 and read["errors"] == 0
+    assert read["rows"] == 100
+    assert read["bytes"] == df.memory_usage(deep=False).sum()
+    assert read["execute"] > 0
+    assert read["elapsed"] == pytest.approx(
+        read["checkout"] + read["execute"] + read["process"]
+    )
+    assert operations["df_to_sql"]["rows"] == 100
+    assert "capacity" in connector.stats()["pool"]
+
+
+def test_callbacks_and_errors(connector):
+    calls = []
+    connector.instrumentation.add_callback(calls.append)
+    connector.instrumentation.add_callback(lambda metrics: 1 / 0)  # Logged, not raised
+
+    connector.sql_to_df_str("SELECT :n AS n", params={"n": 1})
+    with pytest.raises(RuntimeError):
+        connector.sql_to_df_str("SELECT * FROM missing")
+
+    assert [(m.operation, m.rows, m.error is None) for m in calls] == [
+        ("sql_to_df_str", 1, True),
+        ("sql_to_df_str", None, False),
+    ]
+    assert calls[0].params == {"n": 1}
+    assert calls[0].statements == 1
+    assert connector.stats()["operations"]["sql_to_df_str"]["errors"] == 1
+
+    connector.instrumentation.reset()
+    assert connector.stats()["operations"] == {}
+
+
+def test_disabled_registers_nothing(sqlite_connector):
+    connector = sqlite_connector(share_engine=False)
+
+    assert connector.instrumentation is None
+    assert not connector.engine.dispatch.before_cursor_execute
+    connector.sql_to_df_str("SELECT 1 AS n")
+    assert connector.stats() == {}
+
+
+def test_shared_engine_counts_own_calls(sqlite_connector):
+    first = sqlite_connector(instrument=True)
+    second = sqlite_connector(instrument=True)
+    assert first.engine is second.engine
+
+    first.sql_to_df_str("SELECT 1 AS n")
+    second.execute_sql_str("CREATE TABLE t (n INTEGER)")
+
+    assert set(first.stats()["operations"]) == {"sql_to_df_str"}
+    assert set(second.stats()["operations"]) == {"execute_sql_str"}
+
+    second.close()
+    first.close()
+    assert not first.engine.dispatch.before_cursor_execute
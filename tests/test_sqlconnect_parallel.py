@@ -0,0 +1,137 @@
+import datetime
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import mssql
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
+from sqlconnect.parallel import (
+    QueryBatchError,
+    partition_predicates,
+    pool_capacity,
+    render_literal,
+)
+
+
+@pytest.mark.parametrize(
+    "pool_options, expected",
+    [
+        ({"poolclass": QueuePool, "pool_size": 4, "max_overflow": 2}, 6),
+        ({"poolclass": QueuePool, "pool_size": 4, "max_overflow": -1}, None),
+        ({"poolclass": NullPool}, None),
+        ({"poolclass": StaticPool}, 1),
+    ],
+)
+def test_pool_capacity(pool_options, expected):
+    assert pool_capacity(create_engine("sqlite://", **pool_options)) == expected
+
+
+@pytest.fixture
+def connector(sqlite_connector):
+    # Sqlconnector for a temporary SQLite database holding a small table
+    connector = sqlite_connector()
+    connector.execute_sql_str("CREATE TABLE numbers (n INTEGER)")
+    connector.execute_sql_str("INSERT INTO numbers VALUES (1), (2), (3)")
+    return connector
+
+
+def test_sql_to_dfs(connector, tmp_path):
+    query_path = tmp_path / "total.sql"
+    query_path.write_text("SELECT SUM(n) AS total FROM numbers")
+
+    dfs = connector.sql_to_dfs(
+        {"count": "SELECT COUNT(*) AS n FROM numbers", "total": str(query_path)}
+    )
+
+    assert list(dfs) == ["count", "total"]
+    assert dfs["count"]["n"].tolist() == [3]
+    assert dfs["total"]["total"].tolist() == [6]
+    assert dfs["total"].attrs["sqlconnect_elapsed"] >= 0
+
+
+def test_sql_to_dfs_errors_do_not_cancel(connector):
+    queries = ["SELECT * FROM missing_table", "SELECT n FROM numbers"]
+
+    with pytest.raises(QueryBatchError) as excinfo:
+        connector.sql_to_dfs(queries, max_workers=1)
+
+    assert list(excinfo.value.results) == ["SELECT n FROM numbers"]
+    assert list(excinfo.value.errors) == ["SELECT * FROM missing_table"]
+
+
+def test_sql_to_dfs_as_completed(connector):
+    results = connector.sql_to_dfs(
+        ["SELECT 1 AS n", "SELECT * FROM missing_table"], as_completed=True
+    )
+
+    errors = {result.key: result.error is not None for result in results}
+    assert errors == {"SELECT 1 AS n": False, "SELECT * FROM missing_table": True}
+
+
+def test_sql_to_dfs_invalid_queries(connector):
+    with pytest.raises(TypeError):
+        connector.sql_to_dfs("SELECT 1")
+
+
+def test_partition_predicates():
+    assert partition_predicates("id", 0, 30, 3) == [
+        "id < 10 OR id IS NULL",
+        "id >= 10 AND id < 20",
+        "id >= 20",
+    ]
+    assert partition_predicates("id", 0, 2, 5) == ["id < 1 OR id IS NULL", "id >= 1"]
+    assert partition_predicates("id", 5, 5, 4) == ["1 = 1"]
+
+
+def test_partition_predicates_datetime_mssql():
+    # SQL Server rejects plain strings with microseconds for DATETIME columns, so bounds are converted
+    dialect = mssql.dialect()
+    predicates = partition_predicates(
+        "[created]",
+        datetime.datetime(2024, 1, 1),
+        datetime.datetime(2024, 1, 1, 0, 0, 1),
+        3,
+        lambda value: render_literal(value, dialect),
+    )
+    assert predicates[0] == (
+        "[created] < CONVERT(datetime2, '2024-01-01T00:00:00.333333', 126) "
+        "OR [created] IS NULL"
+    )
+    assert render_literal(datetime.date(2024, 1, 31), dialect) == (
+        "CONVERT(date, '2024-01-31', 23)"
+    )
+    assert render_literal(10, dialect) == "10"
+
+
+def test_partition_predicates_invalid():
+    with pytest.raises(ValueError):
+        partition_predicates("id", 0, 10, 0)
+    with pytest.raises(ValueError):
+        partition_predicates("id", 10, 0, 2)
+
+
+def test_sql_to_df_partitioned(connector):
+    connector.execute_sql_str("INSERT INTO numbers VALUES (NULL), (-5), (50)")
+
+    df = connector.sql_to_df_partitioned(
+        "SELECT n FROM numbers;",
+        partition_column="n",
+        lower_bound=1,
+        upper_bound=3,
+        num_partitions=2,
+    )
+
+    assert sorted(df["n"].dropna().tolist()) == [-5, 1, 2, 3, 50]
+    assert df["n"].isna().sum() == 1
+    assert df.index.tolist() == list(range(6))
+
+
+def test_sql_to_df_partitioned_predicates(connector):
+    df = connector.sql_to_df_partitioned(
+        "SELECT n FROM numbers", predicates=["n >= 2", "n < 2"]
+    )
+
+    assert df["n"].tolist() == [2, 3, 1]
+
+
+def test_sql_to_df_partitioned_missing_arguments(connector):
+    with pytest.raises(ValueError):
+        connector.sql_to_df_partitioned("SELECT n FROM numbers", partition_column="n")
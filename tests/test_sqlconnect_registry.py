@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy import make_url
+from sqlconnect import registry
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    registry.dispose_all()
+    yield
+    registry.dispose_all()
+
+
+def test_acquire_engine_reuses_engine_for_same_url():
+    engine_one, key_one = registry.acquire_engine(make_url("sqlite://"))
+    engine_two, key_two = registry.acquire_engine(make_url("sqlite://"))
+
+    assert engine_one is engine_two
+    assert key_one == key_two
+
+
+def test_acquire_engine_separates_engine_options():
+    engine_one, _ = registry.acquire_engine(make_url("sqlite://"))
+    engine_two, _ = registry.acquire_engine(make_url("sqlite://"), {"echo": True})
+
+    assert engine_one is not engine_two
+
+
+def test_release_engine_disposes_after_last_reference():
+    engine_one, key = registry.acquire_engine(make_url("sqlite://"))
+    registry.acquire_engine(make_url("sqlite://"))
+
+    registry.release_engine(key, engine_one)
+    assert registry.acquire_engine(make_url("sqlite://"))[0] is engine_one
+
+    registry.release_engine(key, engine_one)
+    registry.release_engine(key, engine_one)
+    assert registry.acquire_engine(make_url("sqlite://"))[0] is not engine_one
+
+
+def test_dispose_all_empties_registry():
+    engine_one, _ = registry.acquire_engine(make_url("sqlite://"))
+    registry.dispose_all()
+
+    assert registry.acquire_engine(make_url("sqlite://"))[0] is not engine_one
+
+
+def test_stale_release_after_dispose_all_is_ignored(sqlite_connector):
+    old = sqlite_connector()
+    registry.dispose_all()
+
+    first = sqlite_connector()
+    old.close()  # Releases the disposed engine, not the one `first` holds
+    second = sqlite_connector()
+
+    assert second.engine is first.engine
+    assert first.sql_to_df_str("SELECT 1 AS n")["n"].tolist() == [1]
+    first.close()
+    second.close()
@@ -0,0 +1,221 @@
+import os
+import time
+import pandas as pd
+import pytest
+from sqlconnect.resultcache import (
+    DiskResultCache,
+    MemoryResultCache,
+    ResultCache,
+    cache_key,
+    normalize_sql,
+)
+
+pytest.importorskip("pyarrow")
+
+
+def test_normalize_sql():
+    assert (
+        normalize_sql("SELECT  a,\n\tb FROM t WHERE c = 'x  y';  ")
+        == "SELECT a, b FROM t WHERE c = 'x  y'"
+    )
+
+
+def test_cache_key():
+    key = cache_key("db", "SELECT 1", {"a": 1, "b": 2}, index_col="a")
+
+    assert key == cache_key("db", "SELECT   1;", {"b": 2, "a": 1}, index_col="a")
+    assert key != cache_key("other", "SELECT 1", {"a": 1, "b": 2}, index_col="a")
+    assert key != cache_key("db", "SELECT 1", {"a": 1, "b": 2})
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "ipc"])
+def test_disk_result_cache_round_trip(tmp_path, file_format):
+    cache = DiskResultCache(tmp_path, file_format=file_format)
+    df = pd.DataFrame({"n": [1, 2]}, index=pd.Index(["a", "b"], name="key"))
+
+    assert cache.get("key") is None
+    cache.put("key", df)
+
+    pd.testing.assert_frame_equal(cache.get("key"), df)
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_disk_result_cache_ttl(tmp_path):
+    cache = DiskResultCache(tmp_path, ttl=60)
+    cache.put("key", pd.DataFrame({"n": [1]}))
+
+    path = tmp_path / "key.parquet"
+    old = time.time() - 120
+    os.utime(path, (old, old))
+
+    assert cache.get("key") is None
+    assert not path.exists()
+
+
+def test_disk_result_cache_evicts_least_recently_used(tmp_path):
+    df = pd.DataFrame({"n": range(100)})
+    cache = DiskResultCache(tmp_path)
+    cache.put("first", df)
+    cache.put("second", df)
+    size = (tmp_path / "first.parquet").stat().st_size
+
+    old = time.time() - 100
+    os.utime(tmp_path / "first.parquet", (old, old))
+    cache.max_bytes = size * 2
+    cache.put("third", df)
+
+    assert cache.get("first") is None
+    assert cache.get("second") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disk_result_cache_invalidate_and_clear(tmp_path):
+    cache = DiskResultCache(tmp_path)
+    cache.put("first", pd.DataFrame({"n": [1]}))
+    cache.put("second", pd.DataFrame({"n": [2]}))
+
+    cache.invalidate("first")
+    assert cache.get("first") is None
+    cache.clear()
+    assert cache.get("second") is None
+
+
+def test_sql_to_df_str_cache(sqlite_connector, tmp_path):
+    connector = sqlite_connector(result_cache=DiskResultCache(tmp_path / "cache"))
+    connector.execute_sql_str("CREATE TABLE numbers (n INTEGER)")
+    connector.execute_sql_str("INSERT INTO numbers VALUES (1)")
+
+    assert connector.sql_to_df_str("SELECT n FROM numbers", cache=True)[
+        "n"
+    ].tolist() == [1]
+    connector.execute_sql_str("INSERT INTO numbers VALUES (2)")
+
+    assert connector.sql_to_df_str("SELECT n FROM numbers", cache=True)[
+        "n"
+    ].tolist() == [1]
+    assert connector.sql_to_df_str("SELECT n FROM numbers", cache="refresh")[
+        "n"
+    ].tolist() == [1, 2]
+    assert connector.sql_to_df_str("SELECT n FROM numbers")["n"].tolist() == [1, 2]
+
+    with pytest.raises(ValueError):
+        connector.sql_to_df_str("SELECT n FROM numbers", cache=True, chunksize=1)
+
+
+def test_invalidate_cache(sqlite_connector, tmp_path):
+    connector = sqlite_connector(result_cache=MemoryResultCache())
+    connector.execute_sql_str("CREATE TABLE numbers (n INTEGER)")
+    connector.execute_sql_str("INSERT INTO numbers VALUES (1), (2)")
+    query_path = tmp_path / "query.sql"
+    query_path.write_text("SELECT n FROM numbers WHERE n >= :low ORDER BY n")
+
+    def read():
+        return {
+            "string": connector.sql_to_df_str(
+                "SELECT n FROM numbers WHERE n >= :low", params={"low": 1}, cache=True
+            ),
+            "file": connector.sql_to_df(
+                str(query_path),
+                params={"low": 1},
+                index_col="n",
+                optimize_memory=True,
+                cache=True,
+            ),
+        }
+
+    read()
+    connector.execute_sql_str("INSERT INTO numbers VALUES (3)")
+    assert len(read()["string"]) == 2
+
+    # Different arguments compute a different key, so nothing is removed
+    connector.invalidate_cache(
+        "SELECT n FROM numbers WHERE n >= :low", params={"low": 2}
+    )
+    connector.invalidate_cache(str(query_path), params={"low": 1})
+    assert [len(df) for df in read().values()] == [2, 2]
+
+    connector.invalidate_cache(
+        "SELECT n FROM numbers WHERE n >= :low", params={"low": 1}
+    )
+    connector.invalidate_cache(
+        str(query_path), params={"low": 1}, index_col="n", optimize_memory=True
+    )
+    assert [len(df) for df in read().values()] == [3, 3]
+    assert connector.cache_stats()["entries"] == 2
+
+    with pytest.raises(TypeError):
+        connector.invalidate_cache("SELECT 1", chunksize=10)
+    with pytest.raises(ValueError):
+        sqlite_connector().invalidate_cache("SELECT 1")
+
+
+def test_memory_result_cache_returns_copies():
+    df = pd.DataFrame({"n": [1, 2, 3]})
+    cache = MemoryResultCache()
+    cache.put("key", df)
+    df.loc[0, "n"] = 100
+
+    cached = cache.get("key")
+    cached.loc[1, "n"] = 200
+    assert cache.get("key")["n"].tolist() == [1, 2, 3]
+    assert cache.get("missing") is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+    assert stats["bytes"] == df.memory_usage(deep=True).sum()
+
+
+def test_memory_result_cache_evicts_least_recently_used():
+    df = pd.DataFrame({"n": range(100)})
+    size = df.memory_usage(deep=True).sum()
+    cache = MemoryResultCache(max_bytes=size * 2)
+    cache.put("first", df)
+    cache.put("second", df)
+    cache.get("first")
+    cache.put("third", df)
+
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == size * 2
+
+    cache.put("large", pd.DataFrame({"n": range(1000)}))
+    assert cache.get("large") is None
+
+
+def test_memory_result_cache_oversized_put_replaces_entry():
+    small = pd.DataFrame({"n": range(10)})
+    cache = MemoryResultCache(max_bytes=int(small.memory_usage(deep=True).sum()))
+    cache.put("key", small)
+
+    cache.put("key", pd.DataFrame({"n": range(1000)}))
+    assert cache.get("key") is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_memory_result_cache_ttl(monkeypatch):
+    now = time.monotonic()
+    cache = MemoryResultCache(ttl=10)
+    cache.put("key", pd.DataFrame({"n": [1]}))
+    monkeypatch.setattr(time, "monotonic", lambda: now + 20)
+
+    assert cache.get("key") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_cache_stats(sqlite_connector):
+    connector = sqlite_connector(result_cache=MemoryResultCache())
+    connector.sql_to_df_str("SELECT 1 AS n", cache=True)
+    connector.sql_to_df_str("SELECT 1 AS n", cache=True)
+
+    stats = connector.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_result_cache_requires_methods():
+    class Incomplete(ResultCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,105 @@
+import logging
+
+import pytest
+from sqlconnect.slowlog import explain_statements, fingerprint
+
+
+def test_fingerprint_ignores_literals_and_whitespace():
+    assert fingerprint("SELECT * FROM t WHERE id = 1 AND name = 'a'") == fingerprint(
+        "SELECT *\n  FROM t WHERE id = 42 AND name = 'b c';"
+    )
+    assert fingerprint("SELECT * FROM t") != fingerprint("SELECT * FROM u")
+
+
+@pytest.mark.parametrize(
+    "dialect, first",
+    [
+        ("sqlite", "EXPLAIN QUERY PLAN SELECT 1"),
+        ("postgresql", "EXPLAIN SELECT 1"),
+        ("mysql", "EXPLAIN SELECT 1"),
+        ("mssql", "SET SHOWPLAN_XML ON"),
+        ("oracle", "EXPLAIN PLAN FOR SELECT 1"),
+    ],
+)
+def test_explain_statements(dialect, first):
+    assert explain_statements(dialect, "SELECT 1;")[0][0] == first
+
+
+def test_explain_statements_unsupported():
+    with pytest.raises(ValueError):
+        explain_statements("firebird", "SELECT 1")
+
+
+def test_slow_query_logged_with_plan(sqlite_connector, caplog):
+    connector = sqlite_connector(
+        config={"slow_query": {"threshold": 1e-9, "explain": True}}, share_engine=False
+    )
+    connector.execute_sql_str("CREATE TABLE numbers (n INTEGER PRIMARY KEY)")
+
+    with caplog.at_level(logging.WARNING, logger="sqlconnect.slowlog"):
+        connector.sql_to_df_str(
+            "SELECT n FROM numbers WHERE n > :low", params={"low": 1}
+        )
+        connector.slow_query_log.wait(5)
+
+    messages = [record.getMessage() for record in caplog.records]
+    key = fingerprint("SELECT n FROM numbers WHERE n > :low")
+    assert any(m.startswith("Slow execute_sql_str") for m in messages)
+    assert any(
+        m.startswith("Slow sql_to_df_str")
+        and f"fingerprint={key}" in m
+        and "{'low': 1}" in m
+        for m in messages
+    )
+    assert any(f"Plan for fingerprint={key}" in m and "numbers" in m for m in messages)
+    connector.close()
+
+
+def test_fast_queries_not_logged(sqlite_connector, caplog):
+    connector = sqlite_connector(
+        config={"slow_query": {"threshold": 60}}, share_engine=False
+    )
+
+    with caplog.at_level(logging.WARNING, logger="sqlconnect.slowlog"):
+        connector.sql_to_df_str("SELECT 1 AS n")
+
+    assert not caplog.records
+    assert connector.stats()["operations"]["sql_to_df_str"]["calls"] == 1
+    connector.close()
+
+
+def test_failed_plan_discards_connection(sqlite_connector, caplog):
+    from sqlalchemy import event
+    from sqlconnect.metrics import CallMetrics
+
+    connector = sqlite_connector(
+        config={"slow_query": {"threshold": 1e-9, "explain": True}}, share_engine=False
+    )
+    invalidated = []
+    event.listen(
+        connector.engine.pool, "invalidate", lambda *args: invalidated.append(1)
+    )
+
+    metrics = CallMetrics(
+        "sql_to_df_str",
+        "SELECT * FROM missing",
+        1.0,
+        0,
+        1.0,
+        0,
+        None,
+        None,
+        None,
+        None,
+        1,
+        None,
+        "OperationalError: no such table: missing",
+    )
+    with caplog.at_level(logging.WARNING, logger="sqlconnect.slowlog"):
+        connector.slow_query_log(metrics)
+        connector.slow_query_log.wait(5)
+
+    assert invalidated == [1]
+    assert any("Could not capture the plan" in r.getMessage() for r in caplog.records)
+    assert connector.engine.pool.checkedout() == 0
+    connector.close()
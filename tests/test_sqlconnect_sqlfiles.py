@@ -0,0 +1,58 @@
+import pytest
+from sqlconnect.sqlfiles import SqlFileCache
+
+
+@pytest.fixture
+def sql_file(tmp_path):
+    # Create a temporary .sql file for testing
+    sql_file = tmp_path / "query.sql"
+    sql_file.write_text("SELECT 1 AS n")
+    return sql_file
+
+
+def test_load_caches_file(sql_file):
+    cache = SqlFileCache()
+    first = cache.load(str(sql_file))
+
+    assert first.text == "SELECT 1 AS n"
+    assert str(first.clause) == "SELECT 1 AS n"
+    assert cache.load(sql_file) is first
+    assert cache.cache_info()[:4] == (1, 1, 0, 1)
+
+
+def test_load_reloads_changed_file(sql_file):
+    cache = SqlFileCache()
+    cache.load(sql_file)
+    sql_file.write_text("SELECT 2 AS number")
+
+    assert cache.load(sql_file).text == "SELECT 2 AS number"
+    assert cache.cache_info().misses == 2
+
+
+def test_load_evicts_least_recently_used(tmp_path):
+    cache = SqlFileCache(maxsize=2)
+    paths = [tmp_path / f"query_{i}.sql" for i in range(3)]
+    for i, path in enumerate(paths):
+        path.write_text(f"SELECT {i}")
+
+    cache.load(paths[0])
+    cache.load(paths[1])
+    cache.load(paths[0])
+    cache.load(paths[2])  # Evicts query_1.sql
+
+    assert cache.cache_info().evictions == 1
+    cache.load(paths[0])
+    assert cache.cache_info().hits == 2
+
+
+def test_load_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        SqlFileCache().load(tmp_path / "missing.sql")
+
+
+def test_cache_clear(sql_file):
+    cache = SqlFileCache()
+    cache.load(sql_file)
+    cache.cache_clear()
+
+    assert cache.cache_info() == (0, 0, 0, 0, 128)
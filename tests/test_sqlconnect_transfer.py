@@ -0,0 +1,86 @@
+import pandas as pd
+import pytest
+from sqlconnect.transfer import TransferError, run_pipeline
+
+
+@pytest.fixture
+def source(sqlite_connector):
+    connector = sqlite_connector("source.db")
+    connector.execute_sql_str("CREATE TABLE numbers (n INTEGER)")
+    connector.execute_many("INSERT INTO numbers VALUES (?)", ((n,) for n in range(10)))
+    return connector
+
+
+def test_run_pipeline_progress():
+    chunks = [pd.DataFrame({"n": [i, i]}) for i in range(5)]
+    written, reports = [], []
+
+    result = run_pipeline(
+        iter(chunks),
+        lambda chunk, number: written.append(number),
+        queue_size=1,
+        progress=reports.append,
+        start_chunk=2,
+    )
+
+    assert written == [2, 3, 4]
+    assert [(report.chunks, report.rows) for report in reports] == [
+        (3, 2),
+        (4, 4),
+        (5, 6),
+    ]
+    assert (result.chunks, result.rows) == (5, 6)
+
+
+def test_run_pipeline_reader_error():
+    def chunks():
+        yield pd.DataFrame({"n": [1]})
+        raise ValueError("connection lost")
+
+    with pytest.raises(TransferError, match="connection lost") as info:
+        run_pipeline(chunks(), lambda chunk, number: None)
+    assert info.value.chunks_completed == 1
+
+
+def test_transfer(source, sqlite_connector):
+    target = sqlite_connector("target.db")
+    reports = []
+
+    result = source.transfer(
+        "SELECT n FROM numbers ORDER BY n",
+        target,
+        "copied",
+        chunksize=3,
+        progress=reports.append,
+    )
+
+    assert (result.chunks, result.rows) == (4, 10)
+    assert len(reports) == 4
+    df = target.sql_to_df_str("SELECT n FROM copied ORDER BY n")
+    assert df["n"].tolist() == list(range(10))
+    assert source.engine.pool.checkedout() == 0
+
+
+def test_transfer_resume(source, sqlite_connector):
+    target = sqlite_connector("target.db")
+    target.execute_sql_str("CREATE TABLE copied (n INTEGER CHECK (n < 5))")
+
+    with pytest.raises(TransferError) as info:
+        source.transfer(
+            "SELECT n FROM numbers ORDER BY n", target, "copied", chunksize=2
+        )
+    assert info.value.chunks_completed == 2
+    assert source.engine.pool.checkedout() == 0
+
+    target.execute_sql_str("DROP TABLE copied")
+    target.execute_sql_str("CREATE TABLE copied (n INTEGER)")
+    target.execute_sql_str("INSERT INTO copied VALUES (0), (1), (2), (3)")
+    source.transfer(
+        "SELECT n FROM numbers ORDER BY n",
+        target,
+        "copied",
+        chunksize=2,
+        start_chunk=info.value.chunks_completed,
+    )
+    df = target.sql_to_df_str("SELECT n FROM copied ORDER BY n")
+    assert df["n"].tolist() == list(range(10))
@@ -0,0 +1,97 @@
+import pandas as pd
+import pytest
+from sqlalchemy import Table
+from sqlalchemy.dialects import mssql, mysql, oracle, postgresql, sqlite
+from sqlconnect.upsert import staging_table_name, upsert_statement
+
+
+def test_upsert_statement_on_conflict():
+    statement = upsert_statement(
+        postgresql.dialect(), "orders", "staging", ["id", "amount"], ["id"]
+    )
+    assert statement == (
+        "INSERT INTO orders (id, amount) SELECT id, amount FROM staging "
+        "ON CONFLICT (id) DO UPDATE SET amount = excluded.amount"
+    )
+
+    statement = upsert_statement(sqlite.dialect(), "orders", "staging", ["id"], ["id"])
+    assert statement.endswith("FROM staging WHERE true ON CONFLICT (id) DO NOTHING")
+
+
+def test_upsert_statement_on_duplicate_key():
+    statement = upsert_statement(
+        mysql.dialect(), "orders", "staging", ["id", "amount"], ["id"]
+    )
+    assert statement == (
+        "INSERT INTO orders (id, amount) SELECT s.id, s.amount FROM staging s "
+        "ON DUPLICATE KEY UPDATE amount = s.amount"
+    )
+
+
+def test_upsert_statement_merge():
+    statement = upsert_statement(
+        mssql.dialect(), "orders", "staging", ["id", "amount"], ["id"]
+    )
+    assert statement == (
+        "MERGE INTO orders AS t USING staging AS s ON (t.id = s.id) "
+        "WHEN MATCHED THEN UPDATE SET t.amount = s.amount "
+        "WHEN NOT MATCHED THEN INSERT (id, amount) VALUES (s.id, s.amount);"
+    )
+
+    statement = upsert_statement(oracle.dialect(), "orders", "staging", ["id"], ["id"])
+    assert statement == (
+        "MERGE INTO orders t USING staging s ON (t.id = s.id) "
+        "WHEN NOT MATCHED THEN INSERT (id) VALUES (s.id)"
+    )
+
+
+def test_upsert_statement_quotes_columns():
+    statement = upsert_statement(
+        postgresql.dialect(), "orders", "staging", ["id", "Order Total"], ["id"]
+    )
+    assert '"Order Total" = excluded."Order Total"' in statement
+
+
+def test_staging_table_name():
+    assert staging_table_name() != staging_table_name()
+    assert len(staging_table_name()) <= 30
+
+
+def test_df_upsert(sqlite_connector):
+    connector = sqlite_connector()
+    connector.execute_sql_str(
+        "CREATE TABLE orders (id INTEGER PRIMARY KEY, amount INTEGER)"
+    )
+    connector.execute_sql_str("INSERT INTO orders VALUES (1, 10), (2, 20)")
+
+    df = pd.DataFrame({"id": [2, 3], "amount": [25, 30]})
+    assert connector.df_upsert(df, "orders", keys=["id"]) == 2
+
+    result = connector.sql_to_df_str("SELECT id, amount FROM orders ORDER BY id")
+    assert result.values.tolist() == [[1, 10], [2, 25], [3, 30]]
+    tables = connector.sql_to_df_str("SELECT name FROM sqlite_master")
+    assert tables["name"].tolist() == ["orders"]
+
+    with pytest.raises(RuntimeError):
+        connector.df_upsert(df.rename(columns={"amount": "missing"}), "orders", ["id"])
+    assert connector.sql_to_df_str("SELECT name FROM sqlite_master")[
+        "name"
+    ].tolist() == ["orders"]
+
+    with pytest.raises(ValueError):
+        connector.df_upsert(df, "orders", keys=["order_id"])
+
+
+def test_df_upsert_failed_drop_keeps_merge_error(sqlite_connector, monkeypatch, caplog):
+    connector = sqlite_connector()
+    connector.execute_sql_str("CREATE TABLE orders (id INTEGER PRIMARY KEY)")
+
+    # As on PostgreSQL inside a session, where the failed merge aborts the transaction the drop runs in
+    def drop(*args, **kwargs):
+        raise RuntimeError("current transaction is aborted")
+
+    monkeypatch.setattr(Table, "drop", drop)
+    df = pd.DataFrame({"id": [1], "missing": [2]})
+    with pytest.raises(RuntimeError, match="missing"):
+        connector.df_upsert(df, "orders", keys=["id"])
+    assert "Could not drop staging table" in caplog.text